@@ -0,0 +1,78 @@
+"""
+Exact vs approximate (`fast_math.approximate`) batch conversion.
+
+Prints the time of both paths, the speedup and the largest difference observed, in dB, for
+conversions in both directions between dB and linear units.
+
+Usage:
+    python benchmarks/bench_approximate.py [--points 2000000] [--repeat 7]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from UnitConverter.eirp_converter import EIRP, EIRPConverter  # noqa: E402
+from UnitConverter.fast_math import MAX_ERROR_DB, approximate  # noqa: E402
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter  # noqa: E402
+
+# (converter, from_unit, to_unit, context, dB factor of the target for error reporting)
+CONVERSIONS = [
+    (FieldStrengthConverter(), FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M, {}, 20),
+    (FieldStrengthConverter(), FSUNIT.DBUV_PER_M, FSUNIT.W_PER_M_SQ, {}, 10),
+    (FieldStrengthConverter(), FSUNIT.V_PER_M, FSUNIT.DBUV_PER_M, {}, None),
+    (EIRPConverter(), EIRP.EIRP_dBm, EIRP.EIRP_mW, {}, 10),
+    (EIRPConverter(), EIRP.EIRP_mW, EIRP.EIRP_dBm, {}, None),
+]
+
+
+def best_time(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--points", type=int, default=2_000_000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"NumPy {np.__version__}, {args.points:,} points, declared max error {MAX_ERROR_DB} dB\n")
+    print(f"{'conversion':<28} {'exact ms':>9} {'approx ms':>10} {'speedup':>8} {'max err dB':>11}")
+
+    levels = np.random.default_rng(0).uniform(-20.0, 140.0, args.points)
+    for converter, from_unit, to_unit, context, factor in CONVERSIONS:
+        if from_unit in (FSUNIT.V_PER_M, EIRP.EIRP_mW):
+            values = 10 ** (levels / 20) / 1e6
+        else:
+            values = levels
+        plan = converter.plan(from_unit, to_unit, **context)
+        out = np.empty_like(values)
+
+        exact_time = best_time(lambda: plan(values, out=out), args.repeat)
+        exact = plan(values)
+        with approximate():
+            approx_time = best_time(lambda: plan(values, out=out), args.repeat)
+            approx = plan(values)
+
+        if factor is None:
+            error = np.max(np.abs(approx - exact))
+        else:
+            error = np.max(np.abs(factor * np.log10(approx / exact)))
+        name = f"{from_unit.value} -> {to_unit.value}"
+        print(f"{name:<28} {exact_time * 1e3:>9.2f} {approx_time * 1e3:>10.2f} "
+              f"{exact_time / approx_time:>8.2f} {error:>11.2e}")
+
+
+if __name__ == "__main__":
+    main()
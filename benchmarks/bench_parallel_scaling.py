@@ -0,0 +1,73 @@
+"""
+Thread scaling of the batch conversion path.
+
+Converts one large array with `ConversionPlan.parallel` on 1 to N threads and prints the time and the
+speedup over a single thread for a log conversion (dBμV/m -> V/m), a power conversion
+(dBμV/m -> W/m²) and a pure dB offset (dBμV/m -> dBpT).
+
+Usage:
+    python benchmarks/bench_parallel_scaling.py [--points 20000000] [--max-threads 8] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter  # noqa: E402
+
+CONVERSIONS = [
+    (FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M),
+    (FSUNIT.DBUV_PER_M, FSUNIT.W_PER_M_SQ),
+    (FSUNIT.DBUV_PER_M, FSUNIT.DBPT),
+]
+
+
+def best_time(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--points", type=int, default=20_000_000)
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, NumPy {np.__version__}, GIL {'on' if gil else 'off'}, "
+          f"{os.cpu_count()} CPUs, {args.points:,} points")
+
+    values = np.random.default_rng(0).uniform(0.0, 120.0, args.points)
+    out = np.empty_like(values)
+    threads = [1]
+    while threads[-1] * 2 <= args.max_threads:
+        threads.append(threads[-1] * 2)
+    if threads[-1] != args.max_threads:
+        threads.append(args.max_threads)
+
+    converter = FieldStrengthConverter()
+    for from_unit, to_unit in CONVERSIONS:
+        plan = converter.plan(from_unit, to_unit)
+        print(f"\n{from_unit.value} -> {to_unit.value}")
+        print(f"{'threads':>8} {'time (ms)':>10} {'Mpts/s':>8} {'speedup':>8}")
+        single = None
+        for workers in threads:
+            elapsed = best_time(lambda: plan.parallel(values, out=out, workers=workers), args.repeat)
+            single = single or elapsed
+            print(f"{workers:>8} {elapsed * 1e3:>10.1f} {args.points / elapsed / 1e6:>8.1f} "
+                  f"{single / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
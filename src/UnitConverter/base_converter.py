@@ -1,7 +1,15 @@
+import contextvars
 import inspect
+import numbers
+import os
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
 from enum import Enum
-from typing import Callable, Any
+from typing import Callable, Any, NamedTuple, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
 
 
 class UnitEnum(Enum):
@@ -10,6 +18,369 @@ class UnitEnum(Enum):
     pass
 
 
+_FLOAT_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+# Reasons a value is marked invalid by `ConversionPlan.validated`, in the order they are checked
+INVALID_REASONS = ("non_numeric", "nan", "inf", "out_of_range")
+
+_is_number = np.frompyfunc(lambda value: isinstance(value, numbers.Real), 1, 1)
+
+# Plans shared by all converter instances, keyed by (converter class, from_unit, to_unit, kwargs)
+_PLAN_CACHE_SIZE = 256
+_plan_cache: dict[tuple, "ConversionPlan"] = {}
+_plan_lock = threading.Lock()
+
+
+class ValidatedArray(NamedTuple):
+    """
+    Result of a conversion that marks invalid values instead of raising.
+
+    Attributes:
+        values (np.ndarray): The converted values, NaN where invalid.
+        valid (np.ndarray): Boolean mask, True where the value converted to a finite number.
+        counts (dict[str, int]): Number of invalid values per reason in `INVALID_REASONS`: not a number
+            at all, NaN or infinite input, or a finite input whose result is not finite (e.g. a
+            linear unit <= 0 going into a log conversion, or an overflow).
+    """
+
+    values: np.ndarray
+    valid: np.ndarray
+    counts: dict[str, int]
+
+
+def _as_numeric(values: ArrayLike) -> tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    `values` as a float array, and a mask of the entries that were numbers at all.
+
+    Numeric arrays are passed through with a mask of None. In object arrays (e.g. parsed cells) every
+    entry is checked with `isinstance`, in other arrays (strings, dates) no entry is a number; the
+    non-numbers become NaN. No exception is raised for any entry.
+    """
+    array = np.asarray(values)
+    if array.dtype in _FLOAT_DTYPES:
+        return array, None
+    if array.dtype.kind in "biuf":
+        return array.astype(np.float64), None
+
+    if array.dtype.kind == "O":
+        numeric = _is_number(array).astype(bool)
+    else:
+        numeric = np.zeros(array.shape, dtype=bool)
+    result = np.full(array.shape, np.nan)
+    result[numeric] = array[numeric].astype(np.float64)
+    return result, numeric
+
+
+class ConversionPlan:
+    """
+    A conversion between two units, resolved once and applied to any number of arrays.
+
+    A plan holds the (at most two) conversion functions on the path `from_unit -> base unit -> to_unit`
+    together with the keyword arguments they are called with. Creating it performs the unit checks and
+    the dictionary lookups; applying it only runs the vectorized conversion functions.
+
+    Memory:
+        Results can be written into a caller-supplied buffer with `out=`, including the input array
+        itself for in-place conversion. Conversions between units that differ by a constant dB offset
+        (e.g. dBμV/m, dBμA/m and dBpT) are applied as a single ``numpy.add(values, offset, out=out)``
+        and create no temporary arrays at all (`is_offset`). All other conversions are evaluated in
+        blocks of `chunk_size` elements, so their temporaries are bounded by the block size instead
+        of growing with the array.
+
+    Precision:
+        `dtype=numpy.float32` halves the memory of the output. float32 has a 24-bit mantissa, so a
+        level is stored with a relative error of about 6e-8, i.e. below 0.00002 dB for levels under
+        256 dB. Through the log/pow conversions that corresponds to a relative error of up to about
+        3e-6 for linear units (V/m, mW, W/m², ...).
+
+    Threads:
+        A plan holds no mutable state; applying it only touches the arrays passed in and temporaries
+        local to the call. One plan can therefore be used from any number of threads at once, as long
+        as they write to different `out` buffers. `parallel` uses this to split one large array across
+        a thread pool.
+
+    Per-point parameters:
+        Keyword arguments may be arrays of the same shape as the values, e.g. a slope per frequency
+        point. They are sliced along with the values for every block, so each point is converted with
+        its own parameter. Lists and tuples are converted to arrays when the plan is built.
+
+    Plans are created with `BaseConverter.plan` rather than instantiated directly.
+
+    Attributes:
+        from_unit (UnitEnum): The unit of the input values.
+        to_unit (UnitEnum): The unit of the output values.
+        kwargs (dict): Keyword arguments passed to the conversion functions.
+        offset (float | None): The dB offset applied by a pure offset conversion, else None.
+        chunk_size (int): Block size in elements for conversions that are not pure offsets.
+        parallel_min_size (int): Arrays smaller than this are converted on the calling thread by
+            `parallel`, as splitting them costs more than it saves.
+    """
+
+    chunk_size = 1 << 16
+    parallel_min_size = 1 << 18
+
+    def __init__(
+        self,
+        from_unit: UnitEnum,
+        to_unit: UnitEnum,
+        steps: list[Callable[..., Any]],
+        kwargs: dict[str, Any],
+        offset: Optional[float] = None,
+    ):
+        self.from_unit = from_unit
+        self.to_unit = to_unit
+        self.kwargs = kwargs
+        self.offset = offset
+        self._steps = steps
+
+    @property
+    def is_identity(self) -> bool:
+        """True if the plan leaves values unchanged (source and target unit are the same)."""
+        return self.from_unit == self.to_unit
+
+    @property
+    def is_offset(self) -> bool:
+        """True if the plan only adds a constant, which is done without temporary arrays."""
+        return self.offset is not None
+
+    def __call__(
+        self,
+        values: ArrayLike,
+        out: Optional[np.ndarray] = None,
+        dtype: Optional[DTypeLike] = None,
+    ) -> np.ndarray:
+        """
+        Apply the conversion to `values`.
+
+        Args:
+            values (ArrayLike): The values to convert.
+            out (np.ndarray, optional): float32 or float64 array of the same shape to write the result to.
+                Pass `values` itself to convert in place.
+            dtype (DTypeLike, optional): float32 or float64, the result type when `out` is not given.
+                Defaults to float64.
+
+        Returns:
+            np.ndarray: `out` if given, otherwise a new array with the converted values.
+
+        Raises:
+            TypeError: If `out` or `dtype` is not float32/float64.
+            ValueError: If `out` or an array keyword argument does not have the shape of `values`.
+        """
+        values, out = self._prepare(values, out, dtype)
+        if self.is_offset:
+            if self.offset or out is not values:
+                np.add(values, self.offset, out=out)
+            return out
+
+        if not (values.flags.c_contiguous and out.flags.c_contiguous):
+            out[...] = self._apply(values.astype(out.dtype, copy=False), self.kwargs)
+            return out
+
+        self._run(values.reshape(-1), out.reshape(-1), self._flat_kwargs())
+        return out
+
+    def parallel(
+        self,
+        values: ArrayLike,
+        out: Optional[np.ndarray] = None,
+        dtype: Optional[DTypeLike] = None,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> np.ndarray:
+        """
+        Apply the conversion to `values`, split across a pool of threads.
+
+        The array is cut into one contiguous block per worker and every block is converted straight
+        into its slice of `out`. NumPy releases the GIL inside the log/pow/add loops, so the blocks run
+        in parallel even on a regular CPython build; on a free-threaded build the Python glue between
+        the loops runs in parallel as well. Results are identical to `__call__`.
+
+        Args:
+            values (ArrayLike): The values to convert.
+            out (np.ndarray, optional): float32 or float64 array of the same shape to write the result to.
+            dtype (DTypeLike, optional): float32 or float64, the result type when `out` is not given.
+            workers (int, optional): Number of blocks / threads. Defaults to the number of CPUs.
+            executor (Executor, optional): Thread pool to run the blocks on, e.g. one kept for the
+                lifetime of the application. Defaults to a pool created for this call.
+
+        Returns:
+            np.ndarray: `out` if given, otherwise a new array with the converted values.
+
+        Raises:
+            TypeError: If `out` or `dtype` is not float32/float64.
+            ValueError: If `out` or an array keyword argument does not have the shape of `values`, or
+                `workers` is not positive.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 0:
+            raise ValueError("workers must be a positive number.")
+
+        values, out = self._prepare(values, out, dtype)
+        contiguous = values.flags.c_contiguous and out.flags.c_contiguous
+        if (
+            workers == 1
+            or values.size < self.parallel_min_size
+            or not contiguous
+            or (self.is_offset and not self.offset)
+        ):
+            return self(values, out=out)
+
+        flat_values = values.reshape(-1)
+        flat_out = out.reshape(-1)
+        kwargs = self._flat_kwargs()
+        # Whole chunks per block, so every worker runs the same block loop as __call__
+        chunks = -(-flat_values.size // self.chunk_size)
+        block = -(-chunks // workers) * self.chunk_size
+        starts = range(0, flat_values.size, block)
+
+        def run(start: int) -> None:
+            stop = start + block
+            self._run(
+                flat_values[start:stop], flat_out[start:stop], _slice_kwargs(kwargs, start, stop)
+            )
+
+        # Workers see the caller's context variables, e.g. fast_math.approximate()
+        def submit(pool: Executor, start: int):
+            return pool.submit(contextvars.copy_context().run, run, start)
+
+        if executor is not None:
+            for future in [submit(executor, start) for start in starts]:
+                future.result()
+        else:
+            with ThreadPoolExecutor(max_workers=len(starts)) as pool:
+                for future in [submit(pool, start) for start in starts]:
+                    future.result()
+        return out
+
+    def validated(
+        self,
+        values: ArrayLike,
+        out: Optional[np.ndarray] = None,
+        dtype: Optional[DTypeLike] = None,
+    ) -> ValidatedArray:
+        """
+        Apply the conversion and report invalid values in a mask instead of raising.
+
+        A value is valid if it converts to a finite number. Everything else becomes NaN in the
+        result and is counted under the first matching reason of `INVALID_REASONS`. The check is
+        vectorized: the conversion runs once over the whole array with floating point errors
+        silenced, and the reasons are derived from the input and output arrays afterwards, so a
+        single bad sample costs neither an exception nor a per-element fallback. Only object arrays
+        are inspected element by element, to find the entries that are numbers.
+
+        Example:
+            >>> plan = FieldStrengthConverter().plan(FSUNIT.UV_PER_M, FSUNIT.DBUV_PER_M)
+            >>> result = plan.validated([1000.0, -5.0, None, float("nan")])
+            >>> result.values
+            array([60., nan, nan, nan])
+            >>> result.counts
+            {'non_numeric': 1, 'nan': 1, 'inf': 0, 'out_of_range': 1}
+
+        Args:
+            values (ArrayLike): The values to convert; may contain non-numbers.
+            out (np.ndarray, optional): float32 or float64 array of the same shape for the result.
+            dtype (DTypeLike, optional): float32 or float64, the result type when `out` is not given.
+
+        Returns:
+            ValidatedArray: The result, the validity mask and the counts per reason.
+
+        Raises:
+            TypeError: If `out` or `dtype` is not float32/float64.
+            ValueError: If `out` or an array keyword argument does not have the shape of `values`.
+        """
+        values, numeric = _as_numeric(values)
+        # Converting in place overwrites the input, so classify it first
+        in_place = out is not None and np.shares_memory(values, out)
+        if in_place:
+            nan, inf = np.isnan(values), np.isinf(values)
+        with np.errstate(all="ignore"):
+            out = self(values, out=out, dtype=dtype)
+        valid = np.isfinite(out)
+
+        counts = dict.fromkeys(INVALID_REASONS, 0)
+        if valid.all():
+            return ValidatedArray(out, valid, counts)
+
+        invalid = ~valid
+        out[invalid] = np.nan
+        if not in_place:
+            nan, inf = np.isnan(values), np.isinf(values)
+        out_of_range = invalid & ~nan & ~inf
+        if numeric is not None:
+            counts["non_numeric"] = int(np.count_nonzero(~numeric))
+            nan &= numeric
+        counts["nan"] = int(np.count_nonzero(nan))
+        counts["inf"] = int(np.count_nonzero(invalid & inf))
+        counts["out_of_range"] = int(np.count_nonzero(out_of_range))
+        return ValidatedArray(out, valid, counts)
+
+    def _prepare(
+        self,
+        values: ArrayLike,
+        out: Optional[np.ndarray],
+        dtype: Optional[DTypeLike],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Validate the arguments of `__call__` / `parallel` and allocate `out` if needed."""
+        values = np.asarray(values)
+        if values.dtype not in _FLOAT_DTYPES:
+            values = values.astype(np.float64)
+
+        if out is None:
+            dtype = np.dtype(np.float64 if dtype is None else dtype)
+            if dtype not in _FLOAT_DTYPES:
+                raise TypeError("dtype must be float32 or float64.")
+            out = np.empty(values.shape, dtype=dtype)
+        else:
+            if not isinstance(out, np.ndarray) or out.dtype not in _FLOAT_DTYPES:
+                raise TypeError("out must be a float32 or float64 array.")
+            if out.shape != values.shape:
+                raise ValueError(
+                    f"out has shape {out.shape}, expected {values.shape}."
+                )
+        for name, value in self.kwargs.items():
+            if isinstance(value, np.ndarray) and value.ndim and value.shape != values.shape:
+                raise ValueError(
+                    f"{name} has shape {value.shape}, expected {values.shape}."
+                )
+        return values, out
+
+    def _flat_kwargs(self) -> dict[str, Any]:
+        """`kwargs` with array arguments flattened like the values, for slicing by `_run`."""
+        return {
+            name: value.reshape(-1) if isinstance(value, np.ndarray) and value.ndim else value
+            for name, value in self.kwargs.items()
+        }
+
+    def _run(self, values: np.ndarray, out: np.ndarray, kwargs: dict[str, Any]) -> None:
+        """Convert the flat contiguous `values` into `out`, block by block."""
+        if self.is_offset:
+            np.add(values, self.offset, out=out)
+            return
+
+        for start in range(0, values.size, self.chunk_size):
+            stop = start + self.chunk_size
+            chunk = values[start:stop].astype(out.dtype, copy=False)
+            out[start:stop] = self._apply(chunk, _slice_kwargs(kwargs, start, stop))
+
+    def _apply(self, values: np.ndarray, kwargs: dict[str, Any]) -> np.ndarray:
+        """Run the conversion functions on one block of values."""
+        for func in self._steps:
+            values = BaseConverter._safe_invoke(func, values, **kwargs)
+        return values
+
+    def __repr__(self) -> str:
+        return f"ConversionPlan({self.from_unit} -> {self.to_unit}, {self.kwargs})"
+
+
+def _slice_kwargs(kwargs: dict[str, Any], start: int, stop: int) -> dict[str, Any]:
+    """The block ``start:stop`` of every flat array argument; other arguments are passed through."""
+    return {
+        name: value[start:stop] if isinstance(value, np.ndarray) and value.ndim else value
+        for name, value in kwargs.items()
+    }
+
+
 class BaseConverter(ABC):
     """
     Abstract base class for unit conversion between different units of the same physical quantity.
@@ -23,6 +394,10 @@ class BaseConverter(ABC):
     - `_from_base`: A dictionary mapping each supported unit (except the base unit) to a callable that converts
       a value from the base unit to that unit.
 
+    Subclasses may additionally define `_db_offsets` to declare units that differ from the base unit by a
+    constant dB offset; conversions among those units are then applied without temporary arrays in the
+    batch path.
+
     Conversion Process:
     1. If the source unit is not the base unit, convert the input value to the base unit using `_to_base`.
     2. If the target unit is not the base unit, convert from the base unit to the target unit using `_from_base`.
@@ -31,11 +406,27 @@ class BaseConverter(ABC):
     The `convert` method handles type checking and ensures the conversion functions are called with the
     appropriate parameters, raising informative exceptions when arguments are missing.
 
+    Thread Safety:
+    Converters are stateless: the unit tables are rebuilt on access and never modified, and the shared
+    plan cache is guarded by a lock. A converter instance, and every plan it returns, can be shared
+    freely between threads. Subclasses must keep it that way, i.e. not store per-instance state that
+    changes the result of a conversion.
+
+    Plan Cache:
+    Plans are cached per converter class, not per instance, which relies on the same statelessness.
+    A subclass whose conversion tables do depend on the instance (e.g. a calibration passed to
+    `__init__`) must set ``plan_cacheable = False``; its plans are then resolved on every call.
+
     Methods:
         - convert(value, from_unit, to_unit, **kwargs): Convert a numeric value from `from_unit` to `to_unit`.
+        - convert_array(values, from_unit, to_unit, **kwargs): Batch counterpart of `convert` for NumPy arrays.
+        - convert_validated(values, from_unit, to_unit, **kwargs): `convert_array` with a validity mask.
+        - plan(from_unit, to_unit, **kwargs): Resolve a conversion once for repeated batch use.
         - _safe_invoke(func, value, **kwargs): Internal helper to safely call conversion functions with proper arguments.
     """
 
+    plan_cacheable = True
+
     @property
     @abstractmethod
     def base_unit(self) -> UnitEnum:
@@ -83,6 +474,19 @@ class BaseConverter(ABC):
         """
         pass
 
+    @property
+    def _db_offsets(self) -> dict[UnitEnum, float]:
+        """
+        Units that differ from the base unit by a constant dB offset.
+
+        Each key is a `UnitEnum` member and the value is the offset added when converting from that unit
+        to the base unit, i.e. `_to_base[unit](x) == x + offset`. The base unit implicitly has offset 0.
+
+        Returns:
+            dict[UnitEnum, float]: Dictionary of dB offsets to the base unit. Empty by default.
+        """
+        return {}
+
     def convert(
         self, value: float, from_unit: UnitEnum, to_unit: UnitEnum, **kwargs: Any
     ) -> float:
@@ -109,10 +513,7 @@ class BaseConverter(ABC):
 
         if not isinstance(value, (int, float)):
             raise TypeError("Value must be a number.")
-        if not isinstance(from_unit, self.base_unit.__class__):
-            raise TypeError("Invalid source unit.")
-        if not isinstance(to_unit, self.base_unit.__class__):
-            raise TypeError("Invalid target unit.")
+        self._check_units(from_unit, to_unit)
 
         if from_unit == to_unit:
             return value
@@ -131,6 +532,148 @@ class BaseConverter(ABC):
             func = self._from_base[to_unit]
             return self._safe_invoke(func, base_value, **kwargs)
 
+    def convert_array(
+        self,
+        values: ArrayLike,
+        from_unit: UnitEnum,
+        to_unit: UnitEnum,
+        out: Optional[np.ndarray] = None,
+        dtype: Optional[DTypeLike] = None,
+        workers: Optional[int] = None,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """
+        Convert a whole array of values from one unit to another in a single call.
+
+        This is the batch counterpart of `convert`: the same conversion functions are applied once to
+        the full array instead of once per element, so a trace of a million points costs two vectorized
+        NumPy passes rather than a million Python calls.
+
+        Args:
+            values (ArrayLike): The values to convert. Anything accepted by `numpy.asarray`.
+            from_unit (UnitEnum): The unit of the input values.
+            to_unit (UnitEnum): The unit to convert the values to.
+            out (np.ndarray, optional): Buffer to write the result to; pass `values` to convert in place.
+            dtype (DTypeLike, optional): float32 or float64 result type when `out` is not given.
+                See `ConversionPlan` for the precision of float32.
+            workers (int, optional): Split large arrays across this many threads, see
+                `ConversionPlan.parallel`. Defaults to converting on the calling thread.
+            **kwargs: Additional keyword arguments passed to the conversion functions.
+
+        Returns:
+            np.ndarray: `out` if given, otherwise a new array with the converted values.
+
+        Raises:
+            TypeError: If units are not instances of the unit enumeration, or a required argument is missing.
+            KeyError: If a required keyword argument for conversion is missing.
+            ValueError: If `out` does not have the shape of `values`.
+        """
+        plan = self.plan(from_unit, to_unit, **kwargs)
+        if workers is None:
+            return plan(values, out=out, dtype=dtype)
+        return plan.parallel(values, out=out, dtype=dtype, workers=workers)
+
+    def convert_validated(
+        self,
+        values: ArrayLike,
+        from_unit: UnitEnum,
+        to_unit: UnitEnum,
+        out: Optional[np.ndarray] = None,
+        dtype: Optional[DTypeLike] = None,
+        **kwargs: Any,
+    ) -> ValidatedArray:
+        """
+        Like `convert_array`, but invalid values become NaN and are reported instead of raising.
+
+        See `ConversionPlan.validated` for what counts as invalid.
+
+        Returns:
+            ValidatedArray: The converted values, the validity mask and the counts per reason.
+
+        Raises:
+            TypeError: If units are not instances of the unit enumeration, or a required argument is missing.
+        """
+        return self.plan(from_unit, to_unit, **kwargs).validated(values, out=out, dtype=dtype)
+
+    def plan(
+        self, from_unit: UnitEnum, to_unit: UnitEnum, **kwargs: Any
+    ) -> ConversionPlan:
+        """
+        Resolve the conversion from `from_unit` to `to_unit` into a reusable `ConversionPlan`.
+
+        Use this when the same conversion is applied to many arrays (e.g. every sweep of a scan), so the
+        unit checks and table lookups happen once instead of once per array.
+
+        Args:
+            from_unit (UnitEnum): The unit of the input values.
+            to_unit (UnitEnum): The unit of the output values.
+            **kwargs: Additional keyword arguments passed to the conversion functions.
+
+        Plans are cached per converter class, units and keyword arguments, so every instance of a
+        converter (e.g. one per GUI frame) shares them. Keyword arguments that are not hashable, such
+        as arrays, and converters with ``plan_cacheable = False`` bypass the cache.
+
+        Returns:
+            ConversionPlan: The resolved conversion.
+
+        Raises:
+            TypeError: If units are not instances of the unit enumeration.
+        """
+        self._check_units(from_unit, to_unit)
+        if not self.plan_cacheable:
+            return self._build_plan(from_unit, to_unit, kwargs)
+
+        try:
+            key = (type(self), from_unit, to_unit, frozenset(kwargs.items()))
+        except TypeError:
+            return self._build_plan(from_unit, to_unit, kwargs)
+
+        with _plan_lock:
+            plan = _plan_cache.get(key)
+        if plan is None:
+            plan = self._build_plan(from_unit, to_unit, kwargs)
+            with _plan_lock:
+                if len(_plan_cache) >= _PLAN_CACHE_SIZE:
+                    # Drop the oldest entry; dicts keep insertion order
+                    del _plan_cache[next(iter(_plan_cache))]
+                plan = _plan_cache.setdefault(key, plan)
+        return plan
+
+    def _build_plan(
+        self, from_unit: UnitEnum, to_unit: UnitEnum, kwargs: dict[str, Any]
+    ) -> ConversionPlan:
+        """Resolve a conversion without consulting the plan cache."""
+        # Sequences become arrays, so they are sliced per block like any other per-point argument
+        kwargs = {
+            name: np.asarray(value) if isinstance(value, (list, tuple)) else value
+            for name, value in kwargs.items()
+        }
+        offsets = {self.base_unit: 0.0, **self._db_offsets}
+        if from_unit in offsets and to_unit in offsets:
+            offset = offsets[from_unit] - offsets[to_unit]
+            return ConversionPlan(from_unit, to_unit, [], kwargs, offset=offset)
+
+        steps = []
+        if from_unit != to_unit:
+            if from_unit != self.base_unit:
+                steps.append(self._to_base[from_unit])
+            if to_unit != self.base_unit:
+                steps.append(self._from_base[to_unit])
+
+        return ConversionPlan(from_unit, to_unit, steps, kwargs)
+
+    def _check_units(self, from_unit: UnitEnum, to_unit: UnitEnum) -> None:
+        """
+        Verify that both units belong to this converter's unit enumeration.
+
+        Raises:
+            TypeError: If either unit is not a member of the unit enumeration.
+        """
+        if not isinstance(from_unit, self.base_unit.__class__):
+            raise TypeError("Invalid source unit.")
+        if not isinstance(to_unit, self.base_unit.__class__):
+            raise TypeError("Invalid target unit.")
+
     @staticmethod
     def _safe_invoke(func: Callable[..., float], value: float, **kwargs: Any) -> float:
         """
@@ -0,0 +1,399 @@
+"""
+Batch conversion of trace files.
+
+Every file runs through the same pipeline of stages:
+
+    parse        read the frequency/level columns (`trace_io.read_trace`)
+    correct      add correction tables, e.g. antenna factor and cable loss (`CorrectionTable.apply`)
+    convert      convert the levels to the target unit (`ConversionPlan`)
+    limit-check  compare against a limit line in the target unit
+    write        write the converted trace (`trace_io.write_trace`)
+
+Corrections and conversion work in place on the parsed level array, so a file is held in memory
+once plus the limit line. Observers (`MemoryProfiler`, `StageMetrics`, ...) are notified when each
+stage starts and finishes.
+
+Run from the command line with ``python -m UnitConverter.batch --help``.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Collection, Iterator, NamedTuple, Optional, Protocol, Sequence, Union
+
+import numpy as np
+
+from UnitConverter.base_converter import BaseConverter, UnitEnum
+from UnitConverter.correction_table import CorrectionTable
+from UnitConverter.eirp_converter import EIRP, EIRPConverter
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter
+from UnitConverter.shm_ring import SharedTraceRing
+from UnitConverter.trace_io import read_trace, write_trace
+
+STAGES = ("parse", "correct", "convert", "limit-check", "write")
+
+
+class Stage:
+    """
+    One execution of a pipeline stage, as seen by observers.
+
+    Attributes:
+        name (str): One of `STAGES`.
+        path (Path): The file being processed.
+        rows (int): Number of trace points handled by the stage; set by the runner before the stage
+            finishes.
+    """
+
+    __slots__ = ("name", "path", "rows")
+
+    def __init__(self, name: str, path: Path):
+        self.name = name
+        self.path = path
+        self.rows = 0
+
+
+class StageObserver(Protocol):
+    """Receives the start and end of every stage run by a `BatchRunner`."""
+
+    def stage_started(self, stage: Stage) -> None: ...
+
+    def stage_finished(self, stage: Stage, error: Optional[BaseException]) -> None: ...
+
+
+class FileResult(NamedTuple):
+    """
+    Outcome of one file.
+
+    Attributes:
+        path (Path): The input file.
+        output (Path | None): The converted trace, None if the file failed.
+        rows (int): Number of trace points.
+        failures (int): Points above the limit line (0 without a limit).
+        worst_margin (float): Smallest limit minus level in dB; NaN without a limit.
+        error (str | None): Why the file failed, None on success.
+        invalid (dict[str, int] | None): Points that did not convert to a finite level, per reason
+            (see `ConversionPlan.validated`); they are written as NaN. None if the file failed.
+    """
+
+    path: Path
+    output: Optional[Path]
+    rows: int
+    failures: int
+    worst_margin: float
+    error: Optional[str]
+    invalid: Optional[dict[str, int]] = None
+
+
+class BatchRunner:
+    """
+    Run the parse/correct/convert/limit-check/write pipeline over many trace files.
+
+    Example:
+        >>> runner = BatchRunner(
+        ...     FieldStrengthConverter(), FSUNIT.DBUV_PER_M, FSUNIT.DBUV_PER_M, "out",
+        ...     corrections=[CorrectionTable.load("af.npz")],
+        ...     limit=CorrectionTable.from_file("class_b.csv"),
+        ... )
+        >>> results = runner.run(Path("scans").glob("*.csv"))
+
+    A file that cannot be read or converted is reported with its error and the run continues with
+    the next one.
+
+    Attributes:
+        plan (ConversionPlan): The conversion applied in the convert stage.
+        output_dir (Path): Where the converted traces are written. Files are written under their
+            path relative to the deepest directory common to all inputs, i.e. just the file name if
+            they come from one directory, so inputs with the same name never overwrite each other.
+            A file whose output would replace one of the inputs fails instead.
+        corrections (list[CorrectionTable]): Tables added to the levels before conversion, in the
+            source unit (must be a dB unit).
+        limit (CorrectionTable | None): Limit line in the target unit (must be a dB unit).
+        observers (list[StageObserver]): Notified around every stage.
+        ring (SharedTraceRing | None): Every converted trace is also published into this ring in the
+            write stage, so live consumers (display, logger, ...) see the batch results as they are
+            produced. A trace with more points than the ring holds fails its file.
+    """
+
+    def __init__(
+        self,
+        converter: BaseConverter,
+        from_unit: UnitEnum,
+        to_unit: UnitEnum,
+        output_dir: Union[str, Path],
+        corrections: Sequence[CorrectionTable] = (),
+        limit: Optional[CorrectionTable] = None,
+        observers: Sequence[StageObserver] = (),
+        delimiter: str = ",",
+        skip_header: int = 0,
+        ring: Optional[SharedTraceRing] = None,
+        **kwargs: Any,
+    ):
+        self.plan = converter.plan(from_unit, to_unit, **kwargs)
+        self.output_dir = Path(output_dir)
+        self.corrections = list(corrections)
+        self.limit = limit
+        self.observers = list(observers)
+        self.delimiter = delimiter
+        self.skip_header = skip_header
+        self.ring = ring
+
+    def run(self, paths: Sequence[Union[str, Path]]) -> list[FileResult]:
+        """Process every file in `paths` and return one result per file, in order."""
+        paths = [Path(path) for path in paths]
+        outputs = self.output_paths(paths)
+        inputs = {path.resolve() for path in paths}
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        return [
+            self.run_file(path, output, inputs) for path, output in zip(paths, outputs)
+        ]
+
+    def output_paths(self, paths: Sequence[Path]) -> list[Path]:
+        """Where the converted traces of `paths` are written, see `output_dir`."""
+        parents = [str(path.resolve().parent) for path in paths]
+        try:
+            root = Path(os.path.commonpath(parents)) if parents else None
+        except ValueError:
+            # Different drives: there is no common directory
+            root = None
+        if root is None:
+            return [self.output_dir / path.name for path in paths]
+        return [self.output_dir / path.resolve().relative_to(root) for path in paths]
+
+    def run_file(
+        self, path: Path, output: Optional[Path] = None, inputs: Collection[Path] = ()
+    ) -> FileResult:
+        """
+        Process one file.
+
+        Args:
+            path (Path): The trace file.
+            output (Path, optional): Where to write the result; defaults to `output_dir` / file name.
+            inputs (Collection[Path], optional): Resolved paths of all inputs of the run, none of which
+                may be overwritten.
+        """
+        output = self.output_dir / path.name if output is None else output
+        resolved = output.resolve()
+        if resolved == path.resolve() or resolved in inputs:
+            return FileResult(
+                path, None, 0, 0, np.nan, f"ValueError: output {output} would overwrite an input file"
+            )
+
+        try:
+            with self._stage("parse", path) as stage:
+                freq, level = read_trace(path, self.delimiter, self.skip_header)
+                stage.rows = level.size
+
+            with self._stage("correct", path) as stage:
+                for table in self.corrections:
+                    table.apply(freq, level, out=level)
+                stage.rows = level.size
+
+            with self._stage("convert", path) as stage:
+                invalid = self.plan.validated(level, out=level).counts
+                stage.rows = level.size
+
+            failures, worst_margin = 0, np.nan
+            with self._stage("limit-check", path) as stage:
+                if self.limit is not None:
+                    margin = self.limit(freq)
+                    np.subtract(margin, level, out=margin)
+                    failures = int(np.count_nonzero(margin < 0))
+                    if not np.all(np.isnan(margin)):
+                        worst_margin = float(np.nanmin(margin))
+                stage.rows = level.size
+
+            output.parent.mkdir(parents=True, exist_ok=True)
+            with self._stage("write", path) as stage:
+                if self.ring is not None:
+                    self.ring.publish(level)
+                write_trace(output, freq, level, self.delimiter)
+                stage.rows = level.size
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            return FileResult(path, None, 0, 0, np.nan, f"{type(e).__name__}: {e}")
+
+        return FileResult(path, output, level.size, failures, worst_margin, None, invalid)
+
+    @contextmanager
+    def _stage(self, name: str, path: Path) -> Iterator[Stage]:
+        stage = Stage(name, path)
+        for observer in self.observers:
+            observer.stage_started(stage)
+        error = None
+        try:
+            yield stage
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            for observer in reversed(self.observers):
+                observer.stage_finished(stage, error)
+
+
+# Converter choices of the command line: name -> (converter class, unit enum)
+_CONVERTERS = {
+    "fs": (FieldStrengthConverter, FSUNIT),
+    "eirp": (EIRPConverter, EIRP),
+}
+
+
+def _unit_help() -> str:
+    return "; ".join(
+        f"{name}: {', '.join(unit.name for unit in enum)}" for name, (_, enum) in _CONVERTERS.items()
+    )
+
+
+def check_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Exit through `parser.error` on unknown unit names or a missing EIRP distance."""
+    _, unit_enum = _CONVERTERS[args.converter]
+    names = [unit.name for unit in unit_enum]
+    for option, name in (("--from-unit", args.from_unit), ("--to-unit", args.to_unit)):
+        if name not in names:
+            parser.error(
+                f"{option}: unknown {args.converter} unit {name!r}, choose from {', '.join(names)}"
+            )
+    if args.converter == "eirp" and args.distance is None:
+        parser.error("--distance is required with --converter eirp")
+
+
+def _load_table(path: str) -> CorrectionTable:
+    if path.endswith(".npz"):
+        return CorrectionTable.load(path)
+    return CorrectionTable.from_file(path)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="rfcalc-batch", description="Correct, convert and limit-check trace files."
+    )
+    parser.add_argument("files", nargs="+", help="Two-column frequency/level trace files")
+    parser.add_argument("--output", required=True, help="Directory for the converted traces")
+    parser.add_argument("--converter", choices=tuple(_CONVERTERS), default="fs")
+    parser.add_argument(
+        "--from-unit", required=True, help=f"Unit name. {_unit_help()}"
+    )
+    parser.add_argument("--to-unit", required=True, help="Unit name, as for --from-unit")
+    parser.add_argument("--distance", type=float, help="Measurement distance (m), EIRP only")
+    parser.add_argument("--slope", type=float, default=20.0, help="dB/decade, EIRP only")
+    parser.add_argument(
+        "--correction", action="append", default=[], help="Correction table (.csv or .npz), repeatable"
+    )
+    parser.add_argument("--limit", help="Limit line in the target unit (.csv or .npz)")
+    parser.add_argument("--delimiter", default=",")
+    parser.add_argument("--skip-header", type=int, default=0)
+    parser.add_argument("--summary", help="Write the per-file results as JSON to this file")
+    parser.add_argument(
+        "--profile-memory",
+        metavar="REPORT",
+        help="Trace memory per stage with tracemalloc and write the JSON report to this file",
+    )
+    parser.add_argument(
+        "--profile-top", type=int, default=10, help="Allocating lines reported per stage"
+    )
+    parser.add_argument("--shm", help="Also publish the converted traces into a shared memory ring")
+    parser.add_argument("--slots", type=int, default=64, help="Traces kept in the shared memory ring")
+    parser.add_argument(
+        "--points", type=int, default=100_001, help="Maximum points per trace in the ring"
+    )
+    parser.add_argument(
+        "--metrics-file",
+        metavar="PATH",
+        help="Write Prometheus metrics for node-exporter's textfile collector to this file",
+    )
+    return parser
+
+
+def build_runner(
+    args: argparse.Namespace,
+    observers: Sequence[StageObserver] = (),
+    ring: Optional[SharedTraceRing] = None,
+) -> BatchRunner:
+    """Create the runner described by parsed command line arguments."""
+    converter_class, unit_enum = _CONVERTERS[args.converter]
+    context = {}
+    if args.converter == "eirp":
+        context = {"distance": args.distance, "slope": args.slope}
+    return BatchRunner(
+        converter_class(),
+        unit_enum[args.from_unit],
+        unit_enum[args.to_unit],
+        args.output,
+        corrections=[_load_table(path) for path in args.correction],
+        limit=_load_table(args.limit) if args.limit else None,
+        observers=observers,
+        delimiter=args.delimiter,
+        skip_header=args.skip_header,
+        ring=ring,
+        **context,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    check_args(parser, args)
+
+    observers = []
+    profiler = None
+    if args.profile_memory:
+        from UnitConverter.memory_profile import MemoryProfiler
+
+        profiler = MemoryProfiler(top=args.profile_top)
+        observers.append(profiler)
+    registry = None
+    if args.metrics_file:
+        from UnitConverter.metrics import MetricsRegistry
+
+        registry = MetricsRegistry()
+        observers.append(registry.add_stages())
+    ring = None
+    if args.shm:
+        unit = _CONVERTERS[args.converter][1][args.to_unit]
+        ring = SharedTraceRing.create(args.shm, args.slots, args.points, unit.value)
+    runner = build_runner(args, observers, ring)
+
+    start = time.perf_counter()
+    try:
+        if profiler:
+            with profiler:
+                results = runner.run(args.files)
+            profiler.write_report(args.profile_memory)
+        else:
+            results = runner.run(args.files)
+    finally:
+        # Consumers attached during the run keep their mapping; the name goes away with the publisher
+        if ring is not None:
+            ring.close()
+            ring.unlink()
+    elapsed = time.perf_counter() - start
+
+    failed = [result for result in results if result.error]
+    for result in failed:
+        print(f"{result.path}: {result.error}", file=sys.stderr)
+    rows = sum(result.rows for result in results)
+    print(f"{len(results) - len(failed)}/{len(results)} files, {rows} rows in {elapsed:.2f} s")
+
+    if args.summary:
+        summary = [
+            {
+                "path": str(result.path),
+                "output": str(result.output) if result.output else None,
+                "rows": result.rows,
+                "failures": result.failures,
+                "worst_margin": None if np.isnan(result.worst_margin) else result.worst_margin,
+                "error": result.error,
+                "invalid": result.invalid,
+            }
+            for result in results
+        ]
+        Path(args.summary).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    if registry:
+        registry.write_textfile(args.metrics_file)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
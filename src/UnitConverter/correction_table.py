@@ -0,0 +1,259 @@
+import hashlib
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from UnitConverter.trace_io import read_trace
+
+# Relative deviation of a step from the mean step up to which a grid still counts as uniform
+_UNIFORM_TOLERANCE = 1e-9
+
+
+class CorrectionTable:
+    """
+    A piecewise-linear correction (antenna factor, cable loss, preamplifier gain, ...) compiled for
+    repeated evaluation.
+
+    The table is compiled once into one slope and one intercept per segment, so evaluating it is a
+    gather and a multiply-add per point; nothing is recomputed per call. If the table frequencies
+    are uniformly spaced the segment of a point is found by index arithmetic, ``(f - f0) / step``,
+    in O(1); otherwise by a binary search.
+
+    The compiled arrays can be saved with `save` and loaded with `load` without recompiling, e.g. by
+    worker processes of a batch run. `digest` identifies the table contents, for use as a correction
+    table version in `ResultCache` keys.
+
+    Example:
+        >>> antenna = CorrectionTable.from_file("antenna_factor.csv", name="VULB 9168")
+        >>> level = antenna.apply(freq, reading)          # reading + AF(freq)
+        >>> antenna.save("antenna_factor.npz")
+
+    Attributes:
+        name (str): Description of the table.
+        freq (np.ndarray): Strictly increasing breakpoint frequencies (Hz).
+        slope (np.ndarray): Slope of each segment (dB/Hz).
+        intercept (np.ndarray): Value of each segment's line at 0 Hz (dB).
+        extrapolate (bool): Whether frequencies outside the table use the first/last segment
+            instead of giving NaN.
+        uniform (bool): Whether the breakpoints are uniformly spaced.
+        block_size (int): Number of points evaluated per block.
+    """
+
+    block_size = 1 << 14
+
+    def __init__(
+        self,
+        freq: ArrayLike,
+        amp: ArrayLike,
+        name: str = "",
+        extrapolate: bool = False,
+    ):
+        """
+        Compile a table from its breakpoints.
+
+        Args:
+            freq (ArrayLike): Strictly increasing frequencies (Hz).
+            amp (ArrayLike): Correction at each frequency (dB).
+            name (str, optional): Description of the table.
+            extrapolate (bool, optional): Extend the first and last segment beyond the table.
+                Defaults to NaN outside the table.
+
+        Raises:
+            ValueError: If fewer than two points are given, `freq` and `amp` differ in length, or
+                `freq` is not strictly increasing.
+        """
+        freq = np.asarray(freq, dtype=np.float64)
+        amp = np.asarray(amp, dtype=np.float64)
+        if freq.shape != amp.shape or freq.ndim != 1:
+            raise ValueError("freq and amp must be one-dimensional and of the same length.")
+        if freq.size < 2:
+            raise ValueError("At least two points are required for interpolation.")
+        if np.any(np.diff(freq) <= 0):
+            raise ValueError("freq must be strictly increasing.")
+
+        slope = np.diff(amp) / np.diff(freq)
+        intercept = amp[:-1] - slope * freq[:-1]
+        self._init(freq, slope, intercept, name, extrapolate)
+
+    def _init(
+        self,
+        freq: np.ndarray,
+        slope: np.ndarray,
+        intercept: np.ndarray,
+        name: str,
+        extrapolate: bool,
+    ) -> None:
+        self.name = name
+        self.freq = freq
+        self.slope = slope
+        self.intercept = intercept
+        self.extrapolate = extrapolate
+
+        self._step = (freq[-1] - freq[0]) / (freq.size - 1)
+        self.uniform = bool(
+            np.all(np.abs(np.diff(freq) - self._step) <= _UNIFORM_TOLERANCE * self._step)
+        )
+
+    @classmethod
+    def from_file(
+        cls,
+        path: Union[str, Path],
+        name: Optional[str] = None,
+        extrapolate: bool = False,
+        **kwargs,
+    ) -> "CorrectionTable":
+        """
+        Compile a table from a two-column frequency/correction text file (see `trace_io.read_trace`).
+
+        Args:
+            path (str | Path): The file to read.
+            name (str, optional): Description of the table. Defaults to the file name.
+            extrapolate (bool, optional): See `__init__`.
+            **kwargs: Passed to `read_trace`, e.g. `delimiter` or `skip_header`.
+        """
+        freq, amp = read_trace(path, **kwargs)
+        return cls(freq, amp, name=Path(path).name if name is None else name, extrapolate=extrapolate)
+
+    @property
+    def amp(self) -> np.ndarray:
+        """The correction at the breakpoints (dB)."""
+        amp = self.intercept + self.slope * self.freq[:-1]
+        return np.append(amp, self.intercept[-1] + self.slope[-1] * self.freq[-1])
+
+    @property
+    def digest(self) -> str:
+        """Hex digest of the compiled table; changes whenever the correction changes."""
+        digest = hashlib.sha256()
+        for array in (self.freq, self.slope, self.intercept):
+            digest.update(np.ascontiguousarray(array).tobytes())
+        digest.update(b"extrapolate" if self.extrapolate else b"nan")
+        return digest.hexdigest()
+
+    def segment(self, freq: ArrayLike) -> np.ndarray:
+        """
+        Index of the segment each frequency falls into, clipped to the first/last segment.
+
+        O(1) per point on uniform grids, O(log n) otherwise.
+        """
+        freq = np.asarray(freq, dtype=np.float64)
+        if not self.uniform:
+            index = np.searchsorted(self.freq, freq, side="right") - 1
+            return np.clip(index, 0, self.slope.size - 1, out=index)
+
+        position = (freq - self.freq[0]) / self._step
+        with np.errstate(invalid="ignore"):
+            index = position.astype(np.intp)
+        return np.clip(index, 0, self.slope.size - 1, out=index)
+
+    def __call__(self, freq: ArrayLike, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Evaluate the correction at `freq`.
+
+        The points are processed in blocks of `block_size` with preallocated scratch buffers, so the
+        temporaries stay in cache. For a sweep grid that does not change, evaluate the correction once
+        and add it to every sweep.
+
+        Args:
+            freq (ArrayLike): Frequencies in any order (Hz).
+            out (np.ndarray, optional): float64 array of the same shape to write the result to.
+
+        Returns:
+            np.ndarray: The correction (dB); NaN outside the table unless `extrapolate` is set.
+        """
+        freq = np.asarray(freq, dtype=np.float64)
+        if out is None:
+            out = np.empty(freq.shape)
+        elif out.shape != freq.shape or out.dtype != np.float64:
+            raise ValueError("out must be a float64 array of the same shape as freq.")
+
+        if not out.flags.c_contiguous:
+            out[...] = self(freq)
+            return out
+
+        flat_freq = freq.reshape(-1)
+        flat_out = out.reshape(-1)
+        if flat_freq.size == 0:
+            return out
+
+        block = min(self.block_size, flat_freq.size)
+        scratch = np.empty(block)
+        index = np.empty(block, dtype=np.intp)
+        f0, last = self.freq[0], self.freq[-1]
+        inv_step = 1.0 / self._step
+        for start in range(0, flat_freq.size, block):
+            f = flat_freq[start : start + block]
+            o = flat_out[start : start + block]
+            n = f.size
+            if self.uniform:
+                np.subtract(f, f0, out=scratch[:n])
+                scratch[:n] *= inv_step
+                with np.errstate(invalid="ignore"):
+                    np.copyto(index[:n], scratch[:n], casting="unsafe")
+            else:
+                index[:n] = np.searchsorted(self.freq, f, side="right") - 1
+            # mode="clip" maps indices beyond either end onto the first/last segment
+            np.take(self.slope, index[:n], out=o, mode="clip")
+            o *= f
+            np.take(self.intercept, index[:n], out=scratch[:n], mode="clip")
+            o += scratch[:n]
+            if not self.extrapolate:
+                o[~((f >= f0) & (f <= last))] = np.nan
+        return out
+
+    def apply(
+        self, freq: ArrayLike, level: ArrayLike, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Add the correction to `level`, e.g. a receiver reading plus antenna factor and cable loss.
+
+        Args:
+            freq (ArrayLike): Frequencies of the levels (Hz).
+            level (ArrayLike): Levels in a dB unit, same shape as `freq`.
+            out (np.ndarray, optional): float64 array to write the result to; may be `level` itself.
+
+        Returns:
+            np.ndarray: ``level + correction(freq)``.
+        """
+        level = np.asarray(level, dtype=np.float64)
+        correction = self(freq)
+        return np.add(level, correction, out=out)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the compiled table as an ``.npz`` file."""
+        np.savez(
+            path,
+            freq=self.freq,
+            slope=self.slope,
+            intercept=self.intercept,
+            name=np.array(self.name),
+            extrapolate=np.array(self.extrapolate),
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "CorrectionTable":
+        """
+        Load a table written by `save`, without recompiling it.
+
+        Raises:
+            OSError: If the file cannot be read.
+            KeyError: If the file is not a saved correction table.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            table = cls.__new__(cls)
+            table._init(
+                data["freq"],
+                data["slope"],
+                data["intercept"],
+                str(data["name"]),
+                bool(data["extrapolate"]),
+            )
+        return table
+
+    def __repr__(self) -> str:
+        kind = "uniform" if self.uniform else "non-uniform"
+        return (
+            f"CorrectionTable({self.name!r}, {self.freq.size} points, {kind}, "
+            f"{self.freq[0]:g}-{self.freq[-1]:g} Hz)"
+        )
@@ -1,6 +1,13 @@
 from math import log10, pi
+from typing import Any, Optional, Union
 
-from src.UnitConverter.base_converter import BaseConverter, UnitEnum
+import numpy as np
+from numpy.typing import ArrayLike
+
+from UnitConverter.base_converter import BaseConverter, UnitEnum
+from UnitConverter.rf_util import log_10, inverse_log_10
+
+SPEED_OF_LIGHT = 299_792_458.0
 
 
 class EIRP(UnitEnum):
@@ -65,7 +72,70 @@ def eirp_to_wm2(
     Returns:
         float: Power density in watts per square meter (W/m²).
     """
-    return (pow(10, value / 10) / 1e3) / (4 * pi * pow(distance, 2))
+    return (inverse_log_10(value) / 1e3) / (4 * pi * pow(distance, 2))
+
+
+def field_region_slope(
+    freq: ArrayLike,
+    distance: ArrayLike,
+    near_slope: float = 40.0,
+    far_slope: float = 20.0,
+    antenna_size: Optional[float] = None,
+) -> Union[float, np.ndarray]:
+    """
+    Distance extrapolation slope per frequency point, from the near-field/far-field boundary.
+
+    A point is in the far field if `distance` is at least the boundary distance, where the field
+    falls off as 1/r (`far_slope`, 20 dB/decade); closer, in the reactive near field, it falls off
+    faster (`near_slope`). The boundary is the radian sphere λ/2π, or for an antenna of largest
+    dimension D the larger of λ/2π and the Fraunhofer distance 2D²/λ.
+
+    Example:
+        >>> field_region_slope([10e6, 30e6, 1e9], 3.0)
+        array([40., 20., 20.])
+
+    Args:
+        freq (ArrayLike): Frequencies (Hz), positive.
+        distance (ArrayLike): Measurement distance (m), positive; a scalar or one per frequency.
+        near_slope (float, optional): Slope inside the boundary (dB/decade). Defaults to 40.
+        far_slope (float, optional): Slope beyond the boundary (dB/decade). Defaults to 20.
+        antenna_size (float, optional): Largest dimension of the radiating antenna (m).
+
+    Returns:
+        float | np.ndarray: The slope per point; a float for scalar inputs.
+
+    Raises:
+        ValueError: If a frequency or distance is not positive.
+    """
+    freq = np.asarray(freq, dtype=np.float64)
+    distance = np.asarray(distance, dtype=np.float64)
+    if np.any(freq <= 0):
+        raise ValueError("freq must be positive.")
+    if np.any(distance <= 0):
+        raise ValueError("distance must be positive.")
+
+    wavelength = SPEED_OF_LIGHT / freq
+    boundary = wavelength / (2 * pi)
+    if antenna_size is not None:
+        boundary = np.maximum(boundary, 2 * antenna_size**2 / wavelength)
+    slope = np.where(distance >= boundary, far_slope, near_slope)
+    return float(slope) if slope.ndim == 0 else slope
+
+
+def _slope(kwargs: dict[str, Any]) -> Union[float, np.ndarray]:
+    """The `slope` argument of a conversion, resolving ``slope="auto"`` per frequency point."""
+    slope = kwargs["slope"]
+    if not isinstance(slope, str):
+        return slope
+    if slope != "auto":
+        raise ValueError(f"slope must be a number, an array or 'auto', got {slope!r}.")
+    return field_region_slope(
+        kwargs["freq"],
+        kwargs["distance"],
+        kwargs.get("near_slope", 40.0),
+        kwargs.get("far_slope", 20.0),
+        kwargs.get("antenna_size"),
+    )
 
 
 class EIRPConverter(BaseConverter):
@@ -87,6 +157,11 @@ class EIRPConverter(BaseConverter):
     require additional context such as distance (in meters) and optionally slope (default: 20),
     which corresponds to the propagation loss factor in logarithmic scale.
 
+    The slope may also be an array with one value per point, or ``slope="auto"`` together with
+    ``freq=`` (one frequency per point) to pick 20 or 40 dB/decade per point from the near-field /
+    far-field boundary at `distance` (see `field_region_slope`; `near_slope`, `far_slope` and
+    `antenna_size` are passed on). A trace spanning both regions is then converted in one call.
+
     The base unit used internally is EIRP in dBm.
 
     Notes:
@@ -98,6 +173,7 @@ class EIRPConverter(BaseConverter):
         >>> c = EIRPConverter()
         >>> c.convert(30, EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=3.0)
         110.45757490560675
+        >>> c.convert_array(levels, EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=3.0, slope="auto", freq=freq)
 
     Raises:
         KeyError: If required keyword arguments (e.g., distance) are missing for certain conversions.
@@ -114,11 +190,11 @@ class EIRPConverter(BaseConverter):
     @property
     def _to_base(self):
         return {
-            EIRP.EIRP_mW: lambda x, **kwargs: 10 * log10(x),
+            EIRP.EIRP_mW: lambda x, **kwargs: log_10(x),
             EIRP.ERP_dBm: lambda x, **kwargs: x + 2.15,
-            EIRP.ERP_mW: lambda x, **kwargs: 10 * log10(x) + 2.15,
+            EIRP.ERP_mW: lambda x, **kwargs: log_10(x) + 2.15,
             EIRP.dbuv_per_m: lambda x, **kwargs: dbuvm_to_eirp(
-                x, kwargs["distance"], kwargs["slope"]
+                x, kwargs["distance"], _slope(kwargs)
             ),
             EIRP.dbuv: lambda x, **kwargs: x - 107,
             EIRP.W_m_sq: lambda x, **kwargs: x * (4 * pi * pow(kwargs["distance"], 2)),
@@ -127,12 +203,19 @@ class EIRPConverter(BaseConverter):
     @property
     def _from_base(self):
         return {
-            EIRP.EIRP_mW: lambda x, **kwargs: pow(10, x / 10),
+            EIRP.EIRP_mW: lambda x, **kwargs: inverse_log_10(x),
             EIRP.ERP_dBm: lambda x, **kwargs: x - 2.15,
-            EIRP.ERP_mW: lambda x, **kwargs: pow(10, (x - 2.15) / 10),
+            EIRP.ERP_mW: lambda x, **kwargs: inverse_log_10(x - 2.15),
             EIRP.dbuv_per_m: lambda x, **kwargs: eirp_to_dbuvm(
-                x, kwargs["distance"], kwargs["slope"]
+                x, kwargs["distance"], _slope(kwargs)
             ),
             EIRP.dbuv: lambda x, **kwargs: x + 107,
             EIRP.W_m_sq: lambda x, **kwargs: eirp_to_wm2(x, kwargs["distance"]),
         }
+
+    @property
+    def _db_offsets(self):
+        return {
+            EIRP.ERP_dBm: 2.15,
+            EIRP.dbuv: -107,
+        }
@@ -0,0 +1,113 @@
+"""
+Opt-in approximate evaluation of the log/pow functions used by the converters.
+
+Inside ``with approximate():`` the array paths of `rf_util.log_10`, `log_20`, `inverse_log_10` and
+`inverse_log_20` are evaluated in single precision with NumPy's natural `log`/`exp` kernels, which have
+SIMD implementations on AVX2 and AVX-512 CPUs, instead of `log10` and `pow` in double precision.
+Scalars (the single-value GUI path) are always computed exactly.
+
+Declared accuracy:
+    The result differs from the exact path by at most `MAX_ERROR_DB` (0.0001 dB) for levels within
+    ±280 dB, i.e. linear values between 1e-14 and 1e14, far below the 0.01 dB resolution of receiver
+    data. For linear results that is a relative error below 1.2e-5 (field quantities) or 2.3e-5 (power
+    quantities). Arrays with values outside the single precision range fall back to the exact path.
+
+Speed (2M points, see ``benchmarks/bench_approximate.py``): dB -> linear conversions are 4-5x faster
+on AVX2 and 2-3x faster on AVX-512 machines, linear -> dB about 2.4x faster on AVX2. On AVX-512
+NumPy's double precision `log10` is already vectorized and as fast as the single precision path, so
+`log10` keeps using it there.
+
+Precomputed lookup tables with interpolation were measured as well and are 2-15x *slower* than
+NumPy's vectorized kernels (the index computation and gathers cost more than the function itself),
+so they are not used.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+import numpy as np
+
+MAX_ERROR_DB = 1e-4
+
+_approximate: ContextVar[bool] = ContextVar("rfcalc_approximate", default=False)
+
+_LN10 = float(np.log(10.0))
+
+
+def _has_simd_log10() -> bool:
+    """True if NumPy dispatches float64 log10 to its AVX-512 kernel on this CPU."""
+    try:
+        from numpy._core._multiarray_umath import __cpu_features__
+    except ImportError:
+        try:
+            from numpy.core._multiarray_umath import __cpu_features__
+        except ImportError:
+            return False
+    return bool(__cpu_features__.get("AVX512_SKX"))
+
+
+_EXACT_LOG10_IS_FAST = _has_simd_log10()
+# Arguments for which float32 exp stays a normal number
+_EXP_MIN = -87.0
+_EXP_MAX = 88.0
+
+
+@contextmanager
+def approximate(enabled: bool = True) -> Iterator[None]:
+    """
+    Evaluate array conversions approximately within the block.
+
+    The setting is a context variable, so it applies to the current thread (or asyncio task) only.
+    `ConversionPlan.parallel` carries it over to its worker threads.
+
+    Args:
+        enabled (bool, optional): False switches back to exact evaluation inside an approximate block.
+    """
+    token = _approximate.set(enabled)
+    try:
+        yield
+    finally:
+        _approximate.reset(token)
+
+
+def is_approximate() -> bool:
+    """True inside an `approximate` block."""
+    return _approximate.get()
+
+
+def log10(values: np.ndarray) -> np.ndarray:
+    """
+    Approximate log10 of an array, in float32.
+
+    Uses float64 `numpy.log10` if a value is outside the float32 range, or if that is vectorized on
+    this CPU anyway.
+    """
+    if values.size == 0 or _EXACT_LOG10_IS_FAST:
+        return np.log10(values)
+    with np.errstate(over="ignore"):
+        result = values.astype(np.float32)
+    with np.errstate(divide="ignore"):
+        np.log(result, out=result)
+    with np.errstate(invalid="ignore"):
+        if np.isinf(result.min()) or np.isinf(result.max()):
+            return np.log10(values)
+    result *= np.float32(1.0 / _LN10)
+    return result
+
+
+def exp10(values: np.ndarray) -> np.ndarray:
+    """
+    Approximate 10**values of an array, in float32.
+
+    Falls back to float64 `numpy.power` if a result would leave the normal float32 range.
+    """
+    if values.size == 0:
+        return np.power(10.0, values)
+    with np.errstate(over="ignore"):
+        result = np.multiply(values, _LN10, dtype=np.float32)
+    with np.errstate(invalid="ignore"):
+        if result.min() < _EXP_MIN or result.max() > _EXP_MAX:
+            return np.power(10.0, values)
+    np.exp(result, out=result)
+    return result
@@ -0,0 +1,147 @@
+import json
+import linecache
+import tracemalloc
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from UnitConverter.batch import Stage
+
+# Traces of the profiler itself and of tracemalloc are left out of the report
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class _StageStats:
+    """Memory figures of one stage, accumulated over all files."""
+
+    def __init__(self):
+        self.calls = 0
+        self.rows = 0
+        self.peak_bytes = 0
+        self.peak_path: Optional[str] = None
+        self.net_bytes = 0
+        self.new_blocks = 0
+        # (filename, lineno) -> [largest net size, blocks at that size]
+        self.lines: dict[tuple[str, int], list[int]] = {}
+
+
+class MemoryProfiler:
+    """
+    Opt-in peak-memory tracing of the batch pipeline stages with `tracemalloc`.
+
+    Pass it as an observer to `BatchRunner`. Around every stage it resets the traced peak and takes a
+    snapshot before and after, and records per stage:
+
+    - `peak_bytes`: the highest traced memory above the level at the start of the stage, i.e. what the
+      stage needed on top of what was already allocated (including temporaries freed before it ended);
+    - `net_bytes` / `new_blocks`: memory and number of allocations still alive when the stage ended;
+    - `top_lines`: the source lines that allocated the most memory still alive at the end of a stage.
+
+    NumPy reports its array buffers to `tracemalloc`, so copies of trace data show up under the line
+    that made them. Tracing slows Python code down considerably and snapshots cost time proportional
+    to the number of live allocations; use it to find the stage that copies, not for timing.
+
+    Example:
+        >>> with MemoryProfiler() as profiler:
+        ...     BatchRunner(..., observers=[profiler]).run(files)
+        >>> profiler.write_report("memory.json")
+
+    Attributes:
+        frames (int): Number of stack frames stored per allocation.
+        top (int): Number of source lines reported per stage.
+    """
+
+    def __init__(self, frames: int = 1, top: int = 10):
+        self.frames = frames
+        self.top = top
+        self._stats: dict[str, _StageStats] = {}
+        self._started_tracing = False
+        self._overall_peak = 0
+        self._before: Optional[tracemalloc.Snapshot] = None
+        self._base = 0
+
+    def start(self) -> None:
+        """Start tracing, unless `tracemalloc` is already running."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        """Stop tracing if `start` started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def __enter__(self) -> "MemoryProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def stage_started(self, stage: Stage) -> None:
+        if not tracemalloc.is_tracing():
+            self.start()
+        self._before = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        tracemalloc.reset_peak()
+        self._base = tracemalloc.get_traced_memory()[0]
+
+    def stage_finished(self, stage: Stage, error: Optional[BaseException]) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        self._overall_peak = max(self._overall_peak, peak)
+
+        stats = self._stats.setdefault(stage.name, _StageStats())
+        stats.calls += 1
+        stats.rows += stage.rows
+        if peak - self._base > stats.peak_bytes:
+            stats.peak_bytes = peak - self._base
+            stats.peak_path = str(stage.path)
+        stats.net_bytes += current - self._base
+
+        for diff in after.compare_to(self._before, "lineno"):
+            if diff.size_diff <= 0:
+                continue
+            stats.new_blocks += max(diff.count_diff, 0)
+            frame = diff.traceback[0]
+            line = stats.lines.setdefault((frame.filename, frame.lineno), [0, 0])
+            if diff.size_diff > line[0]:
+                line[:] = [diff.size_diff, diff.count_diff]
+        self._before = None
+
+    def report(self) -> dict[str, Any]:
+        """The collected figures, per stage in pipeline order, as a JSON-serializable dict."""
+        stages = {}
+        for name, stats in self._stats.items():
+            lines = sorted(stats.lines.items(), key=lambda item: item[1][0], reverse=True)
+            stages[name] = {
+                "calls": stats.calls,
+                "rows": stats.rows,
+                "peak_bytes": stats.peak_bytes,
+                "peak_file": stats.peak_path,
+                "net_bytes": stats.net_bytes,
+                "new_blocks": stats.new_blocks,
+                "top_lines": [
+                    {
+                        "file": filename,
+                        "line": lineno,
+                        "code": linecache.getline(filename, lineno).strip(),
+                        "size_bytes": size,
+                        "blocks": count,
+                    }
+                    for (filename, lineno), (size, count) in lines[: self.top]
+                ],
+            }
+        return {
+            "tracemalloc_frames": self.frames,
+            "overall_peak_bytes": self._overall_peak,
+            "stages": stages,
+        }
+
+    def write_report(self, path: Union[str, Path]) -> None:
+        """Write `report` as a JSON file."""
+        Path(path).write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
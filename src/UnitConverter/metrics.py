@@ -0,0 +1,313 @@
+"""
+Prometheus metrics of batch runs and the stream service, without extra dependencies.
+
+Metrics are rendered in the Prometheus text exposition format (version 0.0.4), either into a file for
+node-exporter's textfile collector (`MetricsRegistry.write_textfile`) or served on a local
+``/metrics`` endpoint (`MetricsRegistry.serve`).
+
+Example:
+    >>> registry = MetricsRegistry()
+    >>> stages = registry.add_stages()
+    >>> registry.add_cache(cache)
+    >>> BatchRunner(..., observers=[stages]).run(files)
+    >>> registry.write_textfile("/var/lib/node_exporter/textfile/rfcalc.prom")
+
+Exported metrics (all prefixed ``rfcalc_``):
+
+    stage_rows_total            counter    trace points processed, by stage
+    stage_errors_total          counter    failed stage executions, by stage
+    stage_duration_seconds      histogram  time per stage execution, by stage
+    stage_rows_per_second       gauge      rows over accumulated stage time, by stage
+    cache_hits_total            counter    result cache hits, by cache
+    cache_misses_total          counter    result cache misses, by cache
+    stream_frames_total         counter    frames by outcome (received, forwarded, dropped)
+    stream_errors_total         counter    malformed or failed frames
+    stream_latency_seconds      histogram  receive-to-forward latency per frame
+
+``rfcalc-batch --metrics-file`` exports the stage metrics and ``rfcalc-stream serve --metrics`` the
+stream metrics. Neither command uses a `ResultCache`, so the cache metrics are available through
+`MetricsRegistry.add_cache` for applications that do.
+"""
+
+import math
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple, Optional, Protocol, Sequence, Union
+
+from UnitConverter.batch import Stage
+from UnitConverter.stream import LatencyHistogram, StreamConverter
+
+PREFIX = "rfcalc_"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Stage durations of a batch run range from microseconds (correcting a short trace) to minutes
+STAGE_EDGES = (
+    0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05,
+    0.1, 0.5, 1.0, 5.0, 10.0, 60.0,
+)
+
+
+class Sample(NamedTuple):
+    """One line of a metric family: ``<name><suffix>{labels} value``."""
+
+    suffix: str
+    labels: dict[str, str]
+    value: float
+
+
+class MetricFamily(NamedTuple):
+    """
+    A metric with its samples.
+
+    Attributes:
+        name (str): Metric name without `PREFIX`.
+        kind (str): ``counter``, ``gauge`` or ``histogram``.
+        help (str): One-line description.
+        samples (list[Sample]): Values of the metric, one per label set (and bucket).
+    """
+
+    name: str
+    kind: str
+    help: str
+    samples: list[Sample]
+
+
+class Collector(Protocol):
+    """Anything that yields metric families when the metrics are rendered."""
+
+    def collect(self) -> Iterable[MetricFamily]: ...
+
+
+def _histogram_samples(histogram: LatencyHistogram, labels: dict[str, str]) -> list[Sample]:
+    # The stream worker keeps recording while the metrics are served: derive every bucket and the
+    # count from one copy of the counts, so the buckets stay cumulative and end at the count
+    counts = list(histogram.counts)
+    total = histogram.total
+    samples = []
+    cumulative = 0
+    for edge, count in zip(histogram.edges, counts):
+        cumulative += count
+        samples.append(Sample("_bucket", {**labels, "le": _format_value(edge)}, cumulative))
+    samples.append(Sample("_bucket", {**labels, "le": "+Inf"}, sum(counts)))
+    samples.append(Sample("_sum", labels, total))
+    samples.append(Sample("_count", labels, sum(counts)))
+    return samples
+
+
+class StageMetrics:
+    """
+    Per-stage throughput, latency and error metrics of a `BatchRunner`; pass it as an observer.
+
+    Safe to share between runners on several threads.
+
+    Attributes:
+        edges (tuple[float, ...]): Upper bucket edges of the duration histograms in seconds.
+    """
+
+    def __init__(self, edges: Sequence[float] = STAGE_EDGES):
+        self.edges = tuple(edges)
+        self._lock = threading.Lock()
+        self._started: dict[int, float] = {}
+        self._rows: dict[str, int] = {}
+        self._errors: dict[str, int] = {}
+        self._durations: dict[str, LatencyHistogram] = {}
+
+    def stage_started(self, stage: Stage) -> None:
+        with self._lock:
+            self._started[id(stage)] = time.perf_counter()
+
+    def stage_finished(self, stage: Stage, error: Optional[BaseException]) -> None:
+        end = time.perf_counter()
+        with self._lock:
+            elapsed = end - self._started.pop(id(stage), end)
+            if stage.name not in self._durations:
+                self._durations[stage.name] = LatencyHistogram(self.edges)
+                self._rows[stage.name] = 0
+                self._errors[stage.name] = 0
+            self._durations[stage.name].record(elapsed)
+            self._rows[stage.name] += stage.rows
+            self._errors[stage.name] += error is not None
+
+    def rows_per_second(self, stage: str) -> float:
+        """Rows processed by `stage` per second spent in it; 0.0 before it ran."""
+        with self._lock:
+            seconds = self._durations[stage].total if stage in self._durations else 0.0
+            return self._rows[stage] / seconds if seconds else 0.0
+
+    def collect(self) -> Iterable[MetricFamily]:
+        with self._lock:
+            rows, errors, rates, durations = [], [], [], []
+            for name, histogram in self._durations.items():
+                labels = {"stage": name}
+                rows.append(Sample("", labels, self._rows[name]))
+                errors.append(Sample("", labels, self._errors[name]))
+                rate = self._rows[name] / histogram.total if histogram.total else 0.0
+                rates.append(Sample("", labels, rate))
+                durations.extend(_histogram_samples(histogram, labels))
+        yield MetricFamily("stage_rows_total", "counter", "Trace points processed per stage.", rows)
+        yield MetricFamily(
+            "stage_errors_total", "counter", "Stage executions that raised an error.", errors
+        )
+        yield MetricFamily(
+            "stage_duration_seconds", "histogram", "Time per stage execution.", durations
+        )
+        yield MetricFamily(
+            "stage_rows_per_second", "gauge", "Rows per second of accumulated stage time.", rates
+        )
+
+
+class CacheMetrics:
+    """
+    Hit and miss counters of a cache with `hits` and `misses` attributes, e.g. `ResultCache`.
+
+    Not registered by the command line tools, which use no cache; see `MetricsRegistry.add_cache`.
+    """
+
+    def __init__(self, cache: Any, name: str = "results"):
+        self.cache = cache
+        self.name = name
+
+    def collect(self) -> Iterable[MetricFamily]:
+        labels = {"cache": self.name}
+        yield MetricFamily(
+            "cache_hits_total", "counter", "Cache lookups that found a result.",
+            [Sample("", labels, self.cache.hits)],
+        )
+        yield MetricFamily(
+            "cache_misses_total", "counter", "Cache lookups that had to compute the result.",
+            [Sample("", labels, self.cache.misses)],
+        )
+
+
+class StreamMetrics:
+    """Frame counters and latency histogram of a `StreamConverter`."""
+
+    def __init__(self, stream: StreamConverter):
+        self.stream = stream
+
+    def collect(self) -> Iterable[MetricFamily]:
+        stream = self.stream
+        frames = [
+            Sample("", {"outcome": outcome}, getattr(stream, outcome))
+            for outcome in ("received", "forwarded", "dropped")
+        ]
+        yield MetricFamily("stream_frames_total", "counter", "Sweep frames by outcome.", frames)
+        yield MetricFamily(
+            "stream_errors_total", "counter", "Malformed frames and failed conversions.",
+            [Sample("", {}, stream.errors)],
+        )
+        yield MetricFamily(
+            "stream_latency_seconds", "histogram", "Time from receiving a frame to forwarding it.",
+            _histogram_samples(stream.latency, {}),
+        )
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render(families: Iterable[MetricFamily]) -> str:
+    """Render metric families in the Prometheus text exposition format."""
+    lines = []
+    for family in families:
+        name = PREFIX + family.name
+        lines.append(f"# HELP {name} {_escape(family.help)}")
+        lines.append(f"# TYPE {name} {family.kind}")
+        for sample in family.samples:
+            labels = ",".join(f'{key}="{_escape(str(value))}"' for key, value in sample.labels.items())
+            labels = f"{{{labels}}}" if labels else ""
+            lines.append(f"{name}{sample.suffix}{labels} {_format_value(sample.value)}")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsRegistry:
+    """
+    The collectors exported together as one set of metrics.
+
+    Attributes:
+        collectors (list[Collector]): Asked for their metrics on every `render`.
+    """
+
+    def __init__(self, collectors: Sequence[Collector] = ()):
+        self.collectors = list(collectors)
+
+    def register(self, collector: Collector) -> Collector:
+        """Add a collector and return it."""
+        self.collectors.append(collector)
+        return collector
+
+    def add_stages(self, edges: Sequence[float] = STAGE_EDGES) -> StageMetrics:
+        """Register and return a new `StageMetrics` observer."""
+        return self.register(StageMetrics(edges))
+
+    def add_cache(self, cache: Any, name: str = "results") -> CacheMetrics:
+        return self.register(CacheMetrics(cache, name))
+
+    def add_stream(self, stream: StreamConverter) -> StreamMetrics:
+        return self.register(StreamMetrics(stream))
+
+    def render(self) -> str:
+        """The current metrics in the Prometheus text exposition format."""
+        return render(family for collector in self.collectors for family in collector.collect())
+
+    def write_textfile(self, path: Union[str, Path]) -> None:
+        """
+        Write the metrics to `path` for node-exporter's textfile collector.
+
+        The file is written next to its destination and renamed into place, so the collector never
+        reads a partial file.
+        """
+        path = Path(path)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+                f.write(self.render())
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def serve(self, address: tuple[str, int] = ("127.0.0.1", 9464)) -> ThreadingHTTPServer:
+        """
+        Serve the metrics on ``http://<address>/metrics`` from a daemon thread.
+
+        Returns:
+            ThreadingHTTPServer: The running server; call `shutdown` and `server_close` to stop it.
+                `server_address` holds the bound port if port 0 was requested.
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(address, Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="rfcalc-metrics", daemon=True).start()
+        return server
@@ -0,0 +1,158 @@
+from typing import Mapping, NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+class EmissionList(NamedTuple):
+    """
+    Deduplicated peaks from several peak lists, sorted by frequency.
+
+    Attributes:
+        freq (np.ndarray): Frequency of the strongest detection of each emission (Hz).
+        level (np.ndarray): Level of the strongest detection.
+        source (np.ndarray): Name of the peak list the strongest detection came from.
+        count (np.ndarray): Number of detections merged into each emission.
+    """
+
+    freq: np.ndarray
+    level: np.ndarray
+    source: np.ndarray
+    count: np.ndarray
+
+
+def find_peaks(
+    level: ArrayLike, threshold: float = -np.inf, excursion: float = 0.0
+) -> np.ndarray:
+    """
+    Find the peaks of a trace that are above `threshold` and stand out by at least `excursion`.
+
+    A peak is a local maximum (the first sample of a flat top). Its excursion is the height it rises
+    above the higher of the two minima separating it from a higher peak on either side (or from the end
+    of the trace), i.e. the topographic prominence. This is what a receiver's peak excursion setting
+    measures: noise ripple on the slope of a large emission has a small excursion and is rejected.
+
+    Only local maxima at or above `threshold` are considered, so the work after the vectorized local
+    maximum search is linear in the number of candidate peaks, not in the trace length.
+
+    Args:
+        level (ArrayLike): The trace levels, e.g. in dBμV/m.
+        threshold (float, optional): Minimum peak level. Defaults to no threshold.
+        excursion (float, optional): Minimum excursion in the unit of `level`. Defaults to 0.
+
+    Returns:
+        np.ndarray: Indices of the peaks in ascending order.
+    """
+    level = np.asarray(level, dtype=np.float64)
+    if level.ndim != 1:
+        raise ValueError("level must be one-dimensional.")
+    if level.size < 3:
+        return np.empty(0, dtype=np.intp)
+
+    # Rising into the sample and not rising out of it; endpoints are never peaks
+    rising = level[1:] > level[:-1]
+    falling = level[1:] < level[:-1]
+    # A plateau counts as a peak when it is entered rising and left falling
+    candidates = np.flatnonzero(rising[:-1] & ~rising[1:]) + 1
+    if candidates.size == 0:
+        return candidates
+
+    candidates = candidates[level[candidates] >= threshold]
+    if candidates.size == 0:
+        return candidates
+    # Drop plateaus that run into the end of the trace or continue rising
+    changes = np.flatnonzero(rising | falling)
+    next_change = np.searchsorted(changes, candidates, side="left")
+    has_next = next_change < changes.size
+    candidates = candidates[has_next]
+    candidates = candidates[falling[changes[next_change[has_next]]]]
+    if candidates.size == 0 or excursion <= 0:
+        return candidates
+
+    peak_level = level[candidates]
+    # Minimum of the trace between consecutive candidates, before the first and after the last one
+    gaps = np.minimum.reduceat(level, candidates)[:-1]
+    head = level[: candidates[0]].min()
+    tail = level[candidates[-1] + 1 :].min()
+
+    left = _base_levels(peak_level, gaps, head)
+    right = _base_levels(peak_level[::-1], gaps[::-1], tail)[::-1]
+    prominence = peak_level - np.maximum(left, right)
+    return candidates[prominence >= excursion]
+
+
+def _base_levels(peak_level: np.ndarray, gaps: np.ndarray, head: float) -> np.ndarray:
+    """
+    For every peak, the minimum between it and the nearest higher peak to its left (or the start).
+
+    Uses a monotonic stack of [peak level, minimum from that peak up to the next stack entry]; the
+    bottom entry is a sentinel for the start of the trace. Every peak is pushed and popped once.
+    """
+    base = np.empty(peak_level.size)
+    stack = [[np.inf, head]]
+    for i, peak in enumerate(peak_level):
+        if i:
+            stack[-1][1] = min(stack[-1][1], gaps[i - 1])
+        acc = np.inf
+        while stack[-1][0] <= peak:
+            acc = min(acc, stack.pop()[1])
+        stack[-1][1] = min(stack[-1][1], acc)
+        base[i] = stack[-1][1]
+        stack.append([peak, np.inf])
+    return base
+
+
+def merge_peak_lists(
+    peak_lists: Mapping[str, tuple[ArrayLike, ArrayLike]], tolerance: float
+) -> EmissionList:
+    """
+    Merge peak lists from several antennas, polarizations or sessions into one emission list.
+
+    All peaks are pooled and sorted by frequency once (O(n log n)). Neighbouring peaks closer than
+    `tolerance` belong to the same emission; chains of such neighbours are merged as a whole. Each
+    emission is reported with its strongest detection and the name of the list it came from.
+
+    Args:
+        peak_lists (Mapping[str, tuple[ArrayLike, ArrayLike]]): Source name -> (freq, level) of its peaks.
+        tolerance (float): Maximum frequency gap between detections of the same emission (Hz).
+
+    Returns:
+        EmissionList: One entry per emission, sorted by frequency.
+
+    Raises:
+        ValueError: If `tolerance` is negative or a list's freq and level differ in length.
+    """
+    if tolerance < 0:
+        raise ValueError("tolerance must not be negative.")
+
+    names = list(peak_lists)
+    freqs, levels, sources = [], [], []
+    for code, name in enumerate(names):
+        freq, level = (np.asarray(a, dtype=np.float64) for a in peak_lists[name])
+        if freq.shape != level.shape:
+            raise ValueError(f"freq and level of '{name}' differ in length.")
+        freqs.append(freq.ravel())
+        levels.append(level.ravel())
+        sources.append(np.full(freq.size, code))
+
+    freq = np.concatenate(freqs) if freqs else np.empty(0)
+    level = np.concatenate(levels) if levels else np.empty(0)
+    source = np.concatenate(sources) if sources else np.empty(0, dtype=np.intp)
+    if freq.size == 0:
+        return EmissionList(freq, level, np.empty(0, dtype=object), np.empty(0, dtype=np.intp))
+
+    order = np.argsort(freq, kind="stable")
+    freq, level, source = freq[order], level[order], source[order]
+    cluster = np.concatenate(([0], np.cumsum(np.diff(freq) > tolerance)))
+
+    # Strongest detection first within each cluster
+    order = np.lexsort((-level, cluster))
+    first = order[np.flatnonzero(np.diff(cluster[order], prepend=-1))]
+    count = np.bincount(cluster)
+
+    return EmissionList(
+        freq=freq[first],
+        level=level[first],
+        source=np.array(names, dtype=object)[source[first]],
+        count=count,
+    )
@@ -0,0 +1,161 @@
+from typing import Any, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from UnitConverter.base_converter import BaseConverter, ConversionPlan, UnitEnum
+from UnitConverter.eirp_converter import EIRP, EIRPConverter
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter
+
+# Unit enum -> (converter, context keys its conversion functions accept). Field strength
+# conversions need no context; EIRP <-> field strength / power density need distance and slope.
+_CONVERTERS: dict[type, tuple[BaseConverter, tuple[str, ...]]] = {
+    FSUNIT: (FieldStrengthConverter(), ()),
+    EIRP: (EIRPConverter(), ("distance", "slope")),
+}
+
+
+class Quantity:
+    """
+    An array of values tagged with its unit and measurement context, converted lazily.
+
+    `to` does not touch the data: it only records the target unit. The conversion runs the first
+    time the values are read (`values`, `numpy.asarray(q)`, ...), and always from the original
+    buffer straight to the final unit, so a chain such as
+    ``q.to(FSUNIT.DBUV_PER_M).to(FSUNIT.DBUA_PER_M).to(FSUNIT.V_PER_M)`` costs one pass through
+    the base unit and allocates no intermediate arrays.
+
+    The context (distance in meters, slope in dB/decade) travels with the quantity. It is passed to
+    the conversion functions that need it (EIRP <-> field strength and power density) and kept as
+    metadata otherwise. Changing the context with `to` cannot be folded into the pending
+    conversion, so it starts a new step of the chain; the steps still run only on first read, the
+    later ones in place in the buffer allocated by the first.
+
+    Example:
+        >>> q = Quantity([40.0, 60.0], FSUNIT.DBUV_PER_M)
+        >>> q.to(FSUNIT.UV_PER_M).values
+        array([ 100., 1000.])
+
+    Attributes:
+        unit (UnitEnum): The unit of the values as read.
+        context (dict): Measurement context, e.g. ``{"distance": 3.0, "slope": 20.0}``.
+    """
+
+    def __init__(
+        self,
+        values: ArrayLike,
+        unit: UnitEnum,
+        distance: Optional[float] = None,
+        slope: float = 20.0,
+    ):
+        if type(unit) not in _CONVERTERS:
+            raise TypeError(f"Unsupported unit: {unit!r}")
+
+        self.unit = unit
+        self.context = {"slope": slope}
+        if distance is not None:
+            self.context["distance"] = distance
+
+        self._source = np.asarray(values, dtype=np.float64)
+        self._source_unit = unit
+        # Earlier steps of the chain, as (from_unit, to_unit, context), run before `plan`
+        self._steps: tuple[tuple[UnitEnum, UnitEnum, dict[str, Any]], ...] = ()
+        self._values: Optional[np.ndarray] = self._source
+
+    @classmethod
+    def _pending(
+        cls,
+        source: np.ndarray,
+        source_unit: UnitEnum,
+        unit: UnitEnum,
+        context: dict[str, Any],
+        steps: tuple = (),
+    ) -> "Quantity":
+        """A quantity whose values are `source` still to be run through `steps` and converted to `unit`."""
+        q = cls.__new__(cls)
+        q.unit = unit
+        q.context = context
+        q._source = source
+        q._source_unit = source_unit
+        q._steps = steps
+        q._values = source if not steps and unit == source_unit else None
+        return q
+
+    @staticmethod
+    def _plan(from_unit: UnitEnum, to_unit: UnitEnum, context: dict[str, Any]) -> ConversionPlan:
+        converter, context_keys = _CONVERTERS[type(to_unit)]
+        kwargs = {k: v for k, v in context.items() if k in context_keys}
+        return converter.plan(from_unit, to_unit, **kwargs)
+
+    @property
+    def plan(self) -> ConversionPlan:
+        """
+        The last conversion that reading the values will run: from the original buffer to `unit`,
+        or from the unit the context last changed in (see `plans`).
+        """
+        return self._plan(self._source_unit, self.unit, self.context)
+
+    @property
+    def plans(self) -> tuple[ConversionPlan, ...]:
+        """All conversions that reading the values will run, in order."""
+        steps = (*self._steps, (self._source_unit, self.unit, self.context))
+        return tuple(self._plan(*step) for step in steps if step[0] != step[1])
+
+    @property
+    def is_materialized(self) -> bool:
+        """True once the values in `unit` have been computed."""
+        return self._values is not None
+
+    @property
+    def values(self) -> np.ndarray:
+        """The values in `unit`; computed on first access and kept afterwards."""
+        if self._values is None:
+            values = self._source
+            for plan in self.plans:
+                # Only the first step allocates; the others convert that buffer in place
+                values = plan(values) if values is self._source else plan(values, out=values)
+            self._values = values
+        return self._values
+
+    def to(self, unit: UnitEnum, **context: Any) -> "Quantity":
+        """
+        Return this quantity expressed in `unit`, without converting anything yet, also when the
+        context changes.
+
+        Args:
+            unit (UnitEnum): Target unit, from the same unit enum as `self.unit`.
+            **context: Replacement context values (`distance`, `slope`) for the new quantity.
+
+        Returns:
+            Quantity: A new quantity sharing this quantity's buffer.
+
+        Raises:
+            TypeError: If `unit` belongs to a different unit enum.
+        """
+        if type(unit) is not type(self.unit):
+            raise TypeError("Invalid target unit.")
+
+        new_context = {**self.context, **context}
+        if new_context != self.context:
+            # The pending conversion was planned with the old context, so it cannot be
+            # merged with one that uses the new context: it becomes a step of its own.
+            steps = (*self._steps, (self._source_unit, self.unit, self.context))
+            return Quantity._pending(self._source, self.unit, unit, new_context, steps)
+        return Quantity._pending(self._source, self._source_unit, unit, new_context, self._steps)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._source.shape
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        values = self.values
+        if dtype is not None:
+            return values.astype(dtype, copy=bool(copy))
+        return values.copy() if copy else values
+
+    def __repr__(self) -> str:
+        state = "" if self.is_materialized else ", pending"
+        return f"Quantity(shape={self.shape}, unit={self.unit.value!r}, context={self.context}{state})"
@@ -0,0 +1,268 @@
+"""
+Registry of the available converters, loaded on first use.
+
+Besides the built-in converters, any installed package can contribute converters through the
+``rfcalc.converters`` entry point group, e.g. in its ``pyproject.toml``:
+
+    [project.entry-points."rfcalc.converters"]
+    antenna_gain = "rfcalc_lab.gain:AntennaGainConverter"
+
+Discovering entry points only reads package metadata; a converter's module is imported the first
+time the converter itself is requested with `ConverterRegistry.get`. The unit listing of every
+converter (what the GUI needs to fill its option menus) is cached in a JSON file, so a cold start
+does not import any converter either. Entries of entry point converters are keyed by the name and
+version of the distribution providing them, other entries by the modification time of the module.
+"""
+
+import importlib
+import json
+import os
+import tempfile
+import threading
+from importlib import metadata, util
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+
+from UnitConverter.base_converter import BaseConverter, UnitEnum
+
+ENTRY_POINT_GROUP = "rfcalc.converters"
+
+BUILTIN_CONVERTERS = {
+    "fs": "UnitConverter.rf_converter:FieldStrengthConverter",
+    "eirp": "UnitConverter.eirp_converter:EIRPConverter",
+}
+
+DEFAULT_CACHE_FILE = Path("~/.cache/rfcalc/units.json")
+
+
+class UnitInfo(NamedTuple):
+    """
+    A unit of a converter, described without importing it.
+
+    Attributes:
+        name (str): Name of the enum member, e.g. ``"DBUV_PER_M"``.
+        label (str): Its value as shown to users, e.g. ``"dBμV/m"``.
+    """
+
+    name: str
+    label: str
+
+
+def _entry_points(group: str) -> list:
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return list(entry_points.select(group=group))
+    # Python 3.9 returns a dict of groups
+    return list(entry_points.get(group, ()))
+
+
+def _dist_stamp(entry_point) -> Optional[str]:
+    """Name and version of the distribution providing `entry_point`, if known."""
+    dist = getattr(entry_point, "dist", None)  # Python 3.10+
+    if dist is None:
+        return None
+    try:
+        return f"{dist.metadata['Name']}=={dist.version}"
+    except (KeyError, TypeError):
+        return None
+
+
+def _stamp(target: str) -> Optional[str]:
+    """
+    Modification time and size of the file defining the module of `target`.
+
+    The module itself is not executed, but locating it imports its parent packages. Only the one
+    file is covered: changes to other modules the converter takes its units from are not seen.
+    """
+    try:
+        spec = util.find_spec(target.partition(":")[0])
+        stat = os.stat(spec.origin)
+    except (ImportError, AttributeError, TypeError, ValueError, OSError):
+        return None
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+class ConverterRegistry:
+    """
+    Converters by name, imported and instantiated on first use.
+
+    Converters are registered as ``"module:attribute"`` targets, from `builtins`, from the entry
+    points of `group` (which may add names but not replace a built-in) and with `register`. `get`
+    imports a converter once and then returns the same instance, which is safe as converters are
+    stateless.
+
+    Example:
+        >>> registry = ConverterRegistry()
+        >>> [unit.label for unit in registry.units("fs")]  # from the cache, nothing imported
+        ['V/m', 'μV/m', 'dBμV/m', ...]
+        >>> conv = registry.get("fs")
+        >>> conv.convert(60.0, registry.unit("fs", "dBμV/m"), registry.unit("fs", "μV/m"))
+        1000.0
+
+    Attributes:
+        group (str): Entry point group that is searched for converters.
+        cache_file (Path | None): JSON file with the cached unit listings; None disables the cache.
+    """
+
+    def __init__(
+        self,
+        group: Optional[str] = ENTRY_POINT_GROUP,
+        builtins: Optional[dict[str, str]] = None,
+        cache_file: Union[str, Path, None] = DEFAULT_CACHE_FILE,
+    ):
+        self.group = group
+        self.cache_file = None if cache_file is None else Path(cache_file).expanduser()
+        self._targets: dict[str, Union[str, type]] = dict(
+            BUILTIN_CONVERTERS if builtins is None else builtins
+        )
+        self._discovered = group is None
+        self._dist_stamps: dict[str, str] = {}
+        self._converters: dict[str, BaseConverter] = {}
+        self._units: dict[str, tuple[UnitInfo, ...]] = {}
+        self._cache: Optional[dict] = None
+        self._lock = threading.RLock()
+
+    def register(self, name: str, target: Union[str, type]) -> None:
+        """
+        Register a converter under `name`, replacing any converter of that name.
+
+        Args:
+            name (str): Name of the converter, e.g. ``"antenna_gain"``.
+            target (str | type): ``"module:attribute"`` to import on first use, or the converter
+                class itself.
+
+        Raises:
+            ValueError: If a target string is not of the form ``"module:attribute"``.
+        """
+        if isinstance(target, str) and not all(target.partition(":")[::2]):
+            raise ValueError(f"Invalid converter target {target!r}, expected 'module:attribute'.")
+        with self._lock:
+            self._targets[name] = target
+            self._dist_stamps.pop(name, None)
+            self._converters.pop(name, None)
+            self._units.pop(name, None)
+
+    def _discover(self) -> None:
+        if self._discovered:
+            return
+        with self._lock:
+            if self._discovered:
+                return
+            for entry_point in _entry_points(self.group):
+                if entry_point.name in self._targets:
+                    continue
+                self._targets[entry_point.name] = entry_point.value
+                stamp = _dist_stamp(entry_point)
+                if stamp is not None:
+                    self._dist_stamps[entry_point.name] = stamp
+            self._discovered = True
+
+    def names(self) -> list[str]:
+        """Names of all registered converters, without importing any of them."""
+        self._discover()
+        return list(self._targets)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names()
+
+    def is_loaded(self, name: str) -> bool:
+        """True once the converter `name` has been imported and instantiated."""
+        return name in self._converters
+
+    def _target(self, name: str) -> Union[str, type]:
+        self._discover()
+        try:
+            return self._targets[name]
+        except KeyError:
+            raise KeyError(f"Unknown converter {name!r}.") from None
+
+    def get(self, name: str) -> BaseConverter:
+        """
+        The converter registered as `name`, imported on the first call.
+
+        Raises:
+            KeyError: If no converter of that name is registered.
+            TypeError: If the target is not a `BaseConverter` subclass.
+        """
+        converter = self._converters.get(name)
+        if converter is not None:
+            return converter
+        with self._lock:
+            if name not in self._converters:
+                target = self._target(name)
+                if isinstance(target, str):
+                    module, _, attribute = target.partition(":")
+                    target = getattr(importlib.import_module(module), attribute)
+                if not (isinstance(target, type) and issubclass(target, BaseConverter)):
+                    raise TypeError(f"Converter {name!r} is not a BaseConverter subclass.")
+                self._converters[name] = target()
+            return self._converters[name]
+
+    def unit_enum(self, name: str) -> type:
+        """The unit enumeration of converter `name`; imports the converter."""
+        return type(self.get(name).base_unit)
+
+    def unit(self, name: str, unit: str) -> UnitEnum:
+        """
+        The unit of converter `name` with the given label or member name; imports the converter.
+
+        Raises:
+            ValueError: If the converter has no such unit.
+        """
+        for member in self.unit_enum(name):
+            if unit in (member.value, member.name):
+                return member
+        raise ValueError(f"Converter {name!r} has no unit {unit!r}.")
+
+    def units(self, name: str) -> tuple[UnitInfo, ...]:
+        """
+        The units of converter `name`, in enum order.
+
+        Served from memory or from the cache file while the distribution providing the converter
+        (for entry points) or the converter's module is unchanged; only otherwise is the converter
+        imported and the cache file updated.
+        """
+        units = self._units.get(name)
+        if units is not None:
+            return units
+        with self._lock:
+            target = self._target(name)
+            key = target if isinstance(target, str) else f"{target.__module__}:{target.__qualname__}"
+            stamp = self._dist_stamps.get(name) or _stamp(key)
+            entry = self._read_cache().get(name)
+            if stamp is not None and entry and entry.get("target") == key and entry.get("stamp") == stamp:
+                units = tuple(UnitInfo(*unit) for unit in entry["units"])
+            else:
+                units = tuple(UnitInfo(member.name, member.value) for member in self.unit_enum(name))
+                if stamp is not None:
+                    self._cache[name] = {"target": key, "stamp": stamp, "units": units}
+                    self._write_cache()
+            self._units[name] = units
+            return units
+
+    def _read_cache(self) -> dict:
+        if self._cache is None:
+            self._cache = {}
+            if self.cache_file is not None:
+                try:
+                    self._cache = json.loads(self.cache_file.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    pass
+        return self._cache
+
+    def _write_cache(self) -> None:
+        """Replace the cache file atomically; a read-only location only disables the cache."""
+        if self.cache_file is None:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f, ensure_ascii=False)
+            os.replace(tmp, self.cache_file)
+        except OSError:
+            pass
+
+
+# Shared by the GUI frames
+registry = ConverterRegistry()
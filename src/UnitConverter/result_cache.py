@@ -0,0 +1,294 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from UnitConverter.base_converter import BaseConverter, UnitEnum
+from UnitConverter.trace_io import parse_trace
+
+
+# File name prefix of the cache entries, so a shared directory keeps its other files
+_PREFIX = "rfcalc-"
+
+
+def _size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _param_repr(value: Any) -> str:
+    """Stable textual form of a cache key parameter that `json` cannot encode natively."""
+    if isinstance(value, Enum):
+        return f"{type(value).__name__}.{value.name}"
+    if isinstance(value, np.ndarray):
+        return hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()
+    return repr(value)
+
+
+def _converter_name(converter: BaseConverter) -> str:
+    """Fully qualified class name, so converters of the same name from different modules differ."""
+    cls = type(converter)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+class ResultCache:
+    """
+    Persistent, size-bounded on-disk cache for batch conversion results.
+
+    Every entry is keyed by a SHA-256 digest of the input content together with all parameters that
+    influence the result: converter, source and target unit, distance, slope and the versions of any
+    correction table involved. Re-running a campaign in which only one limit or one antenna table
+    changed therefore only recomputes the traces whose key actually changed; the rest is read back
+    from disk.
+
+    The converter is keyed by its class, which assumes its results do not depend on the instance.
+    Converters that declare otherwise with ``plan_cacheable = False`` bypass the cache in `convert`
+    and `convert_file`: they are converted on every call and count as neither hit nor miss.
+
+    Entries are stored as ``rfcalc-<key>.npy`` files in `directory`; other files in it are never
+    touched. Once their total size exceeds `max_bytes` the least recently used entries are removed.
+    The total is kept as a running count, so the directory is only rescanned when it goes over budget.
+
+    One cache can be shared by several threads (and processes): entries are written atomically and the
+    counters are updated under a lock.
+
+    Example:
+        >>> cache = ResultCache("~/.cache/rfcalc")
+        >>> freq, level = cache.convert_file(
+        ...     FieldStrengthConverter(), "scan.csv", FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M
+        ... )
+
+    Attributes:
+        directory (Path): Location of the cache entries.
+        max_bytes (int): Size budget for all entries together.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that had to be computed.
+    """
+
+    def __init__(
+        self, directory: Union[str, Path], max_bytes: int = 512 * 1024 * 1024
+    ):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive number.")
+
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Running size of all entries; None until the first store scans the directory
+        self._total: Optional[int] = None
+
+    @staticmethod
+    def make_key(content: bytes, **params: Any) -> str:
+        """
+        Build the cache key for `content` converted with `params`.
+
+        Args:
+            content (bytes): The raw input, e.g. the bytes of a trace file.
+            **params: Every parameter that influences the result. Enum members, arrays and other
+                non-JSON values are reduced to a stable textual form.
+
+        Returns:
+            str: Hex digest identifying the result.
+        """
+        digest = hashlib.sha256(content)
+        digest.update(b"\0")
+        digest.update(
+            json.dumps(params, sort_keys=True, default=_param_repr).encode("utf-8")
+        )
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """
+        Return the cached array for `key`, or None if there is no (readable) entry.
+        """
+        path = self._path(key)
+        try:
+            result = np.load(path, allow_pickle=False)
+            # Touch the entry so eviction sees it as recently used
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return result
+
+    def put(self, key: str, array: ArrayLike) -> None:
+        """
+        Store `array` under `key` and evict old entries if the size budget is exceeded.
+
+        The entry is written to a temporary file first and then renamed, so a concurrent reader never
+        sees a partially written result.
+        """
+        path = self._path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=_PREFIX, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, np.asarray(array), allow_pickle=False)
+            size = os.stat(tmp_path).st_size
+            replaced = _size(path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            if self._total is None:
+                self._total = self.size()
+            else:
+                self._total += size - replaced
+            over = self._total > self.max_bytes
+        if over:
+            self._evict()
+
+    def get_or_compute(self, key: str, compute: Callable[[], ArrayLike]) -> np.ndarray:
+        """
+        Return the cached array for `key`, calling `compute` and storing its result on a miss.
+
+        This is the generic entry point used for results that are not plain unit conversions,
+        e.g. a trace interpolated against a correction table.
+        """
+        result = self.get(key)
+        if result is None:
+            result = np.asarray(compute())
+            self.put(key, result)
+        return result
+
+    def convert(
+        self,
+        converter: BaseConverter,
+        values: ArrayLike,
+        from_unit: UnitEnum,
+        to_unit: UnitEnum,
+        versions: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """
+        Cached counterpart of `BaseConverter.convert_array`.
+
+        Args:
+            converter (BaseConverter): The converter to use on a miss.
+            values (ArrayLike): The values to convert.
+            from_unit (UnitEnum): The unit of the input values.
+            to_unit (UnitEnum): The unit to convert the values to.
+            versions (dict, optional): Extra key material that is not a conversion argument,
+                e.g. ``{"antenna_table": "AF-2024-03"}``.
+            **kwargs: Conversion arguments such as `distance` and `slope`.
+
+        Returns:
+            np.ndarray: The converted values.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if not converter.plan_cacheable:
+            return converter.convert_array(values, from_unit, to_unit, **kwargs)
+        key = self.make_key(
+            values.tobytes(),
+            converter=_converter_name(converter),
+            from_unit=from_unit,
+            to_unit=to_unit,
+            versions=versions or {},
+            kwargs=kwargs,
+        )
+        return self.get_or_compute(
+            key, lambda: converter.convert_array(values, from_unit, to_unit, **kwargs)
+        )
+
+    def convert_file(
+        self,
+        converter: BaseConverter,
+        path: Union[str, Path],
+        from_unit: UnitEnum,
+        to_unit: UnitEnum,
+        versions: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Read a trace file and convert its level column, keyed on the file content.
+
+        On a hit the file is only read and hashed, not parsed or converted.
+
+        Args:
+            converter (BaseConverter): The converter to use on a miss.
+            path (str | Path): Two-column trace file, see `trace_io.parse_trace`.
+            from_unit (UnitEnum): The unit of the level column.
+            to_unit (UnitEnum): The unit to convert the level column to.
+            versions (dict, optional): Extra key material that is not a conversion argument.
+            **kwargs: Conversion arguments such as `distance` and `slope`.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Frequency and converted level.
+        """
+        content = Path(path).read_bytes()
+
+        def compute():
+            freq, level = parse_trace(content)
+            return np.stack(
+                (freq, converter.convert_array(level, from_unit, to_unit, **kwargs))
+            )
+
+        if not converter.plan_cacheable:
+            result = compute()
+            return result[0], result[1]
+        key = self.make_key(
+            content,
+            converter=_converter_name(converter),
+            from_unit=from_unit,
+            to_unit=to_unit,
+            versions=versions or {},
+            kwargs=kwargs,
+        )
+        result = self.get_or_compute(key, compute)
+        return result[0], result[1]
+
+    def size(self) -> int:
+        """Total size in bytes of all entries currently in the cache."""
+        return sum(size for _, size, _ in self._entries())
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        for _, _, path in self._entries():
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._total = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{_PREFIX}{key}.npy"
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """(mtime, size, path) of every entry; entries removed concurrently are skipped."""
+        entries = []
+        for path in self.directory.glob(f"{_PREFIX}*.npy"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits in `max_bytes`."""
+        # Rescan rather than trust the running total: other processes may share the directory
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total > self.max_bytes:
+            for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+                path.unlink(missing_ok=True)
+                total -= size
+                if total <= self.max_bytes:
+                    break
+        with self._lock:
+            self._total = total
@@ -1,8 +1,7 @@
-import math
 from typing import Dict, Callable
 
-from src.UnitConverter.base_converter import BaseConverter, UnitEnum
-from src.UnitConverter.rf_util import log_20, inverse_log_20
+from UnitConverter.base_converter import BaseConverter, UnitEnum
+from UnitConverter.rf_util import log_10, log_20, inverse_log_20
 
 
 class FSUNIT(UnitEnum):
@@ -40,6 +39,7 @@ class FieldStrengthConverter(BaseConverter):
                          convert values *to* the base unit.
         _from_base (dict): Dictionary mapping FSUNIT to conversion functions that
                            convert values *from* the base unit.
+        _db_offsets (dict): Units that are a constant dB offset from the base unit.
 
     Example:
         >>> converter = FieldStrengthConverter()
@@ -61,8 +61,8 @@ class FieldStrengthConverter(BaseConverter):
             FSUNIT.UA_PER_M: lambda x: log_20(x) + 51.5,
             FSUNIT.DBPT: lambda x: x + 49.5,
             FSUNIT.PT: lambda x: log_20(x) + 49.5,
-            FSUNIT.MW_PER_CM_SQ: lambda x: log_20((math.sqrt(x * 377 * 10)) * 1e6),
-            FSUNIT.W_PER_M_SQ: lambda x: log_20((math.sqrt(x * 377)) * 1e6),
+            FSUNIT.MW_PER_CM_SQ: lambda x: log_10(x * 377 * 10) + 120,
+            FSUNIT.W_PER_M_SQ: lambda x: log_10(x * 377) + 120,
             FSUNIT.Tesla: lambda x: log_20(x * 1e12) + 49.5,
             FSUNIT.Gauss: lambda x: log_20(x * 1e8) + 49.5,
         }
@@ -86,3 +86,10 @@ class FieldStrengthConverter(BaseConverter):
             FSUNIT.Tesla: lambda x: inverse_log_20(x - 49.5) / 1e12,
             FSUNIT.Gauss: lambda x: inverse_log_20(x - 49.5) / 1e8,
         }
+
+    @property
+    def _db_offsets(self) -> Dict[UnitEnum, float]:
+        return {
+            FSUNIT.DBUA_PER_M: 51.5,
+            FSUNIT.DBPT: 49.5,
+        }
@@ -1,14 +1,50 @@
+from functools import lru_cache
 from math import log10, tan, radians
 
+import numpy as np
+from numpy.typing import ArrayLike
+
+from UnitConverter import fast_math
+
+# Test distances (m) and distance extrapolation slopes (dB/decade) looked up during test planning
+COMMON_DISTANCES = (1.0, 3.0, 5.0, 10.0, 30.0)
+COMMON_SLOPES = (20.0, 40.0)
+
+
+def _log10(value):
+    """log10 for both scalars and NumPy arrays (the batch conversion path)."""
+    if isinstance(value, np.ndarray):
+        if fast_math.is_approximate():
+            return fast_math.log10(value)
+        return np.log10(value)
+    return log10(value)
+
+
+def _exp10(value):
+    """10**value for both scalars and NumPy arrays (the batch conversion path)."""
+    if isinstance(value, np.ndarray) and fast_math.is_approximate():
+        return fast_math.exp10(value)
+    return pow(10, value)
+
 
 def log_20(value):
     """Log value for voltage and current in 50ohm system"""
-    return 20 * log10(value)
+    return 20 * _log10(value)
 
 
 def inverse_log_20(value):
     """Inverse Log value for voltage and current in 50ohm system"""
-    return pow(10, value / 20)
+    return _exp10(value / 20)
+
+
+def log_10(value):
+    """Log value for power"""
+    return 10 * _log10(value)
+
+
+def inverse_log_10(value):
+    """Inverse Log value for power"""
+    return _exp10(value / 10)
 
 
 def interpolate(
@@ -60,6 +96,72 @@ def interpolate(
     return interpolated_amp
 
 
+def merge_index(freq: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """
+    Count, for every point of `target`, how many points of `freq` are less than or equal to it.
+
+    Both arrays must be sorted in ascending order. The result equals
+    ``numpy.searchsorted(freq, target, side="right")`` but is computed with one stable sort of the
+    concatenated arrays. The stable sort detects the two presorted runs and merges them in a single
+    linear pass, instead of running a binary search for every target point.
+
+    Args:
+        freq (np.ndarray): Sorted reference points.
+        target (np.ndarray): Sorted query points.
+
+    Returns:
+        np.ndarray: Integer array with the same length as `target`.
+    """
+    freq = np.asarray(freq)
+    target = np.asarray(target)
+    order = np.argsort(np.concatenate((freq, target)), kind="stable")
+    is_target = order >= freq.size
+    return np.cumsum(~is_target)[is_target]
+
+
+def interpolate_sorted(
+    freq: np.ndarray, amp: np.ndarray, target_freq: np.ndarray
+) -> np.ndarray:
+    """
+    Linearly interpolate a whole trace at many target frequencies in one pass.
+
+    This is the batch counterpart of `interpolate`: `freq`/`amp` describe a trace (or a correction
+    table) with strictly increasing frequencies, `target_freq` the sorted frequencies to evaluate it
+    at. The segment of every target point is found with `merge_index`.
+
+    Args:
+        freq (np.ndarray): Strictly increasing frequencies of the known points (Hz).
+        amp (np.ndarray): Amplitudes at `freq`.
+        target_freq (np.ndarray): Sorted frequencies at which to interpolate (Hz).
+
+    Returns:
+        np.ndarray: Interpolated amplitudes; NaN for target frequencies outside ``[freq[0], freq[-1]]``.
+
+    Raises:
+        ValueError: If fewer than two points are given, `freq` and `amp` differ in length, or `freq`
+            is not strictly increasing.
+    """
+    freq = np.asarray(freq, dtype=np.float64)
+    amp = np.asarray(amp, dtype=np.float64)
+    target_freq = np.asarray(target_freq, dtype=np.float64)
+
+    if freq.shape != amp.shape or freq.ndim != 1:
+        raise ValueError("freq and amp must be one-dimensional and of the same length.")
+    if freq.size < 2:
+        raise ValueError("At least two points are required for interpolation.")
+    if np.any(np.diff(freq) <= 0):
+        raise ValueError("freq must be strictly increasing.")
+
+    segment = np.clip(merge_index(freq, target_freq) - 1, 0, freq.size - 2)
+    f1 = freq[segment]
+    a1 = amp[segment]
+    result = a1 + (amp[segment + 1] - a1) * (
+        (target_freq - f1) / (freq[segment + 1] - f1)
+    )
+    result[(target_freq < freq[0]) | (target_freq > freq[-1])] = np.nan
+    return result
+
+
 def limit_convert(d1: float, d2: float, l1: float, slope: float) -> float:
     """
     Calculate the limit conversion using the formula:
@@ -92,6 +194,63 @@ def limit_convert(d1: float, d2: float, l1: float, slope: float) -> float:
     return l1 + (slope * log10(d1 / d2))
 
 
+def limit_convert_matrix(
+    limits: ArrayLike,
+    distances: ArrayLike = COMMON_DISTANCES,
+    slopes: ArrayLike = COMMON_SLOPES,
+) -> np.ndarray:
+    """
+    Convert every limit between every pair of distances for every slope, in one call.
+
+    The vectorized counterpart of `limit_convert`:
+    ``result[s, k, i, j] = limits[k] + slopes[s] * log10(distances[i] / distances[j])``, i.e. the
+    limit at ``distances[j]`` for a limit of ``limits[k]`` specified at ``distances[i]``.
+
+    Results are cached per input set, so repeated lookups (e.g. redrawing the planning table) cost a
+    dictionary lookup. The returned array is shared and therefore read-only.
+
+    Args:
+        limits (ArrayLike): Limit values at the specified distance.
+        distances (ArrayLike, optional): Distances (m). Defaults to `COMMON_DISTANCES`.
+        slopes (ArrayLike, optional): Slopes (dB/decade). Defaults to `COMMON_SLOPES`.
+
+    Returns:
+        np.ndarray: Read-only array of shape ``(len(slopes), len(limits), len(distances),
+        len(distances))``.
+
+    Raises:
+        ValueError: If a distance is not a positive number.
+        TypeError: If an input is not a number or a sequence of numbers.
+    """
+    limits = _float_tuple("limits", limits)
+    distances = _float_tuple("distances", distances)
+    slopes = _float_tuple("slopes", slopes)
+    if not all(d > 0 for d in distances):
+        raise ValueError("distances must be positive numbers.")
+    return _limit_matrix(limits, distances, slopes)
+
+
+def _float_tuple(name: str, values: ArrayLike) -> tuple[float, ...]:
+    array = np.atleast_1d(np.asarray(values))
+    if array.ndim != 1 or array.dtype.kind not in "iuf":
+        raise TypeError(f"{name} must be a number or a sequence of numbers.")
+    return tuple(array.astype(np.float64).tolist())
+
+
+@lru_cache(maxsize=128)
+def _limit_matrix(
+    limits: tuple[float, ...], distances: tuple[float, ...], slopes: tuple[float, ...]
+) -> np.ndarray:
+    log_d = np.log10(distances)
+    ratio = log_d[:, np.newaxis] - log_d[np.newaxis, :]
+    result = (
+        np.asarray(limits)[np.newaxis, :, np.newaxis, np.newaxis]
+        + np.asarray(slopes)[:, np.newaxis, np.newaxis, np.newaxis] * ratio
+    )
+    result.setflags(write=False)
+    return result
+
+
 def antenna_eut_distance(beamwidth: float, eut_height: float) -> float:
     """
     Calculate the horizontal distance between an antenna and the Equipment Under Test (EUT)
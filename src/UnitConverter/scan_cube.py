@@ -0,0 +1,266 @@
+"""
+Memory-mapped data cube of a final radiated scan.
+
+A final scan measures a full spectrum at every turntable azimuth, mast height and antenna
+polarization. The levels are stored as one ``(azimuth, height, polarization, freq)`` array in a `.npy`
+file that is memory mapped, so a capture of several GB is written trace by trace and reduced without
+ever being loaded: only the pages of the block currently processed are resident. The axes and the
+unit are kept in a JSON file next to it (``scan.npy`` -> ``scan.json``).
+
+Example:
+    >>> cube = ScanCube.create("scan.npy", azimuth=range(0, 360, 15), height=[1, 2, 3, 4],
+    ...                        polarization=["H", "V"], freq=freq)
+    >>> for a, h, p, level in receiver.final_scan():
+    ...     cube.data[a, h, p] = level
+    >>> cube.flush()
+    >>> peak = ScanCube.open("scan.npy").peak(FSUNIT.UV_PER_M)
+    >>> peak.level, peak.azimuth, peak.height, peak.polarization
+"""
+
+import json
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
+
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter
+
+AXES = ("azimuth", "height", "polarization", "freq")
+DEFAULT_CHUNK = 1 << 20
+
+
+class CubePeak(NamedTuple):
+    """
+    Maximum of a scan cube per frequency and where it was measured.
+
+    Frequencies at which every position is NaN have a NaN level and azimuth/height, an empty
+    polarization and a position of -1.
+
+    Attributes:
+        freq (np.ndarray): Frequency axis (Hz).
+        level (np.ndarray): Maximum level over all positions.
+        azimuth (np.ndarray): Turntable azimuth of the maximum (deg).
+        height (np.ndarray): Antenna height of the maximum (m).
+        polarization (np.ndarray): Antenna polarization of the maximum.
+        position (np.ndarray): Flat index of the maximum over the first three axes, for
+            `numpy.unravel_index` with ``cube.shape[:3]``.
+    """
+
+    freq: np.ndarray
+    level: np.ndarray
+    azimuth: np.ndarray
+    height: np.ndarray
+    polarization: np.ndarray
+    position: np.ndarray
+
+
+def _meta_path(path: Path) -> Path:
+    return path.with_suffix(".json")
+
+
+class ScanCube:
+    """
+    Levels of a final radiated scan over azimuth x height x polarization x frequency.
+
+    All processing runs over blocks of about `chunk_size` values of the memory-mapped array, in file
+    order, so every page is read once and memory stays bounded by one block however large the cube.
+
+    Attributes:
+        data (np.ndarray): The levels, shape ``(azimuth, height, polarization, freq)``; a `numpy.memmap`
+            for cubes created or opened from a file.
+        azimuth (np.ndarray): Turntable azimuths (deg).
+        height (np.ndarray): Antenna heights (m).
+        polarization (np.ndarray): Antenna polarizations, e.g. ``["H", "V"]``.
+        freq (np.ndarray): Frequencies (Hz).
+        unit (FSUNIT): Unit of the levels.
+        path (Path | None): The `.npy` file, if the cube is backed by one.
+    """
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        azimuth: ArrayLike,
+        height: ArrayLike,
+        polarization: Sequence[str],
+        freq: ArrayLike,
+        unit: FSUNIT = FSUNIT.DBUV_PER_M,
+        path: Optional[Path] = None,
+    ):
+        self.azimuth = np.asarray(azimuth, dtype=np.float64)
+        self.height = np.asarray(height, dtype=np.float64)
+        self.polarization = np.asarray(polarization, dtype=str)
+        self.freq = np.asarray(freq, dtype=np.float64)
+        shape = (self.azimuth.size, self.height.size, self.polarization.size, self.freq.size)
+        if data.shape != shape:
+            raise ValueError(f"data has shape {data.shape}, expected {shape} from the axes.")
+        if not isinstance(unit, FSUNIT):
+            raise TypeError("unit must be a field strength unit.")
+        self.data = data
+        self.unit = unit
+        self.path = path
+
+    @classmethod
+    def create(
+        cls,
+        path: Union[str, Path],
+        azimuth: ArrayLike,
+        height: ArrayLike,
+        polarization: Sequence[str],
+        freq: ArrayLike,
+        unit: FSUNIT = FSUNIT.DBUV_PER_M,
+        dtype: DTypeLike = np.float32,
+    ) -> "ScanCube":
+        """
+        Create a file-backed cube filled with NaN, to be written position by position.
+
+        float32 is the default as it keeps levels to well below 0.001 dB at half the file size.
+
+        Raises:
+            TypeError: If `dtype` is not float32/float64 or `unit` is not an `FSUNIT`.
+        """
+        path = Path(path)
+        dtype = np.dtype(dtype)
+        if dtype not in (np.dtype(np.float32), np.dtype(np.float64)):
+            raise TypeError("dtype must be float32 or float64.")
+        axes = [
+            np.asarray(azimuth, dtype=np.float64),
+            np.asarray(height, dtype=np.float64),
+            np.asarray(polarization, dtype=str),
+            np.asarray(freq, dtype=np.float64),
+        ]
+        if not isinstance(unit, FSUNIT):
+            raise TypeError("unit must be a field strength unit.")
+        data = np.lib.format.open_memmap(
+            path, mode="w+", dtype=dtype, shape=tuple(axis.size for axis in axes)
+        )
+        data.fill(np.nan)
+        cube = cls(data, *axes, unit=unit, path=path)
+        cube._write_meta()
+        return cube
+
+    @classmethod
+    def open(cls, path: Union[str, Path], mode: str = "r") -> "ScanCube":
+        """Open a cube written by `create`; ``mode="r+"`` to modify it in place."""
+        path = Path(path)
+        meta = json.loads(_meta_path(path).read_text(encoding="utf-8"))
+        data = np.load(path, mmap_mode=mode)
+        return cls(
+            data, *(meta[axis] for axis in AXES), unit=FSUNIT[meta["unit"]], path=path
+        )
+
+    def _write_meta(self) -> None:
+        meta = {axis: getattr(self, axis).tolist() for axis in AXES}
+        meta["unit"] = self.unit.name
+        _meta_path(self.path).write_text(json.dumps(meta), encoding="utf-8")
+
+    @property
+    def shape(self) -> tuple[int, int, int, int]:
+        return self.data.shape
+
+    def flush(self) -> None:
+        """Write pending changes of a file-backed cube to disk."""
+        if isinstance(self.data, np.memmap):
+            self.data.flush()
+
+    def blocks(
+        self, chunk_size: int = DEFAULT_CHUNK
+    ) -> Iterator[tuple[slice, slice, np.ndarray]]:
+        """
+        Yield ``(positions, freqs, block)`` over the cube in file order.
+
+        `block` is a contiguous 2-D view ``data[positions, freqs]`` of the cube reshaped to
+        ``(azimuth * height * polarization, freq)``: whole spectra of consecutive positions, or parts of
+        a single spectrum if one spectrum has more than `chunk_size` points.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive.")
+        if not self.data.size:
+            return
+        n_positions, n_freq = int(np.prod(self.shape[:3])), self.shape[3]
+        flat = self.data.reshape(n_positions, n_freq)
+        rows = max(chunk_size // max(n_freq, 1), 1)
+        cols = min(n_freq, chunk_size)
+        for first in range(0, n_positions, rows):
+            positions = slice(first, min(first + rows, n_positions))
+            for start in range(0, n_freq, cols):
+                freqs = slice(start, min(start + cols, n_freq))
+                yield positions, freqs, flat[positions, freqs]
+
+    def peak(
+        self, to_unit: Optional[FSUNIT] = None, chunk_size: int = DEFAULT_CHUNK
+    ) -> CubePeak:
+        """
+        Maximum level per frequency over all positions, with the azimuth, height and polarization of
+        the maximum, in a single pass over the cube.
+
+        The search runs in the stored unit and only the resulting spectrum is converted to `to_unit`:
+        every field strength conversion is increasing, so the position of the maximum is the same in
+        any unit. NaN levels (positions not measured) are skipped; ties keep the first position.
+
+        Args:
+            to_unit (FSUNIT, optional): Unit of the returned levels. Defaults to the stored unit.
+            chunk_size (int, optional): Values per block.
+        """
+        n_freq = self.shape[3]
+        best = np.full(n_freq, -np.inf)
+        position = np.full(n_freq, -1, dtype=np.int64)
+        buffer = np.empty(min(chunk_size, self.data.size) or 1)
+
+        for positions, freqs, block in self.blocks(chunk_size):
+            work = buffer[: block.size].reshape(block.shape)
+            np.copyto(work, block)
+            np.copyto(work, -np.inf, where=np.isnan(work))
+            rows = work.argmax(axis=0)
+            level = work[rows, np.arange(work.shape[1])]
+            better = level > best[freqs]
+            best[freqs] = np.where(better, level, best[freqs])
+            position[freqs] = np.where(better, rows + positions.start, position[freqs])
+
+        found = position >= 0
+        level = np.where(found, best, np.nan)
+        if to_unit is not None and to_unit != self.unit:
+            level = FieldStrengthConverter().convert_array(level, self.unit, to_unit)
+        a, h, p = np.unravel_index(np.where(found, position, 0), self.shape[:3])
+        return CubePeak(
+            self.freq,
+            level,
+            np.where(found, self.azimuth[a], np.nan),
+            np.where(found, self.height[h], np.nan),
+            np.where(found, self.polarization[p], ""),
+            position,
+        )
+
+    def convert(
+        self,
+        path: Union[str, Path],
+        to_unit: FSUNIT,
+        dtype: Optional[DTypeLike] = None,
+        chunk_size: int = DEFAULT_CHUNK,
+    ) -> "ScanCube":
+        """
+        Convert the whole cube to `to_unit` into a new file-backed cube, block by block.
+
+        Every block is converted straight into the memory-mapped output with one cached
+        `ConversionPlan`, so neither cube is ever held in memory.
+
+        Args:
+            path (str | Path): The new `.npy` file.
+            to_unit (FSUNIT): Unit of the new cube.
+            dtype (DTypeLike, optional): float32 or float64; defaults to the dtype of this cube.
+            chunk_size (int, optional): Values per block.
+        """
+        dtype = self.data.dtype if dtype is None else dtype
+        result = ScanCube.create(
+            path, self.azimuth, self.height, self.polarization, self.freq, to_unit, dtype
+        )
+        plan = FieldStrengthConverter().plan(self.unit, to_unit)
+        flat = result.data.reshape(-1, self.shape[3])
+        for positions, freqs, block in self.blocks(chunk_size):
+            plan(block, out=flat[positions, freqs])
+        result.flush()
+        return result
+
+    def __repr__(self) -> str:
+        a, h, p, f = self.shape
+        return f"ScanCube({a} azimuths x {h} heights x {p} polarizations x {f} points, {self.unit.value})"
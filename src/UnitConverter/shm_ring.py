@@ -0,0 +1,331 @@
+import os
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import NamedTuple, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
+
+from UnitConverter.base_converter import ConversionPlan
+
+_MAGIC = int.from_bytes(b"RFRING01", "little")
+# int64 words at the start of the block: magic, n_slots, n_points, itemsize, count, tracker id
+_HEADER_WORDS = 8
+_UNIT_BYTES = 64
+# Per slot int64 metadata: seqlock, sweep sequence, number of points
+_META_WORDS = 3
+_ALIGN = 64
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _tracker_id() -> int:
+    """
+    Identity of the resource tracker this process reports to, 0 if there is none.
+
+    Forked and spawned children inherit the pipe to their parent's tracker (but not its pid), so the
+    inode of that pipe identifies the tracker across processes.
+    """
+    fd = getattr(resource_tracker._resource_tracker, "_fd", None)
+    if fd is None:
+        return 0
+    try:
+        return os.fstat(fd).st_ino
+    except OSError:
+        return 0
+
+
+class Sweep(NamedTuple):
+    """
+    One sweep read from a `SharedTraceRing`.
+
+    Attributes:
+        index (int): Position of the sweep in the ring's history, counting from 0.
+        sequence (int): Sweep counter given by the publisher.
+        timestamp (float): Time of the sweep given by the publisher.
+        levels (np.ndarray): The converted levels.
+    """
+
+    index: int
+    sequence: int
+    timestamp: float
+    levels: np.ndarray
+
+
+class SharedTraceRing:
+    """
+    Ring buffer of converted sweeps in shared memory, written by one process and read by many.
+
+    The publisher creates the ring with `create` and writes each sweep straight into the next slot,
+    optionally converting it on the way with ``plan(values, out=slot)``. Consumers (display, logger,
+    limit checker, ...) `attach` by name and read the slots in place: nothing is pickled, piped or
+    copied between processes.
+
+    Every published sweep gets an index, counting from 0. A slot is guarded by a sequence lock: the
+    publisher sets it to ``2 * index + 1`` before writing and to ``2 * index + 2`` after, so a reader
+    can tell whether the slot still holds the sweep it wants and whether it was overwritten while
+    reading. Readers never block the publisher; a reader that falls more than `n_slots` sweeps behind
+    gets an `IndexError` and continues from `latest`.
+
+    Example:
+        >>> ring = SharedTraceRing.create("prescan", n_slots=16, n_points=1001, unit="dBμV/m")
+        >>> ring.publish(sweep, plan=plan)          # publisher process
+        >>> ring = SharedTraceRing.attach("prescan")  # consumer process
+        >>> ring.wait(ring.latest + 1) and ring.read(ring.latest)
+
+    There must be exactly one publisher per ring.
+
+    Attributes:
+        name (str): Name of the shared memory block.
+        n_slots (int): Number of sweeps kept.
+        n_points (int): Largest number of points per sweep.
+        unit (str): Unit of the published levels, as set by the publisher.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self._shm = shm
+        self._owner = owner
+        buf = shm.buf
+
+        self._header = np.ndarray((_HEADER_WORDS,), dtype=np.int64, buffer=buf)
+        magic, n_slots, n_points, itemsize = self._header[:4]
+        if magic != _MAGIC:
+            raise ValueError(f"'{shm.name}' is not a shared trace ring.")
+
+        self.name = shm.name
+        self.n_slots = int(n_slots)
+        self.n_points = int(n_points)
+        self.dtype = np.dtype(np.float32 if itemsize == 4 else np.float64)
+
+        offset = _HEADER_WORDS * 8
+        self.unit = bytes(buf[offset : offset + _UNIT_BYTES]).rstrip(b"\0").decode("utf-8")
+        offset += _UNIT_BYTES
+        self._meta = np.ndarray(
+            (self.n_slots, _META_WORDS), dtype=np.int64, buffer=buf, offset=offset
+        )
+        offset += self._meta.nbytes
+        self._stamps = np.ndarray((self.n_slots,), dtype=np.float64, buffer=buf, offset=offset)
+        offset = _aligned(offset + self._stamps.nbytes)
+        self._data = np.ndarray(
+            (self.n_slots, self.n_points), dtype=self.dtype, buffer=buf, offset=offset
+        )
+
+    @classmethod
+    def create(
+        cls,
+        name: Optional[str],
+        n_slots: int,
+        n_points: int,
+        unit: str = "",
+        dtype: DTypeLike = np.float64,
+    ) -> "SharedTraceRing":
+        """
+        Create a new ring as its publisher.
+
+        Args:
+            name (str | None): Name of the shared memory block; None lets the OS pick one (see `name`).
+            n_slots (int): Number of sweeps kept for slow readers.
+            n_points (int): Largest number of points per sweep.
+            unit (str, optional): Unit of the published levels, e.g. ``FSUNIT.DBUV_PER_M.value``.
+            dtype (DTypeLike, optional): float32 or float64. Defaults to float64.
+
+        Raises:
+            ValueError: If a size is not positive, the dtype is not a float type or the unit is too long.
+            FileExistsError: If a block with this name already exists.
+        """
+        if n_slots <= 0 or n_points <= 0:
+            raise ValueError("n_slots and n_points must be positive numbers.")
+        dtype = np.dtype(dtype)
+        if dtype not in (np.dtype(np.float32), np.dtype(np.float64)):
+            raise ValueError("dtype must be float32 or float64.")
+        unit_bytes = unit.encode("utf-8")
+        if len(unit_bytes) > _UNIT_BYTES:
+            raise ValueError(f"unit must fit in {_UNIT_BYTES} bytes.")
+
+        meta_end = _HEADER_WORDS * 8 + _UNIT_BYTES + n_slots * (_META_WORDS + 1) * 8
+        size = _aligned(meta_end) + n_slots * n_points * dtype.itemsize
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        header = np.ndarray((_HEADER_WORDS,), dtype=np.int64, buffer=shm.buf)
+        header[:] = 0
+        header[:4] = (_MAGIC, n_slots, n_points, dtype.itemsize)
+        # Creating the block registered it with the resource tracker, which is now running
+        header[5] = _tracker_id()
+        offset = _HEADER_WORDS * 8
+        shm.buf[offset : offset + _UNIT_BYTES] = unit_bytes.ljust(_UNIT_BYTES, b"\0")
+        del header
+
+        ring = cls(shm, owner=True)
+        ring._meta[:] = 0
+        return ring
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedTraceRing":
+        """
+        Attach to an existing ring as a consumer.
+
+        Raises:
+            FileNotFoundError: If no block with this name exists.
+            ValueError: If the block is not a shared trace ring.
+        """
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+            return cls(shm, owner=False)
+
+        # Before 3.13 attaching registers the block with the resource tracker, so a consumer with a
+        # tracker of its own (e.g. a spawned process) would unlink the publisher's block on exit.
+        # Undo that registration, but only then: a consumer sharing the publisher's tracker (same
+        # process or forked) registered nothing new, and unregistering would drop the publisher's.
+        shm = shared_memory.SharedMemory(name=name)
+        ring = cls(shm, owner=False)
+        if os.name == "posix" and _tracker_id() != ring._header[5]:
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return ring
+
+    @property
+    def count(self) -> int:
+        """Number of sweeps published so far."""
+        return int(self._header[4])
+
+    @property
+    def latest(self) -> int:
+        """Index of the newest sweep, -1 if nothing was published yet."""
+        return self.count - 1
+
+    def publish(
+        self,
+        values: ArrayLike,
+        sequence: Optional[int] = None,
+        timestamp: Optional[float] = None,
+        plan: Optional[ConversionPlan] = None,
+    ) -> int:
+        """
+        Write one sweep into the next slot.
+
+        Args:
+            values (ArrayLike): The levels, at most `n_points` of them.
+            sequence (int, optional): Sweep counter to pass on. Defaults to the ring index.
+            timestamp (float, optional): Time of the sweep. Defaults to now.
+            plan (ConversionPlan, optional): Conversion applied while writing; the result is written
+                straight into shared memory.
+
+        Returns:
+            int: The index of the published sweep.
+
+        Raises:
+            ValueError: If there are more than `n_points` values.
+        """
+        values = np.asarray(values)
+        n = values.size
+        if n > self.n_points:
+            raise ValueError(f"Expected at most {self.n_points} points, got {n}.")
+
+        index = self.count
+        slot = index % self.n_slots
+        meta = self._meta[slot]
+        meta[0] = 2 * index + 1
+        target = self._data[slot, :n]
+        if plan is None:
+            target[...] = values.reshape(-1)
+        else:
+            plan(values.reshape(-1), out=target)
+        meta[1] = index if sequence is None else sequence
+        meta[2] = n
+        self._stamps[slot] = time.time() if timestamp is None else timestamp
+        meta[0] = 2 * index + 2
+        self._header[4] = index + 1
+        return index
+
+    def __call__(self, sequence: int, timestamp: float, levels: np.ndarray) -> None:
+        """Publish `levels`; lets a ring serve as the forward callable of a `StreamConverter`."""
+        self.publish(levels, sequence, timestamp)
+
+    def view(self, index: int) -> Sweep:
+        """
+        Zero-copy, read-only access to a sweep.
+
+        The levels are a view into shared memory and may be overwritten by the publisher at any time
+        after `n_slots` newer sweeps. Check `is_current(index)` after using them; if it is False the
+        data may have been torn and should be discarded.
+
+        Raises:
+            IndexError: If the sweep was not published yet or was already overwritten.
+        """
+        slot = self._check(index)
+        sequence, n = self._meta[slot, 1:]
+        levels = self._data[slot, :n]
+        levels.flags.writeable = False
+        return Sweep(index, int(sequence), float(self._stamps[slot]), levels)
+
+    def read(self, index: int, out: Optional[np.ndarray] = None) -> Sweep:
+        """
+        Copy a sweep out of the ring, guaranteed consistent.
+
+        Args:
+            index (int): Index of the sweep, e.g. `latest`.
+            out (np.ndarray, optional): Buffer of at least `n_points` elements to copy into; the
+                returned levels are a view of its first n elements. Defaults to a new array.
+
+        Raises:
+            IndexError: If the sweep was not published yet, or was overwritten before or during the copy.
+        """
+        sweep = self.view(index)
+        n = sweep.levels.size
+        if out is None:
+            out = np.empty(n, dtype=self.dtype)
+        levels = out[:n]
+        levels[...] = sweep.levels
+        if not self.is_current(index):
+            raise IndexError(f"Sweep {index} was overwritten while reading.")
+        return sweep._replace(levels=levels)
+
+    def is_current(self, index: int) -> bool:
+        """True if the slot of sweep `index` still holds that sweep, completely written."""
+        return index >= 0 and self._meta[index % self.n_slots, 0] == 2 * index + 2
+
+    def wait(self, index: int, timeout: Optional[float] = None, poll: float = 0.001) -> bool:
+        """
+        Wait until sweep `index` is published.
+
+        Args:
+            index (int): The sweep to wait for, typically the last one read + 1.
+            timeout (float, optional): Maximum time to wait (s). Defaults to forever.
+            poll (float, optional): Polling interval (s). Defaults to 1 ms.
+
+        Returns:
+            bool: True if the sweep is available, False on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.count <= index:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(poll)
+        return True
+
+    def close(self) -> None:
+        """Detach from the block. The views returned by `view` must not be used afterwards."""
+        self._header = self._meta = self._stamps = self._data = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the block; called by the publisher once all consumers are done."""
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedTraceRing":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def _check(self, index: int) -> int:
+        count = self.count
+        if index < 0 or index >= count:
+            raise IndexError(f"Sweep {index} was not published yet.")
+        if index < count - self.n_slots or not self.is_current(index):
+            raise IndexError(f"Sweep {index} was overwritten.")
+        return index % self.n_slots
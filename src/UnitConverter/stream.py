@@ -0,0 +1,599 @@
+"""
+Live receiver stream ingestion.
+
+A receiver (or `simulate`) sends one frame per sweep to a local TCP or UDP socket. `StreamConverter`
+reads the frames into a fixed pool of preallocated buffers, converts them with a precompiled
+`ConversionPlan` on a worker thread and hands the results to a forward callable, for example a
+`UDPForwarder` feeding the pre-scan display or a `SharedTraceRing` read by several local consumers.
+
+Frame format (little endian), used in both directions:
+
+    magic      4s   b"RFSW"
+    sequence   u32  sweep counter, wraps at 2**32
+    n_points   u32  number of levels that follow
+    timestamp  f64  sender's time of the sweep (time.time())
+    levels     f32 * n_points
+
+Over UDP every datagram carries exactly one frame; over TCP frames follow each other on the stream.
+
+Run as a daemon with ``python -m UnitConverter.stream serve ...`` and feed it test data with
+``python -m UnitConverter.stream simulate ...``.
+"""
+
+import argparse
+import contextvars
+import queue
+import socket
+import struct
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from UnitConverter.base_converter import ConversionPlan
+from UnitConverter.eirp_converter import EIRP, EIRPConverter
+from UnitConverter.fast_math import approximate
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter
+from UnitConverter.shm_ring import SharedTraceRing
+
+MAGIC = b"RFSW"
+HEADER = struct.Struct("<4sIId")
+LEVEL_DTYPE = np.dtype("<f4")
+
+# Largest UDP payload over IPv4
+MAX_DATAGRAM = 65507
+
+POLICIES = ("drop", "block")
+
+
+def frame_size(n_points: int) -> int:
+    """Size in bytes of a frame with `n_points` levels."""
+    return HEADER.size + n_points * LEVEL_DTYPE.itemsize
+
+
+def encode_frame(
+    sequence: int, levels: np.ndarray, timestamp: Optional[float] = None
+) -> bytes:
+    """
+    Build one frame.
+
+    Args:
+        sequence (int): Sweep counter, taken modulo 2**32.
+        levels (np.ndarray): The sweep levels; sent as float32.
+        timestamp (float, optional): Time of the sweep. Defaults to now.
+
+    Returns:
+        bytes: The encoded frame.
+    """
+    levels = np.ascontiguousarray(levels, dtype=LEVEL_DTYPE)
+    if timestamp is None:
+        timestamp = time.time()
+    header = HEADER.pack(MAGIC, sequence & 0xFFFFFFFF, levels.size, timestamp)
+    return header + levels.tobytes()
+
+
+class LatencyHistogram:
+    """
+    Fixed-bin histogram of per-frame latencies.
+
+    Recording is O(log bins) and allocation free, so it can run for every frame of a live stream.
+
+    Attributes:
+        edges (tuple[float, ...]): Upper bin edges in seconds; a last bin catches everything above.
+        counts (list[int]): Number of frames per bin.
+        count (int): Number of recorded frames.
+        total (float): Sum of all latencies in seconds.
+        max (float): Largest latency seen in seconds.
+    """
+
+    DEFAULT_EDGES = (
+        0.0001, 0.0002, 0.0005, 0.001, 0.002, 0.005,
+        0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0,
+    )
+
+    def __init__(self, edges: Sequence[float] = DEFAULT_EDGES):
+        if any(b <= a for a, b in zip(edges, edges[1:])):
+            raise ValueError("edges must be strictly increasing.")
+        self.edges = tuple(edges)
+        self.reset()
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(self.edges) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect_left(self.edges, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Upper edge of the bin that holds the `q`-th percentile (0-100).
+
+        Returns `max` if the percentile falls in the overflow bin, and 0.0 if nothing was recorded.
+        """
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for edge, count in zip(self.edges, self.counts):
+            seen += count
+            if seen >= rank:
+                return edge
+        return self.max
+
+    def summary(self) -> str:
+        return (
+            f"{self.count} frames, mean {self.mean * 1e3:.3f} ms, "
+            f"p50 <= {self.percentile(50) * 1e3:g} ms, p99 <= {self.percentile(99) * 1e3:g} ms, "
+            f"max {self.max * 1e3:.3f} ms"
+        )
+
+
+class _Slot:
+    """One preallocated frame buffer: the raw bytes, a float32 view of the levels and the output."""
+
+    __slots__ = ("raw", "view", "levels", "out", "sequence", "timestamp", "n_points", "received")
+
+    def __init__(self, capacity: int):
+        self.raw = bytearray(frame_size(capacity))
+        self.view = memoryview(self.raw)
+        self.levels = np.frombuffer(self.raw, dtype=LEVEL_DTYPE, offset=HEADER.size)
+        self.out = np.empty(capacity)
+        self.sequence = 0
+        self.timestamp = 0.0
+        self.n_points = 0
+        self.received = 0.0
+
+
+class StreamConverter:
+    """
+    Convert sweep frames from a socket with bounded memory and bounded latency.
+
+    All buffers are allocated up front: a pool of slots, each holding one raw frame and one converted
+    sweep, for `queue_size` waiting frames plus the one being received and the one being converted.
+    The reader fills a free slot straight from the socket (`recv_into`), the worker converts it
+    with `plan(..., out=slot.out)` and passes the result to `forward`, then returns the slot to the pool.
+    Nothing is allocated per frame apart from the conversion's bounded block temporaries.
+
+    Backpressure:
+        When the worker falls behind, all slots end up waiting for conversion. With ``policy="drop"``
+        (the default, for live displays) the reader then reuses the oldest waiting frame, so the display
+        always shows the newest sweeps and latency stays bounded by `queue_size` frames; drops are counted
+        in `dropped`. With ``policy="block"`` the reader waits for a free slot; over TCP this stops reading
+        from the socket and the kernel's flow control slows the sender down.
+
+    The forward callable receives ``(sequence, timestamp, levels)``. `levels` is a view into the slot and
+    is reused after the call returns, so a consumer that keeps the data must copy it.
+
+    Attributes:
+        plan (ConversionPlan): The conversion applied to every frame.
+        n_points (int): Largest number of points per frame.
+        latency (LatencyHistogram): Time from a frame being fully received until `forward` returned.
+        received (int): Frames read from the socket.
+        forwarded (int): Frames converted and forwarded.
+        dropped (int): Frames discarded because the worker fell behind.
+        errors (int): Malformed frames and exceptions raised by `forward`.
+    """
+
+    def __init__(
+        self,
+        plan: ConversionPlan,
+        n_points: int,
+        forward: Callable[[int, float, np.ndarray], None],
+        queue_size: int = 4,
+        policy: str = "drop",
+    ):
+        if n_points <= 0:
+            raise ValueError("n_points must be a positive number.")
+        if queue_size <= 0:
+            raise ValueError("queue_size must be a positive number.")
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}.")
+
+        self.plan = plan
+        self.n_points = n_points
+        self.forward = forward
+        self.policy = policy
+        self.latency = LatencyHistogram()
+        self.received = 0
+        self.forwarded = 0
+        self.dropped = 0
+        self.errors = 0
+        # The reader and the worker thread both count errors
+        self._errors_lock = threading.Lock()
+
+        self._free: queue.Queue = queue.Queue()
+        self._ready: queue.Queue = queue.Queue()
+        for _ in range(queue_size + 2):
+            self._free.put(_Slot(n_points))
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        Start the conversion worker.
+
+        The worker runs in a copy of the caller's context, so starting it inside
+        ``with fast_math.approximate():`` converts every frame approximately.
+        """
+        if self._worker is not None:
+            raise RuntimeError("StreamConverter is already running.")
+        self._stop.clear()
+        self._worker = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(self._work,),
+            name="stream-convert",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def stop(self) -> None:
+        """Stop reading, convert the frames still queued and stop the worker."""
+        self._stop.set()
+        if self._worker is not None:
+            self._ready.put(None)
+            self._worker.join()
+            self._worker = None
+
+    def __enter__(self) -> "StreamConverter":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def run_udp(self, sock: socket.socket, poll: float = 0.2) -> None:
+        """
+        Read one frame per datagram from a bound UDP socket until `stop` is called.
+
+        Args:
+            sock (socket.socket): The bound datagram socket.
+            poll (float, optional): Socket timeout used to check for `stop` (s). Defaults to 0.2.
+        """
+        sock.settimeout(poll)
+        slot = self._acquire()
+        try:
+            while not self._stop.is_set():
+                try:
+                    nbytes = sock.recv_into(slot.view)
+                except socket.timeout:
+                    continue
+                except OSError:
+                    break
+                slot = self._submit(slot, nbytes)
+        finally:
+            self._free.put(slot)
+
+    def run_tcp(self, conn: socket.socket, poll: float = 0.2) -> None:
+        """
+        Read frames from a connected TCP socket until the peer closes it or `stop` is called.
+
+        A frame with a bad magic or too many points leaves the stream out of sync, so the connection
+        is abandoned after counting the error.
+
+        Args:
+            conn (socket.socket): The connected stream socket.
+            poll (float, optional): Socket timeout used to check for `stop` (s), also while waiting
+                on an idle sender. Defaults to 0.2.
+        """
+        conn.settimeout(poll)
+        slot = self._acquire()
+        try:
+            while not self._stop.is_set():
+                if not _recv_exactly(conn, slot.view[: HEADER.size], self._stop):
+                    return
+                magic, _, n_points, _ = HEADER.unpack_from(slot.raw)
+                if magic != MAGIC or n_points > self.n_points:
+                    self._count_error()
+                    return
+                if not _recv_exactly(conn, slot.view[HEADER.size : frame_size(n_points)], self._stop):
+                    return
+                slot = self._submit(slot, frame_size(n_points))
+        finally:
+            self._free.put(slot)
+
+    def _count_error(self) -> None:
+        with self._errors_lock:
+            self.errors += 1
+
+    def _acquire(self) -> _Slot:
+        """
+        Get the slot to receive the next frame into.
+
+        The pool has two slots more than `queue_size` (one being received into, one being converted),
+        so when none is free under the drop policy at least two frames are waiting and dropping the
+        oldest one still leaves the newest queued.
+        """
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            pass
+        if self.policy == "drop":
+            try:
+                slot = self._ready.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                if slot is not None:
+                    self.dropped += 1
+                    return slot
+                # stop() was called meanwhile, keep the sentinel for the worker
+                self._ready.put(None)
+        return self._free.get()
+
+    def _submit(self, slot: _Slot, nbytes: int) -> _Slot:
+        """
+        Validate the frame in `slot` and queue it for conversion.
+
+        Returns:
+            _Slot: The slot to receive the next frame into; `slot` itself if the frame was rejected.
+        """
+        self.received += 1
+        if nbytes < HEADER.size:
+            self._count_error()
+            return slot
+        magic, sequence, n_points, timestamp = HEADER.unpack_from(slot.raw)
+        if magic != MAGIC or n_points > self.n_points or nbytes != frame_size(n_points):
+            self._count_error()
+            return slot
+
+        slot.sequence = sequence
+        slot.timestamp = timestamp
+        slot.n_points = n_points
+        slot.received = time.perf_counter()
+        self._ready.put(slot)
+        return self._acquire()
+
+    def _work(self) -> None:
+        while True:
+            slot = self._ready.get()
+            if slot is None:
+                return
+            n = slot.n_points
+            try:
+                with np.errstate(all="ignore"):
+                    levels = self.plan(slot.levels[:n], out=slot.out[:n])
+                self.forward(slot.sequence, slot.timestamp, levels)
+            except Exception:
+                # A bad frame or a failing consumer must not stop the stream
+                self._count_error()
+            else:
+                self.forwarded += 1
+                self.latency.record(time.perf_counter() - slot.received)
+            self._free.put(slot)
+
+    def summary(self) -> str:
+        return (
+            f"received {self.received}, forwarded {self.forwarded}, dropped {self.dropped}, "
+            f"errors {self.errors}; latency: {self.latency.summary()}"
+        )
+
+
+def _recv_exactly(conn: socket.socket, view: memoryview, stop: threading.Event) -> bool:
+    """Fill `view` from `conn`. Returns False if the peer closed the connection or `stop` was set first."""
+    while view:
+        try:
+            nbytes = conn.recv_into(view)
+        except socket.timeout:
+            if stop.is_set():
+                return False
+            continue
+        if nbytes == 0:
+            return False
+        view = view[nbytes:]
+    return True
+
+
+class UDPForwarder:
+    """
+    Forward converted sweeps as frames to a UDP address, e.g. the pre-scan display.
+
+    The outgoing frame is packed into one preallocated buffer, so forwarding allocates nothing.
+    """
+
+    def __init__(self, address: tuple[str, int], n_points: int):
+        if frame_size(n_points) > MAX_DATAGRAM:
+            raise ValueError(f"{n_points} points do not fit in one UDP datagram.")
+        self.address = address
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._raw = bytearray(frame_size(n_points))
+        self._view = memoryview(self._raw)
+        self._levels = np.frombuffer(self._raw, dtype=LEVEL_DTYPE, offset=HEADER.size)
+
+    def __call__(self, sequence: int, timestamp: float, levels: np.ndarray) -> None:
+        n = levels.size
+        HEADER.pack_into(self._raw, 0, MAGIC, sequence, n, timestamp)
+        self._levels[:n] = levels
+        self._sock.sendto(self._view[: frame_size(n)], self.address)
+
+    def close(self) -> None:
+        self._sock.close()
+
+
+def simulate(
+    address: tuple[str, int],
+    n_points: int = 1001,
+    sweeps: int = 100,
+    rate: float = 10.0,
+    protocol: str = "udp",
+    seed: Optional[int] = None,
+) -> None:
+    """
+    Feed a `StreamConverter` with synthetic sweeps, standing in for a receiver.
+
+    Every sweep is a noise floor around 20 dBμV/m with a few fixed emissions on top.
+
+    Args:
+        address (tuple[str, int]): Host and port the converter listens on.
+        n_points (int, optional): Points per sweep. Defaults to 1001.
+        sweeps (int, optional): Number of sweeps to send. Defaults to 100.
+        rate (float, optional): Sweeps per second; 0 sends as fast as possible. Defaults to 10.
+        protocol (str, optional): "udp" or "tcp". Defaults to "udp".
+        seed (int, optional): Seed of the noise generator.
+    """
+    if protocol not in ("udp", "tcp"):
+        raise ValueError("protocol must be 'udp' or 'tcp'.")
+    if protocol == "udp" and frame_size(n_points) > MAX_DATAGRAM:
+        raise ValueError(f"{n_points} points do not fit in one UDP datagram.")
+
+    rng = np.random.default_rng(seed)
+    n_emissions = min(5, n_points)
+    emissions = np.zeros(n_points)
+    emissions[rng.choice(n_points, n_emissions, replace=False)] = rng.uniform(10, 40, n_emissions)
+
+    if protocol == "udp":
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        send = lambda frame: sock.sendto(frame, address)  # noqa: E731
+    else:
+        sock = socket.create_connection(address)
+        send = sock.sendall
+
+    period = 1.0 / rate if rate > 0 else 0.0
+    start = time.perf_counter()
+    try:
+        for sequence in range(sweeps):
+            levels = 20.0 + rng.normal(0.0, 2.0, n_points) + emissions
+            send(encode_frame(sequence, levels))
+            if period:
+                delay = start + (sequence + 1) * period - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+    finally:
+        sock.close()
+
+
+# Converter choices of the daemon: name -> (converter class, unit enum)
+_CONVERTERS = {
+    "fs": (FieldStrengthConverter, FSUNIT),
+    "eirp": (EIRPConverter, EIRP),
+}
+
+
+def _address(text: str) -> tuple[str, int]:
+    host, _, port = text.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="rfcalc-stream", description="Convert live receiver sweeps from a socket."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="Convert frames and forward them.")
+    serve.add_argument("--protocol", choices=("udp", "tcp"), default="udp")
+    serve.add_argument("--listen", type=_address, default=("127.0.0.1", 5025), help="host:port")
+    serve.add_argument("--forward", type=_address, help="UDP host:port of the display")
+    serve.add_argument("--shm", help="Also publish into a shared memory ring of this name")
+    serve.add_argument("--slots", type=int, default=64, help="Sweeps kept in the shared memory ring")
+    serve.add_argument("--converter", choices=tuple(_CONVERTERS), default="fs")
+    serve.add_argument("--from-unit", required=True, help="Unit name, e.g. DBUV_PER_M")
+    serve.add_argument("--to-unit", required=True, help="Unit name, e.g. V_PER_M")
+    serve.add_argument("--distance", type=float, help="Measurement distance (m), EIRP only")
+    serve.add_argument("--slope", type=float, default=20.0, help="dB/decade, EIRP only")
+    serve.add_argument("--points", type=int, default=1001, help="Maximum points per sweep")
+    serve.add_argument("--queue", type=int, default=4, help="Number of frame buffers")
+    serve.add_argument("--policy", choices=POLICIES, default="drop")
+    serve.add_argument(
+        "--approximate", action="store_true", help="Fast single precision log/pow (< 0.0001 dB error)"
+    )
+    serve.add_argument(
+        "--metrics", type=_address, help="Serve Prometheus metrics on http://host:port/metrics"
+    )
+
+    sim = commands.add_parser("simulate", help="Send synthetic sweeps.")
+    sim.add_argument("--protocol", choices=("udp", "tcp"), default="udp")
+    sim.add_argument("--target", type=_address, default=("127.0.0.1", 5025), help="host:port")
+    sim.add_argument("--points", type=int, default=1001)
+    sim.add_argument("--sweeps", type=int, default=100)
+    sim.add_argument("--rate", type=float, default=10.0, help="Sweeps per second, 0 = unlimited")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "simulate":
+        simulate(args.target, args.points, args.sweeps, args.rate, args.protocol)
+        return
+
+    converter_class, unit_enum = _CONVERTERS[args.converter]
+    names = [unit.name for unit in unit_enum]
+    for option, name in (("--from-unit", args.from_unit), ("--to-unit", args.to_unit)):
+        if name not in names:
+            parser.error(
+                f"{option}: unknown {args.converter} unit {name!r}, choose from {', '.join(names)}"
+            )
+    if args.converter == "eirp" and args.distance is None:
+        parser.error("--distance is required with --converter eirp")
+    context = {}
+    if args.converter == "eirp":
+        context = {"distance": args.distance, "slope": args.slope}
+    to_unit = unit_enum[args.to_unit]
+    plan = converter_class().plan(unit_enum[args.from_unit], to_unit, **context)
+
+    if args.forward is None and args.shm is None:
+        parser.error("serve needs --forward and/or --shm")
+    outputs = []
+    if args.forward is not None:
+        outputs.append(UDPForwarder(args.forward, args.points))
+    if args.shm is not None:
+        outputs.append(SharedTraceRing.create(args.shm, args.slots, args.points, to_unit.value))
+
+    def forward(sequence: int, timestamp: float, levels: np.ndarray) -> None:
+        for output in outputs:
+            output(sequence, timestamp, levels)
+
+    stream = StreamConverter(plan, args.points, forward, args.queue, args.policy)
+    kind = socket.SOCK_DGRAM if args.protocol == "udp" else socket.SOCK_STREAM
+    sock = socket.socket(socket.AF_INET, kind)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(args.listen)
+
+    metrics_server = None
+    if args.metrics is not None:
+        from UnitConverter.metrics import MetricsRegistry
+
+        registry = MetricsRegistry()
+        registry.add_stream(stream)
+        metrics_server = registry.serve(args.metrics)
+
+    with approximate(args.approximate):
+        stream.start()
+    try:
+        if args.protocol == "udp":
+            stream.run_udp(sock)
+        else:
+            sock.listen(1)
+            while True:
+                conn, _ = sock.accept()
+                with conn:
+                    stream.run_tcp(conn)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stream.stop()
+        sock.close()
+        if metrics_server is not None:
+            metrics_server.shutdown()
+            metrics_server.server_close()
+        for output in outputs:
+            output.close()
+            if isinstance(output, SharedTraceRing):
+                output.unlink()
+        print(stream.summary())
+
+
+if __name__ == "__main__":
+    main()
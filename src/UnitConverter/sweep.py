@@ -0,0 +1,316 @@
+import math
+from typing import Iterator, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_CHUNK = 1 << 16
+
+
+class Band(NamedTuple):
+    """
+    A frequency band with the resolution bandwidth used to measure it.
+
+    Attributes:
+        name (str): Band designation.
+        start (float): Lower band edge (Hz).
+        stop (float): Upper band edge (Hz).
+        rbw (float): Resolution bandwidth (Hz).
+    """
+
+    name: str
+    start: float
+    stop: float
+    rbw: float
+
+
+# CISPR 16-1-1 frequency bands with their quasi-peak / peak measurement bandwidths
+CISPR_BANDS = {
+    "A": Band("A", 9e3, 150e3, 200.0),
+    "B": Band("B", 150e3, 30e6, 9e3),
+    "C": Band("C", 30e6, 300e6, 120e3),
+    "D": Band("D", 300e6, 1e9, 120e3),
+    "E": Band("E", 1e9, 18e9, 1e6),
+}
+
+
+class Segment(NamedTuple):
+    """
+    A run of evenly spaced points: ``start + i * step``, or ``start * 10**(i * step)`` if `log`.
+
+    Attributes:
+        start (float): First frequency (Hz).
+        step (float): Spacing in Hz, or in decades if `log`.
+        n_points (int): Number of points.
+        log (bool): Whether the spacing is logarithmic.
+        rbw (float): Resolution bandwidth of the points (Hz); NaN if not given.
+    """
+
+    start: float
+    step: float
+    n_points: int
+    log: bool = False
+    rbw: float = math.nan
+
+    def values(self, first: int, last: int, out: np.ndarray) -> None:
+        """Write the frequencies of points ``first <= i < last`` to `out`."""
+        index = out[: last - first]
+        index[:] = np.arange(first, last, dtype=np.float64)
+        index *= self.step
+        if self.log:
+            np.power(10.0, index, out=index)
+            index *= self.start
+        else:
+            index += self.start
+
+
+def _count(start: float, stop: float, step: float, endpoint: bool) -> int:
+    """Number of points of ``start + i * step`` up to `stop`, tolerating rounding of the step."""
+    span = (stop - start) / step
+    if endpoint:
+        return int(math.floor(span + 1e-9)) + 1
+    return max(int(math.ceil(span - 1e-9)), 0)
+
+
+class FrequencySweep:
+    """
+    A frequency grid that is generated lazily, in fixed-size NumPy chunks.
+
+    Nothing is materialized up front: a sweep is a list of `Segment` descriptions, and iterating over it
+    yields float64 arrays of `chunk_size` points (the last one shorter), filled across segment
+    boundaries. The chunks can be fed straight into `CorrectionTable`, `interpolate_sorted`, limit
+    evaluation or a `ConversionPlan` without ever holding the whole grid, e.g. for a 9 kHz - 40 GHz
+    planning sweep:
+
+    Example:
+        >>> sweep = FrequencySweep.cispr(stop=40e9)
+        >>> len(sweep)
+        102212
+        >>> for freq in sweep.chunks(reuse=True):
+        ...     margin = limit(freq) - estimate(freq)
+
+    Each point is computed from its index, so there is no accumulated rounding error however long the
+    sweep.
+
+    Attributes:
+        segments (list[Segment]): The runs of points, in order.
+        chunk_size (int): Default number of points per chunk.
+    """
+
+    def __init__(self, segments: Sequence[Segment], chunk_size: int = DEFAULT_CHUNK):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive.")
+        self.segments = [segment for segment in segments if segment.n_points > 0]
+        self.chunk_size = chunk_size
+
+    @classmethod
+    def linear(
+        cls,
+        start: float,
+        stop: float,
+        step: Optional[float] = None,
+        n_points: Optional[int] = None,
+        endpoint: bool = True,
+        rbw: float = math.nan,
+        chunk_size: int = DEFAULT_CHUNK,
+    ) -> "FrequencySweep":
+        """
+        Evenly spaced frequencies from `start` to `stop`.
+
+        Args:
+            start (float): First frequency (Hz).
+            stop (float): Last frequency (Hz); included if it falls on the grid and `endpoint` is set.
+            step (float, optional): Spacing (Hz). Give either `step` or `n_points`.
+            n_points (int, optional): Number of points, spaced like `numpy.linspace`.
+            endpoint (bool, optional): Include `stop`. Defaults to True.
+            rbw (float, optional): Resolution bandwidth recorded with the points (Hz).
+            chunk_size (int, optional): Points per chunk.
+
+        Raises:
+            ValueError: If not exactly one of `step` and `n_points` is given, or the range is empty.
+        """
+        if (step is None) == (n_points is None):
+            raise ValueError("Give either step or n_points.")
+        if stop < start:
+            raise ValueError("stop must not be below start.")
+        if n_points is not None:
+            if n_points < 1:
+                raise ValueError("n_points must be positive.")
+            if not endpoint:
+                step = (stop - start) / n_points
+            else:
+                step = (stop - start) / (n_points - 1) if n_points > 1 else 1.0
+        else:
+            if step <= 0:
+                raise ValueError("step must be positive.")
+            n_points = _count(start, stop, step, endpoint)
+        return cls([Segment(start, step, n_points, False, rbw)], chunk_size)
+
+    @classmethod
+    def log(
+        cls,
+        start: float,
+        stop: float,
+        n_points: Optional[int] = None,
+        points_per_decade: Optional[float] = None,
+        chunk_size: int = DEFAULT_CHUNK,
+    ) -> "FrequencySweep":
+        """
+        Logarithmically spaced frequencies from `start` to `stop`, both included.
+
+        Args:
+            start (float): First frequency (Hz), positive.
+            stop (float): Last frequency (Hz).
+            n_points (int, optional): Number of points. Give either this or `points_per_decade`.
+            points_per_decade (float, optional): Minimum density; rounded up to fit the range.
+            chunk_size (int, optional): Points per chunk.
+
+        Raises:
+            ValueError: If not exactly one of `n_points` and `points_per_decade` is given, or the
+                range is not positive and increasing.
+        """
+        if (n_points is None) == (points_per_decade is None):
+            raise ValueError("Give either n_points or points_per_decade.")
+        if start <= 0 or stop <= start:
+            raise ValueError("A log sweep needs 0 < start < stop.")
+        decades = math.log10(stop / start)
+        if n_points is None:
+            n_points = int(math.ceil(decades * points_per_decade - 1e-9)) + 1
+        if n_points < 2:
+            raise ValueError("A log sweep needs at least two points.")
+        return cls([Segment(start, decades / (n_points - 1), n_points, True)], chunk_size)
+
+    @classmethod
+    def rbw(
+        cls,
+        start: float,
+        stop: float,
+        rbw: float,
+        points_per_rbw: float = 2.0,
+        endpoint: bool = True,
+        chunk_size: int = DEFAULT_CHUNK,
+    ) -> "FrequencySweep":
+        """
+        Linear sweep with the step derived from the resolution bandwidth, ``rbw / points_per_rbw``.
+
+        The default of two points per RBW is the usual maximum step of half the bandwidth.
+        """
+        if rbw <= 0 or points_per_rbw <= 0:
+            raise ValueError("rbw and points_per_rbw must be positive.")
+        return cls.linear(
+            start, stop, step=rbw / points_per_rbw, endpoint=endpoint, rbw=rbw, chunk_size=chunk_size
+        )
+
+    @classmethod
+    def bands(
+        cls,
+        bands: Sequence[Band],
+        start: Optional[float] = None,
+        stop: Optional[float] = None,
+        points_per_rbw: float = 2.0,
+        chunk_size: int = DEFAULT_CHUNK,
+    ) -> "FrequencySweep":
+        """
+        RBW-driven sweep over consecutive bands, each with its own step.
+
+        Every band's grid starts at its lower edge (or `start`) and stops short of the next band,
+        so boundary frequencies are not repeated; the last band includes `stop`.
+
+        Args:
+            bands (Sequence[Band]): Adjacent bands in increasing frequency order.
+            start (float, optional): Start of the sweep; defaults to the first band's lower edge.
+            stop (float, optional): End of the sweep; defaults to the last band's upper edge. Beyond
+                it, the last band is extended with its RBW.
+            points_per_rbw (float, optional): Points per resolution bandwidth.
+            chunk_size (int, optional): Points per chunk.
+        """
+        if not bands:
+            raise ValueError("At least one band is required.")
+        start = bands[0].start if start is None else start
+        stop = bands[-1].stop if stop is None else stop
+        if stop < start:
+            raise ValueError("stop must not be below start.")
+
+        segments = []
+        for i, band in enumerate(bands):
+            last = i == len(bands) - 1
+            lower = max(start, band.start)
+            upper = stop if last else min(stop, band.stop)
+            if upper < lower:
+                continue
+            if upper == lower and not last and (upper < stop or bands[i + 1].start <= stop):
+                # Nothing left of this band; a zero-width sweep at its upper edge belongs to the
+                # next band, as the first point of a longer sweep would
+                continue
+            step = band.rbw / points_per_rbw
+            n_points = _count(lower, upper, step, endpoint=last or upper == stop)
+            segments.append(Segment(lower, step, n_points, False, band.rbw))
+            if upper == stop:
+                break
+        return cls(segments, chunk_size)
+
+    @classmethod
+    def cispr(
+        cls,
+        start: float = 9e3,
+        stop: float = 18e9,
+        points_per_rbw: float = 2.0,
+        chunk_size: int = DEFAULT_CHUNK,
+    ) -> "FrequencySweep":
+        """
+        Sweep over the CISPR 16-1-1 bands A-E (`CISPR_BANDS`) with their measurement bandwidths.
+
+        A `stop` above 18 GHz continues band E's 1 MHz bandwidth, as usual for measurements to 40 GHz.
+        """
+        return cls.bands(list(CISPR_BANDS.values()), start, stop, points_per_rbw, chunk_size)
+
+    def __len__(self) -> int:
+        return sum(segment.n_points for segment in self.segments)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return self.chunks()
+
+    def chunks(
+        self, chunk_size: Optional[int] = None, reuse: bool = False
+    ) -> Iterator[np.ndarray]:
+        """
+        Yield the frequencies in chunks of `chunk_size` points; only the last chunk may be shorter.
+
+        Args:
+            chunk_size (int, optional): Defaults to `chunk_size` of the sweep.
+            reuse (bool, optional): Yield views of one buffer that is overwritten by the next chunk,
+                so the whole iteration allocates a single chunk. Defaults to a new array per chunk.
+        """
+        size = chunk_size or self.chunk_size
+        buffer = np.empty(min(size, len(self)))
+        filled = 0
+        for segment in self.segments:
+            first = 0
+            while first < segment.n_points:
+                last = min(segment.n_points, first + size - filled)
+                segment.values(first, last, buffer[filled:])
+                filled += last - first
+                first = last
+                if filled == size:
+                    yield buffer if reuse else buffer.copy()
+                    filled = 0
+        if filled:
+            yield buffer[:filled] if reuse else buffer[:filled].copy()
+
+    def rbw_chunks(
+        self, chunk_size: Optional[int] = None
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Like `chunks`, but yield ``(freq, rbw)`` pairs with the resolution bandwidth per point."""
+        rbws = np.array([segment.rbw for segment in self.segments])
+        bounds = np.cumsum([segment.n_points for segment in self.segments])
+        position = 0
+        for freq in self.chunks(chunk_size):
+            index = np.arange(position, position + freq.size)
+            position += freq.size
+            yield freq, rbws[np.searchsorted(bounds, index, side="right")]
+
+    def to_array(self) -> np.ndarray:
+        """Materialize the whole grid, e.g. for a small sweep or a test."""
+        return np.concatenate(list(self.chunks())) if self.segments else np.empty(0)
+
+    def __repr__(self) -> str:
+        return f"FrequencySweep({len(self)} points in {len(self.segments)} segments)"
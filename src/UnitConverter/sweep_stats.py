@@ -0,0 +1,175 @@
+from typing import Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter
+from UnitConverter.rf_util import log_20
+
+
+class SweepStatistics:
+    """
+    Running statistics over repeated sweeps of the same frequency grid.
+
+    Every call to `update` folds one sweep into fixed-size accumulators in O(points), so a soak test
+    can run for days without keeping its sweeps in memory. Available results:
+
+    - `max_hold` / `min_hold`: highest / lowest level seen at each point.
+    - `log_average`: mean of the levels in dB.
+    - `linear_average`: mean of the field strength in μV/m, expressed in dBμV/m.
+    - `apd`: amplitude probability distribution, i.e. for every point and every histogram bin edge
+      the fraction of sweeps whose level exceeded that edge.
+
+    Sweeps may be given in any `FSUNIT`; they are converted to dBμV/m with `FieldStrengthConverter`
+    before being accumulated. All results are in dBμV/m.
+
+    Non-finite levels (NaN for a point the receiver did not measure, or ±inf) are skipped by every
+    result: the averages and the APD of a point are taken over the sweeps in which it was measured,
+    and all results are NaN at points that were never measured.
+
+    Example:
+        >>> stats = SweepStatistics(n_points=1001, apd_bins=np.arange(0, 121, 1.0))
+        >>> for sweep in receiver:
+        ...     stats.update(sweep)
+        >>> stats.max_hold, stats.apd()
+
+    Attributes:
+        n_points (int): Number of points per sweep.
+        unit (FSUNIT): Unit of the sweeps passed to `update`.
+        count (int): Number of sweeps accumulated so far.
+        valid (np.ndarray): Number of finite levels accumulated per point.
+        apd_bins (np.ndarray | None): Ascending histogram bin edges in dBμV/m, if the APD is tracked.
+    """
+
+    def __init__(
+        self,
+        n_points: int,
+        unit: FSUNIT = FSUNIT.DBUV_PER_M,
+        apd_bins: Optional[ArrayLike] = None,
+    ):
+        if n_points <= 0:
+            raise ValueError("n_points must be a positive number.")
+
+        self.n_points = n_points
+        self.unit = unit
+        self.count = 0
+        self.valid = np.zeros(n_points, dtype=np.int64)
+
+        self._plan = FieldStrengthConverter().plan(unit, FSUNIT.DBUV_PER_M)
+        self._level = np.empty(n_points)
+        self._linear = np.empty(n_points)
+        self._finite = np.empty(n_points, dtype=bool)
+        self._max = np.full(n_points, np.nan)
+        self._min = np.full(n_points, np.nan)
+        self._log_sum = np.zeros(n_points)
+        self._linear_sum = np.zeros(n_points)
+
+        self.apd_bins = None
+        self._hist = None
+        if apd_bins is not None:
+            self.apd_bins = np.asarray(apd_bins, dtype=np.float64)
+            if self.apd_bins.ndim != 1 or np.any(np.diff(self.apd_bins) <= 0):
+                raise ValueError("apd_bins must be strictly increasing.")
+            # Column j counts levels in [bins[j-1], bins[j]); column 0 is below the first edge
+            self._hist = np.zeros((n_points, self.apd_bins.size + 1), dtype=np.int64)
+            self._rows = np.arange(n_points)
+
+    def update(self, sweep: ArrayLike) -> None:
+        """
+        Fold one sweep into the statistics.
+
+        Args:
+            sweep (ArrayLike): `n_points` levels in `unit`.
+
+        Raises:
+            ValueError: If the sweep does not have `n_points` points.
+        """
+        sweep = np.asarray(sweep, dtype=np.float64)
+        if sweep.shape != (self.n_points,):
+            raise ValueError(
+                f"Sweep has shape {sweep.shape}, expected ({self.n_points},)."
+            )
+
+        level = self._plan(sweep, out=self._level)
+        finite = np.isfinite(level, out=self._finite)
+        # fmax/fmin replace the NaN of points not measured yet
+        np.fmax(self._max, level, out=self._max, where=finite)
+        np.fmin(self._min, level, out=self._min, where=finite)
+        np.add(self._log_sum, level, out=self._log_sum, where=finite)
+
+        # dBμV/m -> μV/m (inverse_log_20 without allocating), accumulated in place
+        np.divide(level, 20, out=self._linear)
+        np.power(10, self._linear, out=self._linear)
+        np.add(self._linear_sum, self._linear, out=self._linear_sum, where=finite)
+
+        if self._hist is not None:
+            bins = np.searchsorted(self.apd_bins, level, side="right")
+            if finite.all():
+                self._hist[self._rows, bins] += 1
+            else:
+                # searchsorted sorts NaN above every edge
+                self._hist[self._rows[finite], bins[finite]] += 1
+
+        self.valid += finite
+        self.count += 1
+
+    @property
+    def max_hold(self) -> np.ndarray:
+        """Highest level per point in dBμV/m; NaN where never measured."""
+        return self._max.copy()
+
+    @property
+    def min_hold(self) -> np.ndarray:
+        """Lowest level per point in dBμV/m; NaN where never measured."""
+        return self._min.copy()
+
+    @property
+    def log_average(self) -> np.ndarray:
+        """Mean of the dB levels per point in dBμV/m."""
+        self._require_data()
+        return self._per_valid(self._log_sum)
+
+    @property
+    def linear_average(self) -> np.ndarray:
+        """Mean field strength per point, averaged in μV/m and expressed in dBμV/m."""
+        self._require_data()
+        return log_20(self._per_valid(self._linear_sum))
+
+    def apd(self) -> np.ndarray:
+        """
+        Amplitude probability distribution per point.
+
+        Returns:
+            np.ndarray: Array of shape ``(n_points, len(apd_bins))``; element ``[i, j]`` is the fraction
+            of the sweeps measuring point `i` in which it was at or above ``apd_bins[j]``.
+
+        Raises:
+            ValueError: If no `apd_bins` were given or no sweep has been added yet.
+        """
+        if self._hist is None:
+            raise ValueError("APD is not tracked; pass apd_bins to enable it.")
+        self._require_data()
+        # Levels at or above edge j are those in columns j+1 .. end
+        exceed = np.cumsum(self._hist[:, :0:-1], axis=1)[:, ::-1]
+        return self._per_valid(exceed)
+
+    def reset(self) -> None:
+        """Discard all accumulated sweeps."""
+        self.count = 0
+        self.valid.fill(0)
+        self._max.fill(np.nan)
+        self._min.fill(np.nan)
+        self._log_sum.fill(0.0)
+        self._linear_sum.fill(0.0)
+        if self._hist is not None:
+            self._hist.fill(0)
+
+    def _per_valid(self, total: np.ndarray) -> np.ndarray:
+        """`total` per point (row) divided by the number of finite levels; NaN where there are none."""
+        valid = self.valid if total.ndim == 1 else self.valid[:, None]
+        out = np.full(total.shape, np.nan)
+        return np.divide(total, valid, out=out, where=valid > 0)
+
+    def _require_data(self) -> None:
+        if self.count == 0:
+            raise ValueError("No sweeps have been added yet.")
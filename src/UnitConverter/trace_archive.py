@@ -0,0 +1,391 @@
+"""
+Compact archive format for converted traces.
+
+Levels are quantized to a fixed resolution (0.01 dB by default, well below receiver accuracy) and
+frequencies to 1 mHz. Both are then delta encoded, frequencies twice so that an evenly spaced grid
+becomes a run of zeros, byte-shuffled (all low bytes, then all high bytes, ...) and compressed with
+`zlib` or `lzma` from the standard library. A typical receiver trace shrinks to 1-3 bytes per point,
+against 16 bytes as two float64 columns.
+
+Every trace is stored in chunks of `chunk_points` points, each encoded independently, so a reader can
+decode any single chunk (`ArchiveReader.read_chunk`) or stream a trace chunk by chunk without
+decompressing the rest.
+
+Layout:
+
+    magic b"RFTA", version u16
+    chunk data, trace after trace
+    index (JSON): per trace its name, unit, context, resolution and chunk offsets
+    index offset u64, magic b"RFTA"
+
+The index is written when the archive is closed, so traces are appended with constant memory.
+"""
+
+import json
+import lzma
+import struct
+import zlib
+from enum import Enum
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, NamedTuple, Optional, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from UnitConverter.base_converter import UnitEnum
+from UnitConverter.eirp_converter import EIRP
+from UnitConverter.rf_converter import FSUNIT
+
+MAGIC = b"RFTA"
+VERSION = 1
+HEADER = struct.Struct("<4sH")
+FOOTER = struct.Struct("<Q4s")
+
+CODECS = {
+    "zlib": (lambda data: zlib.compress(data, 6), zlib.decompress),
+    "lzma": (lambda data: lzma.compress(data, preset=6), lzma.decompress),
+}
+
+# Units that are restored as enum members when reading; anything else is kept as text
+_UNIT_ENUMS = {enum.__name__: enum for enum in (FSUNIT, EIRP)}
+
+# Quantized codes reserved for non-finite levels
+_NAN = np.iinfo(np.int32).min
+_NEG_INF = _NAN + 1
+_POS_INF = np.iinfo(np.int32).max
+
+
+class ChunkInfo(NamedTuple):
+    """Position of one encoded chunk in the archive file."""
+
+    offset: int
+    n_points: int
+    freq_size: int
+    level_size: int
+
+
+class TraceInfo(NamedTuple):
+    """
+    Index entry of one archived trace.
+
+    Attributes:
+        name (str): Name the trace was added under.
+        unit (UnitEnum | str | None): Unit of the levels.
+        context (dict): Conversion context, e.g. ``{"distance": 3.0}``.
+        n_points (int): Number of points.
+        resolution (float): Quantization step of the levels, in the level unit.
+        freq_resolution (float): Quantization step of the frequencies (Hz).
+        codec (str): Compression codec.
+        chunks (list[ChunkInfo]): The chunks, in order.
+    """
+
+    name: str
+    unit: Union[UnitEnum, str, None]
+    context: dict[str, Any]
+    n_points: int
+    resolution: float
+    freq_resolution: float
+    codec: str
+    chunks: list[ChunkInfo]
+
+
+def _shuffle(array: np.ndarray) -> bytes:
+    """Group the bytes of the elements by significance, which makes small integers compress well."""
+    return array.view(np.uint8).reshape(-1, array.itemsize).T.tobytes()
+
+
+def _unshuffle(data: bytes, dtype: np.dtype) -> np.ndarray:
+    dtype = np.dtype(dtype)
+    planes = np.frombuffer(data, dtype=np.uint8).reshape(dtype.itemsize, -1)
+    return np.ascontiguousarray(planes.T).view(dtype).reshape(-1)
+
+
+def _unit_name(unit: Union[UnitEnum, str, None]) -> Optional[str]:
+    if isinstance(unit, Enum):
+        return f"{type(unit).__name__}.{unit.name}"
+    return unit
+
+
+def _unit_from_name(name: Optional[str]) -> Union[UnitEnum, str, None]:
+    if name is None:
+        return None
+    enum_name, _, member = name.partition(".")
+    enum = _UNIT_ENUMS.get(enum_name)
+    if enum is not None and member in enum.__members__:
+        return enum[member]
+    return name
+
+
+def quantize(level: np.ndarray, resolution: float) -> np.ndarray:
+    """
+    Quantize levels to int32 multiples of `resolution`; NaN and ±inf get reserved codes.
+
+    Raises:
+        ValueError: If a finite level is too large for the resolution.
+    """
+    with np.errstate(invalid="ignore"):
+        scaled = np.rint(level / resolution)
+    finite = np.isfinite(scaled)
+    if np.any(np.abs(scaled[finite]) >= _POS_INF - 1):
+        raise ValueError("Level out of range for the archive resolution.")
+    codes = np.where(finite, scaled, 0).astype(np.int32)
+    codes[np.isnan(level)] = _NAN
+    codes[np.isposinf(level)] = _POS_INF
+    codes[np.isneginf(level)] = _NEG_INF
+    return codes
+
+
+def dequantize(codes: np.ndarray, resolution: float) -> np.ndarray:
+    """Inverse of `quantize`."""
+    level = codes * resolution
+    level[codes == _NAN] = np.nan
+    level[codes == _POS_INF] = np.inf
+    level[codes == _NEG_INF] = -np.inf
+    return level
+
+
+def _encode_freq(freq: np.ndarray, resolution: float) -> np.ndarray:
+    codes = np.rint(freq / resolution).astype(np.int64)
+    # Second differences: zero everywhere on an evenly spaced grid
+    return np.diff(np.diff(codes, prepend=0), prepend=0)
+
+
+def _decode_freq(deltas: np.ndarray, resolution: float) -> np.ndarray:
+    return np.cumsum(np.cumsum(deltas)) * resolution
+
+
+def _encode_level(codes: np.ndarray) -> np.ndarray:
+    # Wrapping uint32 arithmetic keeps the deltas exactly reversible, sentinels included
+    return np.diff(codes.view(np.uint32), prepend=np.uint32(0))
+
+
+def _decode_level(deltas: np.ndarray) -> np.ndarray:
+    return np.cumsum(deltas, dtype=np.uint32).view(np.int32)
+
+
+class ArchiveWriter:
+    """
+    Write converted traces into a compressed archive.
+
+    Example:
+        >>> with ArchiveWriter("campaign.rfta", resolution=0.01) as archive:
+        ...     archive.add("EUT1_H_30-1000MHz", freq, level, FSUNIT.DBUV_PER_M, {"distance": 3.0})
+
+    Attributes:
+        path (Path): The archive file.
+        codec (str): ``"zlib"`` (fast) or ``"lzma"`` (smaller, slower).
+        resolution (float): Quantization step of the levels, in their unit. Meant for dB units: a
+            step of 0.01 keeps levels within ±0.005 dB.
+        freq_resolution (float): Quantization step of the frequencies (Hz).
+        chunk_points (int): Points per independently decodable chunk.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        codec: str = "zlib",
+        resolution: float = 0.01,
+        freq_resolution: float = 1e-3,
+        chunk_points: int = 1 << 16,
+    ):
+        if codec not in CODECS:
+            raise ValueError(f"codec must be one of {sorted(CODECS)}.")
+        if resolution <= 0 or freq_resolution <= 0:
+            raise ValueError("resolution and freq_resolution must be positive.")
+        if chunk_points < 1:
+            raise ValueError("chunk_points must be positive.")
+        self.path = Path(path)
+        self.codec = codec
+        self.resolution = resolution
+        self.freq_resolution = freq_resolution
+        self.chunk_points = chunk_points
+        self._compress = CODECS[codec][0]
+        self._traces: list[TraceInfo] = []
+        self._file: Optional[BinaryIO] = open(self.path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION))
+
+    def add(
+        self,
+        name: str,
+        freq: ArrayLike,
+        level: ArrayLike,
+        unit: Union[UnitEnum, str, None] = None,
+        context: Optional[dict[str, Any]] = None,
+    ) -> TraceInfo:
+        """
+        Append one trace.
+
+        Args:
+            name (str): Unique name of the trace in the archive.
+            freq (ArrayLike): Frequencies (Hz).
+            level (ArrayLike): Levels, same length as `freq`.
+            unit (UnitEnum | str, optional): Unit of the levels, e.g. `FSUNIT.DBUV_PER_M`.
+            context (dict, optional): JSON-serializable conversion context, e.g. distance and slope.
+
+        Raises:
+            ValueError: If the name is taken, the arrays differ in length or a level is out of range.
+        """
+        if self._file is None:
+            raise ValueError("The archive is closed.")
+        if any(trace.name == name for trace in self._traces):
+            raise ValueError(f"A trace named {name!r} already exists.")
+        freq = np.asarray(freq, dtype=np.float64).reshape(-1)
+        level = np.asarray(level, dtype=np.float64).reshape(-1)
+        if freq.shape != level.shape:
+            raise ValueError("freq and level must have the same length.")
+        context = dict(context or {})
+        # Fail now rather than when the index is written on close
+        json.dumps(context)
+
+        chunks = []
+        for start in range(0, freq.size, self.chunk_points):
+            stop = start + self.chunk_points
+            freq_data = self._compress(_shuffle(_encode_freq(freq[start:stop], self.freq_resolution)))
+            codes = quantize(level[start:stop], self.resolution)
+            level_data = self._compress(_shuffle(_encode_level(codes)))
+            n_points = min(stop, freq.size) - start
+            chunks.append(ChunkInfo(self._file.tell(), n_points, len(freq_data), len(level_data)))
+            self._file.write(freq_data)
+            self._file.write(level_data)
+
+        trace = TraceInfo(
+            name, unit, context, int(freq.size), self.resolution, self.freq_resolution,
+            self.codec, chunks,
+        )
+        self._traces.append(trace)
+        return trace
+
+    def close(self) -> None:
+        """Write the index and close the file."""
+        if self._file is None:
+            return
+        index = [
+            {
+                "name": trace.name,
+                "unit": _unit_name(trace.unit),
+                "context": trace.context,
+                "n_points": trace.n_points,
+                "resolution": trace.resolution,
+                "freq_resolution": trace.freq_resolution,
+                "codec": trace.codec,
+                "chunks": [list(chunk) for chunk in trace.chunks],
+            }
+            for trace in self._traces
+        ]
+        offset = self._file.tell()
+        self._file.write(json.dumps({"traces": index}).encode("utf-8"))
+        self._file.write(FOOTER.pack(offset, MAGIC))
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ArchiveReader:
+    """
+    Read traces from an archive written by `ArchiveWriter`.
+
+    Only the index is read on opening; chunks are read and decoded on demand.
+
+    Example:
+        >>> with ArchiveReader("campaign.rfta") as archive:
+        ...     info = archive.traces["EUT1_H_30-1000MHz"]
+        ...     for freq, level in archive.chunks(info.name):
+        ...         ...
+
+    Attributes:
+        traces (dict[str, TraceInfo]): The archived traces by name, in the order they were added.
+
+    Raises:
+        ValueError: If the file is not a trace archive or has an unsupported version.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file: BinaryIO = open(self.path, "rb")
+        try:
+            self.traces = self._read_index()
+        except BaseException:
+            self._file.close()
+            raise
+
+    def _read_index(self) -> dict[str, TraceInfo]:
+        header = self._file.read(HEADER.size)
+        if len(header) < HEADER.size or header[:4] != MAGIC:
+            raise ValueError(f"{self.path} is not a trace archive.")
+        version = HEADER.unpack(header)[1]
+        if version != VERSION:
+            raise ValueError(f"Unsupported trace archive version {version}.")
+
+        end = self._file.seek(-FOOTER.size, 2)
+        offset, magic = FOOTER.unpack(self._file.read(FOOTER.size))
+        if magic != MAGIC or not HEADER.size <= offset <= end:
+            raise ValueError(f"{self.path} is truncated or was not closed.")
+        self._file.seek(offset)
+        index = json.loads(self._file.read(end - offset))
+
+        traces = {}
+        for entry in index["traces"]:
+            traces[entry["name"]] = TraceInfo(
+                entry["name"],
+                _unit_from_name(entry["unit"]),
+                entry["context"],
+                entry["n_points"],
+                entry["resolution"],
+                entry["freq_resolution"],
+                entry["codec"],
+                [ChunkInfo(*chunk) for chunk in entry["chunks"]],
+            )
+        return traces
+
+    def read_chunk(self, name: str, index: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Decode chunk `index` of trace `name`.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Frequency and level of the chunk as float64 arrays.
+
+        Raises:
+            KeyError: If there is no trace of that name.
+            IndexError: If the trace has no such chunk.
+        """
+        trace = self.traces[name]
+        chunk = trace.chunks[index]
+        decompress = CODECS[trace.codec][1]
+        self._file.seek(chunk.offset)
+        freq_data = decompress(self._file.read(chunk.freq_size))
+        level_data = decompress(self._file.read(chunk.level_size))
+        freq = _decode_freq(_unshuffle(freq_data, np.int64), trace.freq_resolution)
+        level = dequantize(_decode_level(_unshuffle(level_data, np.uint32)), trace.resolution)
+        return freq, level
+
+    def chunks(self, name: str) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Decode trace `name` chunk by chunk."""
+        for index in range(len(self.traces[name].chunks)):
+            yield self.read_chunk(name, index)
+
+    def read(self, name: str) -> tuple[np.ndarray, np.ndarray]:
+        """Decode the whole trace `name` into frequency and level arrays."""
+        trace = self.traces[name]
+        freq = np.empty(trace.n_points)
+        level = np.empty(trace.n_points)
+        start = 0
+        for chunk_freq, chunk_level in self.chunks(name):
+            stop = start + chunk_freq.size
+            freq[start:stop] = chunk_freq
+            level[start:stop] = chunk_level
+            start = stop
+        return freq, level
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "ArchiveReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
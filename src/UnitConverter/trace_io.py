@@ -0,0 +1,88 @@
+import io
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+PathLike = Union[str, Path]
+
+
+def parse_trace(
+    content: bytes, delimiter: str = ",", skip_header: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parse the raw bytes of a two-column trace file into frequency and level arrays.
+
+    The expected layout is one point per line, frequency first and level second. Lines starting with
+    ``#`` are treated as comments.
+
+    Args:
+        content (bytes): The raw file content.
+        delimiter (str, optional): Column separator. Defaults to ",".
+        skip_header (int, optional): Number of leading lines to ignore (e.g. a column title row).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Frequency and level as float64 arrays.
+
+    Raises:
+        ValueError: If the content is not a numeric table with at least two columns.
+    """
+    table = np.loadtxt(
+        io.BytesIO(content),
+        delimiter=delimiter,
+        comments="#",
+        skiprows=skip_header,
+        ndmin=2,
+        dtype=np.float64,
+    )
+    if table.shape[1] < 2:
+        raise ValueError("Trace must have a frequency and a level column.")
+    return table[:, 0].copy(), table[:, 1].copy()
+
+
+def read_trace(
+    path: PathLike, delimiter: str = ",", skip_header: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Read a two-column trace file from disk.
+
+    See `parse_trace` for the expected layout.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Frequency and level as float64 arrays.
+    """
+    return parse_trace(Path(path).read_bytes(), delimiter, skip_header)
+
+
+def write_trace(
+    path: PathLike,
+    freq: np.ndarray,
+    level: np.ndarray,
+    delimiter: str = ",",
+    header: Optional[str] = None,
+) -> None:
+    """
+    Write frequency and level arrays as a two-column trace file.
+
+    Args:
+        path (PathLike): Destination file.
+        freq (np.ndarray): Frequency column.
+        level (np.ndarray): Level column, same length as `freq`.
+        delimiter (str, optional): Column separator. Defaults to ",".
+        header (str, optional): Written as a ``#`` comment line at the top of the file.
+
+    Raises:
+        ValueError: If `freq` and `level` differ in length.
+    """
+    freq = np.asarray(freq, dtype=np.float64)
+    level = np.asarray(level, dtype=np.float64)
+    if freq.shape != level.shape:
+        raise ValueError("freq and level must have the same length.")
+
+    np.savetxt(
+        path,
+        np.column_stack((freq, level)),
+        delimiter=delimiter,
+        fmt="%.10g",
+        header=header or "",
+    )
@@ -0,0 +1,111 @@
+from typing import Iterable
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from UnitConverter.rf_util import interpolate_sorted
+
+MERGE_MODES = ("max", "min", "average")
+
+
+class TraceMerger:
+    """
+    Resample many traces onto one common frequency grid and combine them on the fly.
+
+    Scans taken with different RBW/step settings or split over several antennas produce traces on
+    different frequency grids. Each trace passed to `add` is linearly interpolated onto `grid` and
+    immediately folded into a running max-hold, min-hold or average, so memory stays at one grid-sized
+    accumulator no matter how many traces are merged.
+
+    Only the part of the grid covered by a trace is touched, and the segment lookup for those grid
+    points is a single sorted-merge pass (see `rf_util.merge_index`). Grid points not covered by any
+    trace are NaN in the result.
+
+    Example:
+        >>> merger = TraceMerger(np.arange(30e6, 1e9, 10e3), mode="max")
+        >>> for freq, level in traces:
+        ...     merger.add(freq, level)
+        >>> level = merger.result()
+
+    Attributes:
+        grid (np.ndarray): The sorted target frequencies (Hz).
+        mode (str): One of "max", "min" or "average".
+        count (np.ndarray): Number of traces that covered each grid point.
+    """
+
+    def __init__(self, grid: ArrayLike, mode: str = "max"):
+        grid = np.asarray(grid, dtype=np.float64)
+        if grid.ndim != 1:
+            raise ValueError("grid must be one-dimensional.")
+        if np.any(np.diff(grid) < 0):
+            raise ValueError("grid must be sorted in ascending order.")
+        if mode not in MERGE_MODES:
+            raise ValueError(f"mode must be one of {MERGE_MODES}, got {mode!r}")
+
+        self.grid = grid
+        self.mode = mode
+        self.count = np.zeros(grid.size, dtype=np.int64)
+        self._acc = np.full(grid.size, np.nan if mode != "average" else 0.0)
+
+    def add(self, freq: ArrayLike, level: ArrayLike) -> None:
+        """
+        Resample one trace onto the grid and combine it with the traces added so far.
+
+        Args:
+            freq (ArrayLike): Strictly increasing frequencies of the trace (Hz).
+            level (ArrayLike): Levels at `freq`. An empty trace leaves the result unchanged; a
+                single point only covers the grid points at exactly its frequency.
+        """
+        freq = np.asarray(freq, dtype=np.float64)
+        if freq.size == 0:
+            return
+        lo = np.searchsorted(self.grid, freq[0], side="left")
+        hi = np.searchsorted(self.grid, freq[-1], side="right")
+        if lo >= hi:
+            return
+
+        if freq.size == 1:
+            # Nothing to interpolate: grid[lo:hi] are the grid points equal to freq[0]
+            resampled = np.full(hi - lo, np.asarray(level, dtype=np.float64).reshape(-1)[0])
+        else:
+            resampled = interpolate_sorted(freq, level, self.grid[lo:hi])
+        covered = ~np.isnan(resampled)
+        acc = self._acc[lo:hi]
+
+        if self.mode == "max":
+            np.fmax(acc, resampled, out=acc)
+        elif self.mode == "min":
+            np.fmin(acc, resampled, out=acc)
+        else:
+            np.add(acc, resampled, out=acc, where=covered)
+        self.count[lo:hi] += covered
+
+    def result(self) -> np.ndarray:
+        """
+        The combined levels on the grid.
+
+        Returns:
+            np.ndarray: One level per grid point, NaN where no trace covered the grid.
+        """
+        if self.mode != "average":
+            return self._acc.copy()
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > 0, self._acc / self.count, np.nan)
+
+
+def merge_traces(
+    traces: Iterable[tuple[ArrayLike, ArrayLike]], grid: ArrayLike, mode: str = "max"
+) -> np.ndarray:
+    """
+    Merge `(freq, level)` traces onto `grid` with max-hold, min-hold or average combining.
+
+    `traces` may be a generator, so traces can be read from disk one at a time. See `TraceMerger`.
+
+    Returns:
+        np.ndarray: One level per grid point, NaN where no trace covered the grid.
+    """
+    merger = TraceMerger(grid, mode)
+    for freq, level in traces:
+        merger.add(freq, level)
+    return merger.result()
@@ -0,0 +1,153 @@
+import heapq
+import itertools
+from typing import Any, Callable, NamedTuple, Optional, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from UnitConverter.base_converter import UnitEnum
+from UnitConverter.peaks import find_peaks
+from UnitConverter.rf_util import limit_convert
+
+
+class Emission(NamedTuple):
+    """
+    One point of a trace with its margin to the limit.
+
+    Attributes:
+        margin (float): Limit minus level in dB; negative above the limit.
+        freq (float): Frequency (Hz).
+        level (float): Measured level.
+        limit (float): Limit at this frequency, after distance rescaling.
+        source (str): The trace the point came from, e.g. its file name.
+        index (int): Index of the point in that trace.
+        unit (UnitEnum | str | None): Unit of `level` and `limit`.
+        context (dict): Conversion context of the trace, e.g. ``{"distance": 3.0}``.
+    """
+
+    margin: float
+    freq: float
+    level: float
+    limit: float
+    source: str
+    index: int
+    unit: Union[UnitEnum, str, None]
+    context: dict[str, Any]
+
+
+class WorstMarginSelector:
+    """
+    Streaming selection of the `n` emissions with the smallest margin to the limit over many traces.
+
+    Traces are passed to `update` one at a time and can be dropped afterwards: only a heap of the `n`
+    worst emissions seen so far is kept, so memory is O(n) however large the campaign. Per trace, the
+    points that can still enter the heap (margin below the current n-th worst) are found with one
+    vectorized comparison and `numpy.argpartition`; only those reach Python.
+
+    Example:
+        >>> worst = WorstMarginSelector(n=20, peaks=True)
+        >>> for path in Path("campaign").glob("*.csv"):
+        ...     freq, level = read_trace(path)
+        ...     worst.update(freq, level, class_b(freq), source=path.name,
+        ...                  limit_distance=10.0, distance=3.0, slope=20.0)
+        >>> report = worst.results()
+
+    Attributes:
+        n (int): Number of emissions kept.
+        peaks (bool): Consider only local margin minima (peaks of level minus limit), so the slopes of
+            one emission do not fill the list. Otherwise every point is a candidate.
+        excursion (float): With `peaks`, the minimum excursion of a peak in dB (see `find_peaks`).
+        traces (int): Number of traces seen.
+    """
+
+    def __init__(self, n: int = 10, peaks: bool = False, excursion: float = 0.0):
+        if n < 1:
+            raise ValueError("n must be positive.")
+        self.n = n
+        self.peaks = peaks
+        self.excursion = excursion
+        self.traces = 0
+        # Max-heap on the margin via negation; the counter keeps ties ordered by arrival
+        self._heap: list[tuple[float, int, Emission]] = []
+        self._counter = itertools.count()
+
+    @property
+    def threshold(self) -> float:
+        """Margin a point must be below to enter the selection; inf until `n` emissions are kept."""
+        if len(self._heap) < self.n:
+            return np.inf
+        return -self._heap[0][0]
+
+    def update(
+        self,
+        freq: ArrayLike,
+        level: ArrayLike,
+        limit: Union[ArrayLike, Callable[[np.ndarray], np.ndarray]],
+        source: str = "",
+        unit: Union[UnitEnum, str, None] = None,
+        context: Optional[dict[str, Any]] = None,
+        limit_distance: Optional[float] = None,
+        distance: Optional[float] = None,
+        slope: float = 20.0,
+    ) -> None:
+        """
+        Fold one trace into the selection.
+
+        Args:
+            freq (ArrayLike): Frequencies of the trace (Hz).
+            level (ArrayLike): Levels, in a dB unit.
+            limit (ArrayLike | Callable): Limit per point in the same unit, or a callable evaluating
+                the limit line at `freq` (e.g. a `CorrectionTable`).
+            source (str, optional): Name of the trace, reported with its emissions.
+            unit (UnitEnum | str, optional): Unit of the levels, reported with the emissions.
+            context (dict, optional): Conversion context, reported with the emissions.
+            limit_distance (float, optional): Distance the limit is specified at (m). Together with
+                `distance`, the limit is rescaled with `rf_util.limit_convert` first.
+            distance (float, optional): Measurement distance of the trace (m).
+            slope (float, optional): Distance extrapolation slope (dB/decade). Defaults to 20.
+
+        Raises:
+            ValueError: If the arrays differ in shape, or only one of the distances is given.
+        """
+        freq = np.asarray(freq, dtype=np.float64).reshape(-1)
+        level = np.asarray(level, dtype=np.float64).reshape(-1)
+        limit = np.asarray(limit(freq) if callable(limit) else limit, dtype=np.float64)
+        limit = np.broadcast_to(limit, freq.shape) if limit.ndim == 0 else limit.reshape(-1)
+        if not freq.shape == level.shape == limit.shape:
+            raise ValueError("freq, level and limit must have the same length.")
+        if (limit_distance is None) != (distance is None):
+            raise ValueError("Give both limit_distance and distance, or neither.")
+        self.traces += 1
+
+        if limit_distance is not None:
+            # limit_convert accepts Python numbers only, not NumPy scalars read from a table
+            limit = limit + limit_convert(float(limit_distance), float(distance), 0.0, float(slope))
+        margin = limit - level
+
+        if self.peaks:
+            candidates = find_peaks(-margin, -self.threshold, self.excursion)
+        else:
+            candidates = np.arange(margin.size)
+        with np.errstate(invalid="ignore"):
+            candidates = candidates[margin[candidates] < self.threshold]
+        if candidates.size > self.n:
+            nearest = np.argpartition(margin[candidates], self.n - 1)[: self.n]
+            candidates = candidates[nearest]
+
+        context = dict(context or {})
+        for i in candidates[np.argsort(margin[candidates], kind="stable")].tolist():
+            if margin[i] >= self.threshold:
+                break
+            emission = Emission(
+                float(margin[i]), float(freq[i]), float(level[i]), float(limit[i]),
+                source, i, unit, context,
+            )
+            entry = (-emission.margin, -next(self._counter), emission)
+            if len(self._heap) < self.n:
+                heapq.heappush(self._heap, entry)
+            else:
+                heapq.heapreplace(self._heap, entry)
+
+    def results(self) -> list[Emission]:
+        """The selected emissions, worst (smallest margin) first."""
+        return [entry[2] for entry in sorted(self._heap, key=lambda entry: (-entry[0], -entry[1]))]
@@ -0,0 +1,113 @@
+import tkinter as tk
+from typing import Callable
+
+import customtkinter
+import numpy as np
+
+from View.virtual_table_frame import VirtualTableFrame
+
+# Field separators accepted in pasted blocks, mapped to whitespace before splitting
+_SEPARATORS = str.maketrans({",": " ", ";": " ", "\t": " "})
+
+
+def parse_column(text: str, column: int = -1) -> np.ndarray:
+    """
+    Parse one column of numbers from a pasted block of text.
+
+    Each line is a row; fields may be separated by commas, semicolons, tabs or spaces, so a single
+    pasted column and a CSV/spreadsheet clipboard block are both accepted. Rows whose field is missing
+    or not a number (e.g. a header row) become NaN, so the result keeps one entry per input row.
+
+    Args:
+        text (str): The pasted text.
+        column (int, optional): Index of the field to take from each row. Defaults to the last one.
+
+    Returns:
+        np.ndarray: One float64 value per non-empty line.
+    """
+    tokens = []
+    for line in text.translate(_SEPARATORS).splitlines():
+        fields = line.split()
+        if not fields:
+            continue
+        try:
+            tokens.append(fields[column])
+        except IndexError:
+            tokens.append("nan")
+
+    try:
+        # Fast path: every token is a number, NumPy parses them all in C
+        return np.array(tokens, dtype=np.float64)
+    except ValueError:
+        return np.array([_to_float(token) for token in tokens], dtype=np.float64)
+
+
+def _to_float(token: str) -> float:
+    try:
+        return float(token)
+    except ValueError:
+        return np.nan
+
+
+class BulkConvertFrame(customtkinter.CTkFrame):
+    """
+    Paste-and-convert panel for a whole column of values.
+
+    The pasted text is parsed once, shortly after typing stops, and only again when the text actually
+    changed. Unit or parameter changes in the owning frame call `refresh`, which re-runs the batch
+    conversion on the already parsed values. Results are shown in a `VirtualTableFrame`, so only the
+    rows on screen are ever formatted.
+    """
+
+    # Delay between the last keystroke and parsing the text (ms)
+    PARSE_DELAY = 300
+
+    def __init__(self, parent, convert: Callable[[np.ndarray], np.ndarray]):
+        super().__init__(parent, fg_color="transparent")
+
+        self.convert = convert
+        self.values = np.empty(0)
+        self.results = np.empty(0)
+        self._parsed_text = ""
+        self._parse_job = None
+
+        self.input_label = customtkinter.CTkLabel(self, text="Paste values:")
+        self.input_label.grid(row=0, column=0, padx=(0, 12), sticky="w")
+
+        self.result_label = customtkinter.CTkLabel(self, text="Result:")
+        self.result_label.grid(row=0, column=1, sticky="w")
+
+        self.input_box = customtkinter.CTkTextbox(self, width=160, height=160)
+        self.input_box.grid(row=1, column=0, padx=(0, 12), pady=(0, 8), sticky="nsew")
+        self.input_box.bind("<KeyRelease>", self._schedule_parse)
+        self.input_box.bind("<<Paste>>", self._schedule_parse, add="+")
+
+        self.result_table = VirtualTableFrame(
+            self, headers=["Input", "Result"], height=140, column_width=110
+        )
+        self.result_table.grid(row=1, column=1, pady=(0, 8), sticky="nsew")
+
+    def refresh(self):
+        """Convert the parsed values again, e.g. after a unit change. Does not re-parse."""
+        try:
+            with np.errstate(all="ignore"):
+                self.results = self.convert(self.values)
+        except (ValueError, TypeError, KeyError, tk.TclError):
+            self.results = np.full(self.values.shape, np.nan)
+
+        self.result_table.set_data([self.values, self.results])
+
+    def _schedule_parse(self, *args):
+        if self._parse_job is not None:
+            self.after_cancel(self._parse_job)
+        self._parse_job = self.after(self.PARSE_DELAY, self._parse)
+
+    def _parse(self):
+        self._parse_job = None
+        text = self.input_box.get("0.0", "end")
+        if text == self._parsed_text:
+            return
+
+        self._parsed_text = text
+        self.values = parse_column(text)
+        self.refresh()
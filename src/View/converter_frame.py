@@ -0,0 +1,140 @@
+import tkinter as tk
+
+import customtkinter
+
+from UnitConverter.registry import registry
+from View.bulk_convert_frame import BulkConvertFrame
+
+
+class ConverterFrame(customtkinter.CTkFrame):
+    """
+    Generic unit converter for any converter in the registry, e.g. one installed as a plugin.
+
+    The unit menus are filled from the registry's cached unit listing, so building the frame does not
+    import the converter; that happens on the first conversion.
+    """
+
+    def __init__(self, master, title, name):
+        super().__init__(master)
+
+        self.name = name
+        labels = [unit.label for unit in registry.units(name)]
+        self.from_unit = labels[0]
+        self.to_unit = labels[0]
+
+        # ====== Row 0 ======
+
+        # Title label
+        self.title_label = customtkinter.CTkLabel(self, text=title)
+        self.title_label.cget("font").configure(size=22, weight="bold")
+        self.title_label.grid(
+            row=0, column=0, padx=10, pady=(10, 0), sticky="w", columnspan=3
+        )
+
+        # ====== Row 1 ======
+
+        self.from_value = tk.StringVar(value="")
+        self.from_value.trace_add("write", self.update_result)
+
+        self.from_entry = customtkinter.CTkEntry(
+            self,
+            textvariable=self.from_value,
+        )
+        self.from_entry.grid(row=1, column=0, padx=12, pady=(10, 5), sticky="w")
+
+        # Output label
+        self.to_label = customtkinter.CTkLabel(
+            self,
+            text="...",
+            fg_color=("#F9F9FA", "#343638"),
+            corner_radius=6,
+            width=138,
+            anchor="w",
+        )
+        self.to_label.grid(row=1, column=1, padx=(0, 12), pady=(10, 5), sticky="w")
+
+        # ====== Row 2 ======
+
+        self.from_option = customtkinter.CTkOptionMenu(
+            self,
+            values=labels,
+            command=self._on_from_unit_change,
+        )
+        self.from_option.grid(row=2, column=0, padx=12, pady=(0, 8), sticky="w")
+
+        self.to_option = customtkinter.CTkOptionMenu(
+            self,
+            values=labels,
+            command=self._on_to_unit_change,
+        )
+        self.to_option.grid(row=2, column=1, padx=(0, 12), pady=(0, 8), sticky="w")
+
+        self.from_option.set(self.from_unit)
+        self.to_option.set(self.to_unit)
+
+        # ====== Row 3 ======
+
+        # Bulk mode switch
+        self.bulk_mode = tk.BooleanVar(value=False)
+        self.bulk_switch = customtkinter.CTkSwitch(
+            self,
+            text="Bulk mode",
+            variable=self.bulk_mode,
+            command=self._on_bulk_mode_change,
+        )
+        self.bulk_switch.grid(row=3, column=0, padx=12, pady=(0, 8), sticky="w")
+
+        # ====== Row 4 ======
+
+        # Bulk paste-and-convert panel, shown in bulk mode only
+        self.bulk_frame = BulkConvertFrame(self, self._convert_bulk)
+
+    @property
+    def conv(self):
+        return registry.get(self.name)
+
+    def update_result(self, *args):
+        """Update the result label based on input."""
+        if self.bulk_mode.get():
+            self.bulk_frame.refresh()
+
+        try:
+            value = float(self.from_value.get())
+            from_unit = registry.unit(self.name, self.from_unit)
+            to_unit = registry.unit(self.name, self.to_unit)
+            result = self.conv.convert(value, from_unit, to_unit)
+            self.to_label.configure(text=f"{result:.10f}".rstrip("0").rstrip("."))
+        except (ValueError, TypeError, tk.TclError):
+            # TypeError: the converter needs parameters this generic frame cannot provide
+            self.to_label.configure(text="...")
+        except Exception as error:
+            # A plugin that fails to import or to convert must not break the event loop
+            self.to_label.configure(text=f"Error: {type(error).__name__}")
+
+    def _convert_bulk(self, values):
+        try:
+            return self.conv.convert_array(
+                values,
+                registry.unit(self.name, self.from_unit),
+                registry.unit(self.name, self.to_unit),
+            )
+        except Exception as error:
+            # Shown as NaN results by the bulk frame, like input it cannot convert
+            raise ValueError(f"Converter {self.name!r} failed: {error}") from error
+
+    def _on_bulk_mode_change(self):
+        if self.bulk_mode.get():
+            self.bulk_frame.grid(
+                row=4, column=0, padx=12, pady=(0, 8), sticky="nsew", columnspan=3
+            )
+            self.bulk_frame.refresh()
+        else:
+            self.bulk_frame.grid_remove()
+
+    def _on_from_unit_change(self, selected_value: str):
+        self.from_unit = selected_value
+        self.update_result()
+
+    def _on_to_unit_change(self, selected_value: str):
+        self.to_unit = selected_value
+        self.update_result()
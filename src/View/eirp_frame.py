@@ -2,7 +2,8 @@ import tkinter as tk
 
 import customtkinter
 
-from UnitConverter.eirp_converter import EIRPConverter, EIRP
+from UnitConverter.registry import registry
+from View.bulk_convert_frame import BulkConvertFrame
 
 
 class EIRPFrame(customtkinter.CTkFrame):
@@ -10,9 +11,10 @@ class EIRPFrame(customtkinter.CTkFrame):
     def __init__(self, parent, title):
         super().__init__(parent)
 
-        self.conv = EIRPConverter()
-        self.from_enum_var = EIRP.dbuv_per_m
-        self.to_enum_var = EIRP.EIRP_dBm
+        # Unit labels come from the registry's cached listing; the converter is imported on first use
+        labels = {unit.name: unit.label for unit in registry.units("eirp")}
+        self.from_unit = labels["dbuv_per_m"]
+        self.to_unit = labels["EIRP_dBm"]
 
         # ====== Row 0 ======
 
@@ -87,7 +89,7 @@ class EIRPFrame(customtkinter.CTkFrame):
         # 'Convert from' option menu
         self.from_option = customtkinter.CTkOptionMenu(
             self,
-            values=[name.value for name in EIRP],
+            values=list(labels.values()),
             command=self._from_option_onchange,
         )
         self.from_option.grid(row=4, column=2, padx=(0, 12), pady=4)
@@ -111,14 +113,46 @@ class EIRPFrame(customtkinter.CTkFrame):
 
         # 'Convert to' Option menu
         self.to_option = customtkinter.CTkOptionMenu(
-            self, values=[name.value for name in EIRP], command=self._to_option_onchange
+            self, values=list(labels.values()), command=self._to_option_onchange
         )
         self.to_option.grid(row=5, column=2, padx=(0, 12), pady=(4, 10))
 
-        self.from_option.set(self.from_enum_var.value)
-        self.to_option.set(self.to_enum_var.value)
+        self.from_option.set(self.from_unit)
+        self.to_option.set(self.to_unit)
+
+        # ====== Row 6 ======
+
+        # Bulk mode switch
+        self.bulk_mode = tk.BooleanVar(value=False)
+        self.bulk_switch = customtkinter.CTkSwitch(
+            self,
+            text="Bulk mode",
+            variable=self.bulk_mode,
+            command=self._on_bulk_mode_change,
+        )
+        self.bulk_switch.grid(row=6, column=0, padx=12, pady=(0, 8), sticky="w")
+
+        # ====== Row 7 ======
+
+        # Bulk paste-and-convert panel, shown in bulk mode only
+        self.bulk_frame = BulkConvertFrame(self, self._convert_bulk)
+
+    @property
+    def conv(self):
+        return registry.get("eirp")
+
+    @property
+    def from_enum_var(self):
+        return registry.unit("eirp", self.from_unit)
+
+    @property
+    def to_enum_var(self):
+        return registry.unit("eirp", self.to_unit)
 
     def update_result(self, *args):
+        if self.bulk_mode.get():
+            self.bulk_frame.refresh()
+
         try:
             value = float(self.from_entry.get())
 
@@ -135,10 +169,28 @@ class EIRPFrame(customtkinter.CTkFrame):
         except (ValueError, tk.TclError):
             self.result_label.configure(text="...")
 
+    def _convert_bulk(self, values):
+        return self.conv.convert_array(
+            values,
+            self.from_enum_var,
+            self.to_enum_var,
+            distance=float(self.distance.get()),
+            slope=float(self.slope.get()),
+        )
+
+    def _on_bulk_mode_change(self):
+        if self.bulk_mode.get():
+            self.bulk_frame.grid(
+                row=7, column=0, padx=12, pady=(0, 8), sticky="nsew", columnspan=3
+            )
+            self.bulk_frame.refresh()
+        else:
+            self.bulk_frame.grid_remove()
+
     def _from_option_onchange(self, selected_value: str):
-        self.from_enum_var = next(e for e in EIRP if e.value == selected_value)
+        self.from_unit = selected_value
         self.update_result()
 
     def _to_option_onchange(self, selected_value: str):
-        self.to_enum_var = next(e for e in EIRP if e.value == selected_value)
+        self.to_unit = selected_value
         self.update_result()
@@ -2,7 +2,8 @@ import tkinter as tk
 
 import customtkinter
 
-from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter
+from UnitConverter.registry import registry
+from View.bulk_convert_frame import BulkConvertFrame
 
 
 class FieldStrengthFrame(customtkinter.CTkFrame):
@@ -11,10 +12,10 @@ class FieldStrengthFrame(customtkinter.CTkFrame):
     def __init__(self, master, title):
         super().__init__(master)
 
-        self.conv = FieldStrengthConverter()
-        # Hold the selected enum and set default value
-        self.from_enum_var = FSUNIT.DBUV_PER_M
-        self.to_enum_var = FSUNIT.DBUV_PER_M
+        # Unit labels come from the registry's cached listing; the converter is imported on first use
+        labels = {unit.name: unit.label for unit in registry.units("fs")}
+        self.from_unit = labels["DBUV_PER_M"]
+        self.to_unit = labels["DBUV_PER_M"]
 
         # ====== Row 0 ======
 
@@ -71,7 +72,7 @@ class FieldStrengthFrame(customtkinter.CTkFrame):
         # Input unit selector
         self.from_option = customtkinter.CTkOptionMenu(
             self,
-            values=[name.value for name in FSUNIT],
+            values=list(labels.values()),
             command=self._on_from_unit_change,
         )
         self.from_option.grid(row=3, column=0, padx=12, pady=(0, 8), sticky="w")
@@ -79,16 +80,48 @@ class FieldStrengthFrame(customtkinter.CTkFrame):
         # Output unit selector
         self.to_option = customtkinter.CTkOptionMenu(
             self,
-            values=[name.value for name in FSUNIT],
+            values=list(labels.values()),
             command=self._on_to_unit_change,
         )
         self.to_option.grid(row=3, column=1, padx=(0, 12), pady=(0, 8), sticky="w")
 
-        self.from_option.set(self.from_enum_var.value)
-        self.to_option.set(self.to_enum_var.value)
+        self.from_option.set(self.from_unit)
+        self.to_option.set(self.to_unit)
+
+        # ====== Row 4 ======
+
+        # Bulk mode switch
+        self.bulk_mode = tk.BooleanVar(value=False)
+        self.bulk_switch = customtkinter.CTkSwitch(
+            self,
+            text="Bulk mode",
+            variable=self.bulk_mode,
+            command=self._on_bulk_mode_change,
+        )
+        self.bulk_switch.grid(row=4, column=0, padx=12, pady=(0, 8), sticky="w")
+
+        # ====== Row 5 ======
+
+        # Bulk paste-and-convert panel, shown in bulk mode only
+        self.bulk_frame = BulkConvertFrame(self, self._convert_bulk)
+
+    @property
+    def conv(self):
+        return registry.get("fs")
+
+    @property
+    def from_enum_var(self):
+        return registry.unit("fs", self.from_unit)
+
+    @property
+    def to_enum_var(self):
+        return registry.unit("fs", self.to_unit)
 
     def update_result(self, *args):
         """Update the result label based on input."""
+        if self.bulk_mode.get():
+            self.bulk_frame.refresh()
+
         try:
             value = float(self.from_value.get())
         except (ValueError, tk.TclError):
@@ -102,18 +135,24 @@ class FieldStrengthFrame(customtkinter.CTkFrame):
         except (ValueError, tk.TclError) as e:
             print(e)
 
+    def _convert_bulk(self, values):
+        return self.conv.convert_array(values, self.from_enum_var, self.to_enum_var)
+
+    def _on_bulk_mode_change(self):
+        if self.bulk_mode.get():
+            self.bulk_frame.grid(
+                row=5, column=0, padx=12, pady=(0, 8), sticky="nsew", columnspan=3
+            )
+            self.bulk_frame.refresh()
+        else:
+            self.bulk_frame.grid_remove()
+
     def _on_from_unit_change(self, selected_value: str):
-        # without next... we will get a list — but we only want one item, the first (and only) match.
-        # equivalent code:
-        # for e in Temperature:
-        #     if e.value == selected_value:
-        #     self.enum_var = e
-        #     break
-        self.from_enum_var = next(e for e in FSUNIT if e.value == selected_value)
+        self.from_unit = selected_value
         self.update_result()
         # print(f"From enum: {self.from_enum_var}")
 
     def _on_to_unit_change(self, selected_value: str):
-        self.to_enum_var = next(e for e in FSUNIT if e.value == selected_value)
+        self.to_unit = selected_value
         self.update_result()
         # print(f"To enum: {self.to_enum_var}")
@@ -0,0 +1,235 @@
+import json
+import time
+import tkinter as tk
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Sequence, Union
+
+import customtkinter
+
+from UnitConverter.stream import LatencyHistogram
+
+# Opt-in switch of `App`: "1" prints a summary on exit, a file name also writes the JSON report there
+ENV_VAR = "RFCALC_LATENCY"
+
+# From well below one display frame (16 ms at 60 Hz) to clearly sluggish
+UI_EDGES = (
+    0.0005, 0.001, 0.002, 0.005, 0.008, 0.016,
+    0.033, 0.05, 0.1, 0.2, 0.5, 1.0,
+)
+
+
+class _FrameState:
+    """Latencies of one instrumented frame."""
+
+    def __init__(self, edges: Sequence[float]):
+        self.update = LatencyHistogram(edges)
+        self.render = LatencyHistogram(edges)
+        self.written: Optional[float] = None
+        self.updated: Optional[float] = None
+
+
+class LatencyMonitor:
+    """
+    Debug instrumentation of GUI responsiveness.
+
+    For every instrumented frame it measures, per keystroke (`StringVar` write):
+
+    - ``update``: time until the frame has configured a new label text, i.e. the conversion and
+      formatting done in the frame's trace callback;
+    - ``render``: time until Tk has also processed the pending idle tasks, which is when the new text
+      is drawn.
+
+    It further records how long each frame took to construct at startup, the time until the event
+    loop first went idle, and the event loop's busy/idle split. Busy time is estimated from the lag of
+    a heartbeat timer: whenever the timer fires late, the loop was busy for that long. Lags below the
+    timer resolution of about 1 ms are not visible.
+
+    Example:
+        >>> monitor = LatencyMonitor(root)
+        >>> with monitor.construction("EIRP Calculator"):
+        ...     frame = EIRPFrame(root, "EIRP Calculator")
+        >>> monitor.instrument(frame, "EIRP Calculator")
+        >>> monitor.start()
+        >>> root.mainloop()
+        >>> print(monitor.summary())
+
+    Attributes:
+        root: The Tk root (or any widget) whose event loop is measured.
+        heartbeat_ms (int): Interval of the heartbeat timer.
+        construction_times (dict[str, float]): Seconds spent constructing each widget.
+        startup_seconds (float | None): Seconds from creating the monitor to the first idle loop.
+        loop_lag (LatencyHistogram): Lateness of the heartbeat timer.
+        busy_seconds (float): Estimated time the event loop was busy since `start`.
+    """
+
+    def __init__(
+        self,
+        root: Any,
+        heartbeat_ms: int = 10,
+        edges: Sequence[float] = UI_EDGES,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.root = root
+        self.heartbeat_ms = heartbeat_ms
+        self.edges = tuple(edges)
+        self.clock = clock
+        self.created = clock()
+        self.construction_times: dict[str, float] = {}
+        self.startup_seconds: Optional[float] = None
+        self.loop_lag = LatencyHistogram(edges)
+        self.busy_seconds = 0.0
+        self._frames: dict[str, _FrameState] = {}
+        self._started: Optional[float] = None
+        self._due = 0.0
+        self._job = None
+
+    @contextmanager
+    def construction(self, name: str) -> Iterator[None]:
+        """Time the construction of a widget inside the block."""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.construction_times[name] = self.clock() - start
+
+    def instrument(
+        self,
+        frame: Any,
+        name: str,
+        variables: Optional[Sequence[Any]] = None,
+        labels: Optional[Sequence[Any]] = None,
+    ) -> None:
+        """
+        Measure the keystroke-to-result latency of a frame.
+
+        Args:
+            frame: The frame to measure.
+            name (str): Name of the frame in the report.
+            variables (Sequence, optional): Input variables; defaults to the frame's `tk.StringVar`
+                attributes.
+            labels (Sequence, optional): Result labels; defaults to the frame's `CTkLabel` attributes.
+        """
+        if variables is None:
+            variables = [v for v in vars(frame).values() if isinstance(v, tk.StringVar)]
+        if labels is None:
+            labels = [v for v in vars(frame).values() if isinstance(v, customtkinter.CTkLabel)]
+
+        state = self._frames.setdefault(name, _FrameState(self.edges))
+        for variable in variables:
+            # Traces run most recent first, so this one sees the write before the frame's callback
+            variable.trace_add("write", lambda *args: self._written(state))
+        for label in labels:
+            self._wrap_configure(label, state)
+
+    def _wrap_configure(self, label: Any, state: _FrameState) -> None:
+        configure = label.configure
+
+        def timed_configure(*args, **kwargs):
+            result = configure(*args, **kwargs)
+            if "text" in kwargs and state.written is not None and state.updated is None:
+                state.updated = self.clock()
+            return result
+
+        label.configure = timed_configure
+
+    def _written(self, state: _FrameState) -> None:
+        if state.written is None:
+            state.written = self.clock()
+            self.root.after_idle(self._settle, state)
+
+    def _settle(self, state: _FrameState) -> None:
+        if state.updated is not None:
+            state.update.record(state.updated - state.written)
+            # Redraws were queued as idle tasks by the label update; finish them before timing
+            self.root.update_idletasks()
+            state.render.record(self.clock() - state.written)
+        state.written = None
+        state.updated = None
+
+    def start(self) -> None:
+        """Start the heartbeat and wait for the first idle loop; call before `mainloop`."""
+        self._started = self.clock()
+        self.root.after_idle(self._first_idle)
+        self._schedule(self._started)
+
+    def stop(self) -> None:
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+    def _first_idle(self) -> None:
+        if self.startup_seconds is None:
+            self.startup_seconds = self.clock() - self.created
+
+    def _schedule(self, now: float) -> None:
+        self._due = now + self.heartbeat_ms / 1000
+        self._job = self.root.after(self.heartbeat_ms, self._beat)
+
+    def _beat(self) -> None:
+        now = self.clock()
+        lag = max(now - self._due, 0.0)
+        self.loop_lag.record(lag)
+        self.busy_seconds += lag
+        self._schedule(now)
+
+    @property
+    def idle_seconds(self) -> float:
+        """Estimated time the event loop was idle since `start`."""
+        if self._started is None:
+            return 0.0
+        return max(self.clock() - self._started - self.busy_seconds, 0.0)
+
+    def report(self) -> dict[str, Any]:
+        """All measurements as a JSON-serializable dict; times in milliseconds."""
+
+        def histogram(h: LatencyHistogram) -> dict[str, float]:
+            return {
+                "count": h.count,
+                "mean_ms": h.mean * 1e3,
+                "p50_ms": h.percentile(50) * 1e3,
+                "p99_ms": h.percentile(99) * 1e3,
+                "max_ms": h.max * 1e3,
+            }
+
+        return {
+            "startup_ms": None if self.startup_seconds is None else self.startup_seconds * 1e3,
+            "construction_ms": {name: t * 1e3 for name, t in self.construction_times.items()},
+            "event_loop": {
+                "busy_ms": self.busy_seconds * 1e3,
+                "idle_ms": self.idle_seconds * 1e3,
+                "lag": histogram(self.loop_lag),
+            },
+            "frames": {
+                name: {"update": histogram(s.update), "render": histogram(s.render)}
+                for name, s in self._frames.items()
+            },
+        }
+
+    def summary(self) -> str:
+        """Human-readable summary of `report`."""
+        report = self.report()
+        lines = []
+        if report["startup_ms"] is not None:
+            lines.append(f"startup: {report['startup_ms']:.1f} ms until first idle")
+        for name, ms in report["construction_ms"].items():
+            lines.append(f"  construct {name}: {ms:.1f} ms")
+        loop = report["event_loop"]
+        total = loop["busy_ms"] + loop["idle_ms"]
+        if total:
+            lines.append(
+                f"event loop: busy {loop['busy_ms']:.0f} ms, idle {loop['idle_ms']:.0f} ms "
+                f"({loop['busy_ms'] / total:.1%} busy), max lag {loop['lag']['max_ms']:.1f} ms"
+            )
+        for name, frame in report["frames"].items():
+            for kind in ("update", "render"):
+                h = frame[kind]
+                if h["count"]:
+                    lines.append(
+                        f"{name} {kind}: {h['count']} edits, mean {h['mean_ms']:.2f} ms, "
+                        f"p99 <= {h['p99_ms']:g} ms, max {h['max_ms']:.2f} ms"
+                    )
+        return "\n".join(lines)
+
+    def write_report(self, path: Union[str, Path]) -> None:
+        Path(path).write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
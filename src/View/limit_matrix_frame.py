@@ -0,0 +1,120 @@
+import re
+import tkinter as tk
+from typing import Sequence
+
+import customtkinter
+import numpy as np
+
+from UnitConverter import rf_util as rf
+from View.virtual_table_frame import VirtualTableFrame
+
+
+def parse_limits(text: str) -> list[float]:
+    """Parse limit values separated by commas, semicolons or whitespace; invalid tokens are skipped."""
+    limits = []
+    for token in re.split(r"[,;\s]+", text.strip()):
+        try:
+            limits.append(float(token))
+        except ValueError:
+            continue
+    return limits
+
+
+def matrix_columns(
+    limits: Sequence[float],
+    reference: int,
+    distances: Sequence[float] = rf.COMMON_DISTANCES,
+    slopes: Sequence[float] = rf.COMMON_SLOPES,
+) -> list[np.ndarray]:
+    """
+    Table columns for limits specified at ``distances[reference]``.
+
+    Returns:
+        list[np.ndarray]: The slope and limit of every row, followed by one column per distance with
+        the converted limit; rows are ordered by slope, then limit.
+    """
+    matrix = rf.limit_convert_matrix(limits, distances, slopes)
+    values = matrix[:, :, reference, :].reshape(-1, len(distances))
+    return [
+        np.repeat(np.asarray(slopes, dtype=np.float64), len(limits)),
+        np.tile(np.asarray(limits, dtype=np.float64), len(slopes)),
+        *values.T,
+    ]
+
+
+class LimitMatrixFrame(customtkinter.CTkFrame):
+    """
+    Planning table of limits converted to all common test distances at 20 and 40 dB/decade.
+
+    Enter one or more limit values and the distance they are specified at; the whole table is computed
+    with a single (cached) `rf_util.limit_convert_matrix` call.
+    """
+
+    def __init__(self, parent, title):
+        super().__init__(parent)
+
+        self.distances = rf.COMMON_DISTANCES
+        self.slopes = rf.COMMON_SLOPES
+
+        # ====== Row 0 ======
+
+        # Title label
+        self.title_label = customtkinter.CTkLabel(self, text=title)
+        self.title_label.cget("font").configure(size=22, weight="bold")
+        self.title_label.grid(
+            row=0, column=0, padx=12, pady=(10, 0), sticky="w", columnspan=2
+        )
+
+        # ====== Row 1 ======
+
+        self.limits_label = customtkinter.CTkLabel(self, text="Limits (dB):")
+        self.limits_label.grid(row=1, column=0, padx=12, pady=(10, 0), sticky="w")
+
+        self.limits_val = tk.StringVar(value="")
+        self.limits_val.trace_add("write", self.update_result)
+
+        self.limits_entry = customtkinter.CTkEntry(
+            self,
+            textvariable=self.limits_val,
+            placeholder_text="e.g. 30, 37, 40",
+        )
+        self.limits_entry.grid(row=1, column=1, padx=12, pady=(10, 0), sticky="ew")
+
+        # ====== Row 2 ======
+
+        self.reference_label = customtkinter.CTkLabel(self, text="Specified at:")
+        self.reference_label.grid(row=2, column=0, padx=12, pady=(10, 0), sticky="w")
+
+        self.reference_option = customtkinter.CTkOptionMenu(
+            self,
+            values=[f"{d:g} m" for d in self.distances],
+            command=self.update_result,
+        )
+        self.reference_option.set("10 m")
+        self.reference_option.grid(row=2, column=1, padx=12, pady=(10, 0), sticky="w")
+
+        # ====== Row 3 ======
+
+        self.table = VirtualTableFrame(
+            self,
+            headers=["dB/dec", "Limit"] + [f"{d:g} m" for d in self.distances],
+            height=140,
+            column_width=56,
+            formatter=_format_db,
+        )
+        self.table.grid(
+            row=3, column=0, padx=12, pady=(10, 10), sticky="nsew", columnspan=2
+        )
+
+    def update_result(self, *args):
+        limits = parse_limits(self.limits_val.get())
+        if not limits:
+            self.table.set_data([np.empty(0)] * (len(self.distances) + 2))
+            return
+
+        reference = [f"{d:g} m" for d in self.distances].index(self.reference_option.get())
+        self.table.set_data(matrix_columns(limits, reference, self.distances, self.slopes))
+
+
+def _format_db(value: float) -> str:
+    return "..." if np.isnan(value) else f"{value:.2f}".rstrip("0").rstrip(".")
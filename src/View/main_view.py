@@ -1,19 +1,40 @@
+import os
+import sys
+from contextlib import nullcontext
+from typing import Optional
+
 import customtkinter
 
+from UnitConverter.registry import registry
 from View.beamwidth_frame import BeamwidthFrame
+from View.converter_frame import ConverterFrame
 from View.eirp_frame import EIRPFrame
 from View.field_strength_frame import FieldStrengthFrame
 from View.interpolate_frame import InterpolateFrame
+from View.latency import ENV_VAR, LatencyMonitor
 from View.limit_convert_frame import LimitConvertFrame
+from View.limit_matrix_frame import LimitMatrixFrame
 from View.sidebar_frame import SidebarFrame
+from View.trace_plot_frame import TracePlotFrame
 
 
 class App(customtkinter.CTk):
-    """Main application window."""
+    """
+    Main application window.
+
+    Args:
+        latency (bool, optional): Measure keystroke-to-result latency, event loop load and startup
+            time with a `LatencyMonitor` (``Ctrl+Shift+L`` prints a summary). Defaults to on if the
+            ``RFCALC_LATENCY`` environment variable is set.
+    """
 
-    def __init__(self):
+    def __init__(self, latency: Optional[bool] = None):
         super().__init__()
 
+        if latency is None:
+            latency = bool(os.environ.get(ENV_VAR))
+        self.latency = LatencyMonitor(self) if latency else None
+
         self.title("RF Calculator")
         self.geometry("1130x600")
         customtkinter.set_default_color_theme("blue")
@@ -38,28 +59,82 @@ class App(customtkinter.CTk):
         scroll_mainframe.grid(row=0, column=1, sticky="nsew", rowspan=4)
 
         # ====== Row 0 ======
-        fs_frame = FieldStrengthFrame(scroll_mainframe, "Field Strength Converter")
+        with self._timed("Field Strength Converter"):
+            fs_frame = FieldStrengthFrame(scroll_mainframe, "Field Strength Converter")
         fs_frame.grid(row=0, column=1, padx=(10, 0), pady=(10, 0), sticky="nsew")
 
-        e_frame = EIRPFrame(scroll_mainframe, "EIRP Calculator")
+        with self._timed("EIRP Calculator"):
+            e_frame = EIRPFrame(scroll_mainframe, "EIRP Calculator")
         e_frame.grid(row=0, column=2, padx=(10, 0), pady=(10, 0), sticky="nsew")
 
         # ====== Row 1 ======
-        i_frame = InterpolateFrame(scroll_mainframe, "Interpolate")
+        with self._timed("Interpolate"):
+            i_frame = InterpolateFrame(scroll_mainframe, "Interpolate")
         i_frame.grid(row=1, column=1, padx=(10, 0), pady=(10, 0), sticky="nsew")
 
-        l_frame = LimitConvertFrame(scroll_mainframe, "Limit Convert")
+        with self._timed("Limit Convert"):
+            l_frame = LimitConvertFrame(scroll_mainframe, "Limit Convert")
         l_frame.grid(row=1, column=2, padx=(10, 0), pady=(10, 0), sticky="nsew")
 
         # ====== Row 2 ======
 
-        b_frame = BeamwidthFrame(scroll_mainframe, "Antenna to EUT Distance")
+        with self._timed("Antenna to EUT Distance"):
+            b_frame = BeamwidthFrame(scroll_mainframe, "Antenna to EUT Distance")
         b_frame.grid(row=2, column=1, padx=(10, 0), pady=(10, 10), sticky="nsew")
 
+        with self._timed("Trace Plot"):
+            p_frame = TracePlotFrame(scroll_mainframe, "Trace Plot")
+        p_frame.grid(row=2, column=2, padx=(10, 0), pady=(10, 10), sticky="nsew")
+
+        # ====== Row 3 ======
+
+        with self._timed("Limit Matrix"):
+            m_frame = LimitMatrixFrame(scroll_mainframe, "Limit Matrix")
+        m_frame.grid(row=3, column=1, padx=(10, 0), pady=(0, 10), sticky="nsew")
+
+        # ====== Row 3+ ======
+
+        # Converters added through the registry (plugins) get a generic frame each
+        frames = [fs_frame, e_frame, i_frame, l_frame, b_frame, p_frame, m_frame]
+        for cell, name in enumerate(
+            [name for name in registry.names() if name not in ("fs", "eirp")], start=1
+        ):
+            title = name.replace("_", " ").title()
+            row, column = 3 + cell // 2, 1 + cell % 2
+            try:
+                with self._timed(title):
+                    frame = ConverterFrame(scroll_mainframe, title, name)
+            except Exception as error:
+                # A broken plugin only loses its own frame
+                message = f"{title}: plugin failed to load ({type(error).__name__}: {error})"
+                print(message, file=sys.stderr)
+                frame = customtkinter.CTkLabel(
+                    scroll_mainframe, text=message, wraplength=400, justify="left"
+                )
+                frame.grid(row=row, column=column, padx=(10, 0), pady=(0, 10), sticky="nw")
+                continue
+            frame.grid(row=row, column=column, padx=(10, 0), pady=(0, 10), sticky="nsew")
+            frames.append(frame)
+
+        if self.latency:
+            for frame in frames:
+                self.latency.instrument(frame, frame.title_label.cget("text"))
+            self.bind_all("<Control-L>", lambda event: print(self.latency.summary()))
+            self.latency.start()
+
+    def _timed(self, name: str):
+        """Time the construction of a frame if latency measurement is on."""
+        return self.latency.construction(name) if self.latency else nullcontext()
+
 
 def main():
     app = App()
     app.mainloop()
+    if app.latency:
+        print(app.latency.summary())
+        report = os.environ.get(ENV_VAR, "")
+        if report not in ("", "1"):
+            app.latency.write_report(report)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,345 @@
+import tkinter as tk
+from tkinter import filedialog
+from typing import Optional
+
+import customtkinter
+import numpy as np
+from numpy.typing import ArrayLike
+
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter
+from UnitConverter.trace_io import read_trace
+
+TRACE_COLORS = ("#1f6aa5", "#2fa572", "#d9822b", "#8e44ad", "#c0392b")
+LIMIT_COLOR = "#e74c3c"
+
+
+class MinMaxPyramid:
+    """
+    Multi-resolution min/max summary of a trace for fast plotting.
+
+    Level 0 is the trace itself; level k holds the minimum and maximum of every block of 2**k samples.
+    The pyramid is built once in O(n) and takes about twice the memory of the trace. `decimate` then
+    answers "min and max per pixel column" for any zoom window by reading the coarsest level that still
+    has at least one block per pixel, so the cost depends on the pixel width, not on the number of
+    samples in view, and a one-sample peak is never dropped.
+    """
+
+    def __init__(self, x: ArrayLike, y: ArrayLike):
+        self.x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if self.x.shape != y.shape or self.x.ndim != 1:
+            raise ValueError("x and y must be one-dimensional and of the same length.")
+
+        self.levels = [(y, y)]
+        mins, maxs = y, y
+        while mins.size > 1:
+            if mins.size % 2:
+                mins = np.append(mins, mins[-1])
+                maxs = np.append(maxs, maxs[-1])
+            mins = np.fmin(mins[0::2], mins[1::2])
+            maxs = np.fmax(maxs[0::2], maxs[1::2])
+            self.levels.append((mins, maxs))
+
+    def decimate(
+        self, x_min: float, x_max: float, width: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Reduce the samples between `x_min` and `x_max` to at most about `width` min/max pairs.
+
+        Args:
+            x_min (float): Left edge of the view.
+            x_max (float): Right edge of the view.
+            width (int): Width of the view in pixels.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: x position, minimum and maximum of every column.
+            When the view holds fewer than two samples per pixel the raw samples are returned
+            (minimum and maximum are then the same array).
+        """
+        n = self.x.size
+        # One extra sample on each side so lines continue to the edge of the view
+        i0 = max(int(np.searchsorted(self.x, x_min, side="left")) - 1, 0)
+        i1 = min(int(np.searchsorted(self.x, x_max, side="right")) + 1, n)
+        count = i1 - i0
+        width = max(int(width), 1)
+
+        if count <= 2 * width:
+            y = self.levels[0][0][i0:i1]
+            return self.x[i0:i1], y, y
+
+        # Block size 2**k with 1 to 2 blocks per pixel column
+        k = min(int(np.log2(count / width)), len(self.levels) - 1)
+        mins, maxs = self.levels[k]
+        j0 = i0 >> k
+        j1 = ((i1 - 1) >> k) + 1
+
+        edges = np.unique(np.linspace(j0, j1, width + 1)[:-1].astype(np.int64))
+        y_min = np.fmin.reduceat(mins[j0:j1], edges - j0)
+        y_max = np.fmax.reduceat(maxs[j0:j1], edges - j0)
+        x = self.x[np.minimum(edges << k, n - 1)]
+        return x, y_min, y_max
+
+
+class TracePlotFrame(customtkinter.CTkFrame):
+    """
+    Plot of converted traces and limit lines.
+
+    Traces are read from two-column files in dBμV/m and shown in the unit picked in the option menu,
+    converted with `FieldStrengthConverter`. Every redraw goes through `MinMaxPyramid.decimate`, so
+    zooming (mouse wheel) and panning (drag) stay responsive for traces with millions of points.
+    Double-click resets the view.
+    """
+
+    MARGIN_LEFT = 56
+    MARGIN_BOTTOM = 24
+    MARGIN = 8
+
+    def __init__(self, parent, title):
+        super().__init__(parent)
+
+        self.conv = FieldStrengthConverter()
+        self.unit = FSUNIT.DBUV_PER_M
+
+        # name -> [freq, level in dBμV/m, color, pyramid in display unit]
+        self.traces: dict[str, list] = {}
+        self.x_range: Optional[tuple[float, float]] = None
+        self._drag_x: Optional[int] = None
+
+        self.grid_columnconfigure(3, weight=1)
+        self.grid_rowconfigure(2, weight=1)
+
+        # ====== Row 0 ======
+
+        # Title label
+        self.title_label = customtkinter.CTkLabel(self, text=title)
+        self.title_label.cget("font").configure(size=22, weight="bold")
+        self.title_label.grid(
+            row=0, column=0, padx=12, pady=(10, 0), sticky="w", columnspan=4
+        )
+
+        # ====== Row 1 ======
+
+        self.load_button = customtkinter.CTkButton(
+            self, text="Load trace", width=96, command=self._on_load_trace
+        )
+        self.load_button.grid(row=1, column=0, padx=(12, 4), pady=(10, 4))
+
+        self.limit_button = customtkinter.CTkButton(
+            self, text="Load limit", width=96, command=self._on_load_limit
+        )
+        self.limit_button.grid(row=1, column=1, padx=4, pady=(10, 4))
+
+        self.clear_button = customtkinter.CTkButton(
+            self, text="Clear", width=64, command=self.clear
+        )
+        self.clear_button.grid(row=1, column=2, padx=4, pady=(10, 4))
+
+        self.unit_option = customtkinter.CTkOptionMenu(
+            self,
+            values=[name.value for name in FSUNIT],
+            command=self._on_unit_change,
+            width=110,
+        )
+        self.unit_option.grid(row=1, column=3, padx=(4, 12), pady=(10, 4), sticky="e")
+        self.unit_option.set(self.unit.value)
+
+        # ====== Row 2 ======
+
+        self.canvas = tk.Canvas(self, width=424, height=240, highlightthickness=0)
+        self.canvas.grid(
+            row=2, column=0, padx=12, pady=(4, 4), sticky="nsew", columnspan=4
+        )
+        self.canvas.bind("<Configure>", lambda event: self.redraw())
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", self._on_wheel)
+        self.canvas.bind("<Button-5>", self._on_wheel)
+        self.canvas.bind("<ButtonPress-1>", self._on_drag_start)
+        self.canvas.bind("<B1-Motion>", self._on_drag)
+        self.canvas.bind("<Double-Button-1>", lambda event: self.reset_view())
+
+        # ====== Row 3 ======
+
+        # Status label, e.g. why a file could not be loaded
+        self.status_label = customtkinter.CTkLabel(self, text="", anchor="w")
+        self.status_label.grid(
+            row=3, column=0, padx=12, pady=(0, 10), sticky="ew", columnspan=4
+        )
+
+    def add_trace(
+        self, name: str, freq: ArrayLike, level: ArrayLike, color: Optional[str] = None
+    ) -> None:
+        """
+        Add or replace a trace.
+
+        Args:
+            name (str): Key of the trace; adding the same name again replaces it.
+            freq (ArrayLike): Sorted frequencies (Hz).
+            level (ArrayLike): Levels in dBμV/m.
+            color (str, optional): Line color. Picked from `TRACE_COLORS` by default.
+        """
+        freq = np.asarray(freq, dtype=np.float64)
+        level = np.asarray(level, dtype=np.float64)
+        if color is None:
+            color = TRACE_COLORS[len(self.traces) % len(TRACE_COLORS)]
+
+        self.traces[name] = [freq, level, color, self._pyramid(freq, level)]
+        if self.x_range is None:
+            self.reset_view()
+        else:
+            self.redraw()
+
+    def clear(self) -> None:
+        self.traces.clear()
+        self.x_range = None
+        self.redraw()
+
+    def reset_view(self) -> None:
+        """Zoom out to the full frequency range of all traces."""
+        if not self.traces:
+            self.x_range = None
+        else:
+            self.x_range = (
+                min(freq[0] for freq, *_ in self.traces.values()),
+                max(freq[-1] for freq, *_ in self.traces.values()),
+            )
+        self.redraw()
+
+    def redraw(self) -> None:
+        self.canvas.delete("plot")
+        if not self.traces or self.x_range is None:
+            return
+
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        left, top = self.MARGIN_LEFT, self.MARGIN
+        plot_w = max(width - left - self.MARGIN, 1)
+        plot_h = max(height - top - self.MARGIN_BOTTOM, 1)
+        x0, x1 = self.x_range
+
+        columns = []
+        for _, _, color, pyramid in self.traces.values():
+            x, y_min, y_max = pyramid.decimate(x0, x1, plot_w)
+            columns.append((x, y_min, y_max, color))
+
+        finite = [np.concatenate((c[1], c[2])) for c in columns]
+        finite = np.concatenate(finite)
+        finite = finite[np.isfinite(finite)]
+        if finite.size == 0:
+            return
+        y0, y1 = float(finite.min()), float(finite.max())
+        pad = (y1 - y0) * 0.05 or 1.0
+        y0, y1 = y0 - pad, y1 + pad
+
+        def to_px(x):
+            return left + (x - x0) / ((x1 - x0) or 1.0) * plot_w
+
+        def to_py(y):
+            return top + (y1 - y) / (y1 - y0) * plot_h
+
+        for x, y_min, y_max, color in columns:
+            ok = np.isfinite(y_min) & np.isfinite(y_max)
+            if np.count_nonzero(ok) < 2:
+                continue
+            px = to_px(x[ok])
+            # Vertical min/max stroke per column, joined into one polyline
+            coords = np.empty((px.size, 4))
+            coords[:, 0] = px
+            coords[:, 1] = to_py(y_min[ok])
+            coords[:, 2] = px
+            coords[:, 3] = to_py(y_max[ok])
+            self.canvas.create_line(*coords.ravel().tolist(), fill=color, tags="plot")
+
+        self._draw_axes(left, top, plot_w, plot_h, (x0, x1), (y0, y1))
+
+    def _draw_axes(self, left, top, plot_w, plot_h, x_range, y_range):
+        color = "gray50"
+        self.canvas.create_rectangle(
+            left, top, left + plot_w, top + plot_h, outline=color, tags="plot"
+        )
+        for i in range(5):
+            frac = i / 4
+            x = x_range[0] + frac * (x_range[1] - x_range[0])
+            self.canvas.create_text(
+                left + frac * plot_w,
+                top + plot_h + 4,
+                text=_format_freq(x),
+                anchor="n",
+                fill=color,
+                tags="plot",
+            )
+            y = y_range[0] + frac * (y_range[1] - y_range[0])
+            self.canvas.create_text(
+                left - 4,
+                top + (1 - frac) * plot_h,
+                text=f"{y:.4g}",
+                anchor="e",
+                fill=color,
+                tags="plot",
+            )
+
+    def _pyramid(self, freq: np.ndarray, level: np.ndarray) -> MinMaxPyramid:
+        with np.errstate(all="ignore"):
+            display = self.conv.convert_array(level, FSUNIT.DBUV_PER_M, self.unit)
+        return MinMaxPyramid(freq, display)
+
+    def _on_unit_change(self, selected_value: str):
+        self.unit = next(e for e in FSUNIT if e.value == selected_value)
+        for trace in self.traces.values():
+            trace[3] = self._pyramid(trace[0], trace[1])
+        self.redraw()
+
+    def _on_load_trace(self):
+        self._load(is_limit=False)
+
+    def _on_load_limit(self):
+        self._load(is_limit=True)
+
+    def _load(self, is_limit: bool):
+        path = filedialog.askopenfilename(
+            filetypes=[("Trace files", "*.csv *.txt"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            freq, level = read_trace(path)
+        except (OSError, ValueError) as e:
+            self.status_label.configure(text=f"Could not load trace: {e}")
+            return
+        self.status_label.configure(text="")
+        name = ("Limit: " if is_limit else "") + path
+        self.add_trace(name, freq, level, LIMIT_COLOR if is_limit else None)
+
+    def _on_wheel(self, event):
+        if self.x_range is None:
+            return
+        if event.num == 4 or event.delta > 0:
+            factor = 0.8
+        else:
+            factor = 1.25
+
+        x0, x1 = self.x_range
+        plot_w = max(self.canvas.winfo_width() - self.MARGIN_LEFT - self.MARGIN, 1)
+        frac = min(max((event.x - self.MARGIN_LEFT) / plot_w, 0.0), 1.0)
+        center = x0 + frac * (x1 - x0)
+        self.x_range = (center - (center - x0) * factor, center + (x1 - center) * factor)
+        self.redraw()
+
+    def _on_drag_start(self, event):
+        self._drag_x = event.x
+
+    def _on_drag(self, event):
+        if self.x_range is None or self._drag_x is None:
+            return
+        x0, x1 = self.x_range
+        plot_w = max(self.canvas.winfo_width() - self.MARGIN_LEFT - self.MARGIN, 1)
+        shift = (self._drag_x - event.x) / plot_w * (x1 - x0)
+        self.x_range = (x0 + shift, x1 + shift)
+        self._drag_x = event.x
+        self.redraw()
+
+
+def _format_freq(freq: float) -> str:
+    for scale, suffix in ((1e9, "G"), (1e6, "M"), (1e3, "k")):
+        if abs(freq) >= scale:
+            return f"{freq / scale:.4g}{suffix}"
+    return f"{freq:.4g}"
@@ -0,0 +1,203 @@
+import sys
+from typing import Callable, Optional, Sequence
+
+import customtkinter
+import numpy as np
+
+
+def format_value(value: float) -> str:
+    """Format a result the way the single-value labels do; NaN becomes '...'."""
+    if np.isnan(value):
+        return "..."
+    return f"{value:.10f}".rstrip("0").rstrip(".")
+
+
+class RowWindow:
+    """
+    The range of rows a virtualized view currently shows.
+
+    Pure bookkeeping, kept separate from the widgets: it knows how many rows exist, how many fit on
+    screen and which one is at the top, and clamps every scroll operation to the valid range.
+    """
+
+    def __init__(self, n_rows: int = 0, visible: int = 1):
+        self.n_rows = n_rows
+        self.visible = max(1, visible)
+        self.first = 0
+
+    @property
+    def last(self) -> int:
+        """One past the last row on screen."""
+        return min(self.first + self.visible, self.n_rows)
+
+    def resize(self, n_rows: Optional[int] = None, visible: Optional[int] = None) -> None:
+        if n_rows is not None:
+            self.n_rows = n_rows
+        if visible is not None:
+            self.visible = max(1, visible)
+        self._clamp()
+
+    def scroll_to(self, fraction: float) -> None:
+        """Put the row at `fraction` of the table (0.0 = top, 1.0 = bottom) at the top."""
+        self.first = int(round(fraction * self.n_rows))
+        self._clamp()
+
+    def scroll_by(self, rows: int) -> None:
+        self.first += rows
+        self._clamp()
+
+    def fractions(self) -> tuple[float, float]:
+        """Top and bottom of the window as fractions of the table, as a Tk scrollbar expects."""
+        if self.n_rows == 0:
+            return 0.0, 1.0
+        return self.first / self.n_rows, self.last / self.n_rows
+
+    def _clamp(self) -> None:
+        self.first = max(0, min(self.first, self.n_rows - self.visible))
+
+
+class VirtualTableFrame(customtkinter.CTkFrame):
+    """
+    A table that renders only its visible rows.
+
+    The data stays in the column arrays passed to `set_data`; the frame owns a small pool of label rows,
+    just enough to fill its height, and re-labels them as the user scrolls. Creating, scrolling and
+    resizing therefore cost the same for ten rows as for a million: only the visible cells are
+    formatted, and only cells whose text changed are reconfigured.
+    """
+
+    def __init__(
+        self,
+        parent,
+        headers: Sequence[str],
+        height: int = 200,
+        column_width: int = 120,
+        row_height: int = 22,
+        formatter: Callable[[float], str] = format_value,
+    ):
+        super().__init__(parent)
+
+        self.headers = list(headers)
+        self.column_width = column_width
+        self.row_height = row_height
+        self.formatter = formatter
+        self.columns: list[np.ndarray] = []
+        self.window = RowWindow()
+
+        # Pool of label rows and the text each label currently shows
+        self._rows: list[list[customtkinter.CTkLabel]] = []
+        self._texts: list[list[str]] = []
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        # ====== Row 0 ======
+
+        self.header_frame = customtkinter.CTkFrame(self, fg_color="transparent")
+        self.header_frame.grid(row=0, column=0, padx=6, pady=(4, 0), sticky="ew")
+        for column, header in enumerate(self.headers):
+            label = customtkinter.CTkLabel(
+                self.header_frame,
+                text=header,
+                width=column_width,
+                anchor="w",
+                font=customtkinter.CTkFont(weight="bold"),
+            )
+            label.grid(row=0, column=column, sticky="w")
+
+        # ====== Row 1 ======
+
+        self.body = customtkinter.CTkFrame(self, fg_color="transparent", height=height)
+        self.body.grid(row=1, column=0, padx=6, pady=(0, 4), sticky="nsew")
+        self.body.grid_propagate(False)
+        self.body.bind("<Configure>", self._on_resize)
+
+        self.scrollbar = customtkinter.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=1, column=1, pady=(0, 4), sticky="ns")
+
+        self._bind_wheel(self.body)
+
+    def set_data(self, columns: Sequence[np.ndarray]) -> None:
+        """
+        Show `columns`, one array per header. The arrays are referenced, not copied.
+
+        Raises:
+            ValueError: If the number or lengths of the columns do not match.
+        """
+        columns = [np.asarray(column) for column in columns]
+        if len(columns) != len(self.headers):
+            raise ValueError(f"Expected {len(self.headers)} columns, got {len(columns)}.")
+        if len({column.shape[0] for column in columns}) > 1:
+            raise ValueError("All columns must have the same length.")
+
+        self.columns = columns
+        self.window.resize(n_rows=columns[0].shape[0] if columns else 0)
+        self.window.first = 0
+        self._render()
+
+    def _on_resize(self, event):
+        visible = max(1, event.height // self.row_height)
+        self.window.resize(visible=visible)
+        while len(self._rows) < visible:
+            self._add_pool_row()
+        self._render()
+
+    def _on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self.window.scroll_to(float(args[0]))
+        elif action == "scroll":
+            amount = int(args[0])
+            if args[1] == "pages":
+                amount *= self.window.visible
+            self.window.scroll_by(amount)
+        self._render()
+
+    def _on_wheel(self, event):
+        if event.num == 4:
+            step = -3
+        elif event.num == 5:
+            step = 3
+        elif sys.platform == "darwin":
+            # macOS reports small deltas, one per line
+            step = -event.delta
+        else:
+            # Windows reports multiples of 120 per notch
+            step = -int(event.delta / 120) * 3
+        self.window.scroll_by(step)
+        self._render()
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_wheel)
+        widget.bind("<Button-4>", self._on_wheel)
+        widget.bind("<Button-5>", self._on_wheel)
+
+    def _add_pool_row(self):
+        row = len(self._rows)
+        labels = []
+        for column in range(len(self.headers)):
+            label = customtkinter.CTkLabel(
+                self.body,
+                text="",
+                width=self.column_width,
+                height=self.row_height,
+                anchor="w",
+            )
+            label.grid(row=row, column=column, sticky="w")
+            self._bind_wheel(label)
+            labels.append(label)
+        self._rows.append(labels)
+        self._texts.append([""] * len(labels))
+
+    def _render(self):
+        """Write the visible slice of the data into the label pool."""
+        window = self.window
+        for i, labels in enumerate(self._rows):
+            row = window.first + i
+            in_view = i < window.visible and row < window.n_rows
+            for column, label in enumerate(labels):
+                text = self.formatter(self.columns[column][row]) if in_view else ""
+                if text != self._texts[i][column]:
+                    label.configure(text=text)
+                    self._texts[i][column] = text
+
+        self.scrollbar.set(*window.fractions())
@@ -0,0 +1,151 @@
+import json
+
+import numpy as np
+import pytest
+
+from UnitConverter.batch import STAGES, BatchRunner, main
+from UnitConverter.correction_table import CorrectionTable
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter
+from UnitConverter.shm_ring import SharedTraceRing
+from UnitConverter.trace_io import read_trace, write_trace
+
+FREQ = np.linspace(30e6, 1e9, 101)
+
+
+class RecordingObserver:
+    def __init__(self):
+        self.events = []
+
+    def stage_started(self, stage):
+        self.events.append(("start", stage.name))
+
+    def stage_finished(self, stage, error):
+        self.events.append(("end", stage.name, stage.rows, error is not None))
+
+
+@pytest.fixture
+def scans(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / "in" / f"scan{i}.csv"
+        path.parent.mkdir(exist_ok=True)
+        write_trace(path, FREQ, np.full(FREQ.size, 20.0 + i))
+        paths.append(path)
+    return paths
+
+
+def test_corrects_converts_and_checks_the_limit(tmp_path, scans):
+    antenna = CorrectionTable(FREQ[[0, -1]], [10.0, 10.0])
+    limit = CorrectionTable(FREQ[[0, -1]], [-20.0, -20.0])
+    runner = BatchRunner(
+        FieldStrengthConverter(), FSUNIT.DBUV_PER_M, FSUNIT.DBUA_PER_M, tmp_path / "out",
+        corrections=[antenna], limit=limit,
+    )
+    results = runner.run(scans)
+
+    assert [result.error for result in results] == [None] * 3
+    for i, result in enumerate(results):
+        freq, level = read_trace(result.output)
+        assert freq == pytest.approx(FREQ)
+        # 20 + i dBuV/m + 10 dB antenna factor - 51.5 dB
+        assert level == pytest.approx(np.full(FREQ.size, i - 21.5))
+        assert result.rows == FREQ.size
+        assert result.worst_margin == pytest.approx(1.5 - i)
+        assert result.failures == (FREQ.size if i == 2 else 0)
+
+
+def test_failed_file_is_reported_and_run_continues(tmp_path, scans):
+    broken = tmp_path / "in" / "broken.csv"
+    broken.write_text("not,a\ntrace\n")
+    observer = RecordingObserver()
+    runner = BatchRunner(
+        FieldStrengthConverter(), FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M, tmp_path / "out",
+        observers=[observer],
+    )
+    results = runner.run([broken, scans[0]])
+
+    assert results[0].output is None and results[0].error.startswith("ValueError")
+    assert np.isnan(results[1].worst_margin) and results[1].error is None
+    assert observer.events[:2] == [("start", "parse"), ("end", "parse", 0, True)]
+    finished = [event[1] for event in observer.events[2:] if event[0] == "end"]
+    assert tuple(finished) == STAGES
+
+
+def test_invalid_points_are_counted_not_raised(tmp_path):
+    path = tmp_path / "in" / "linear.csv"
+    path.parent.mkdir()
+    write_trace(path, FREQ[:4], np.array([1000.0, 0.0, -3.0, np.nan]))
+    runner = BatchRunner(FieldStrengthConverter(), FSUNIT.UV_PER_M, FSUNIT.DBUV_PER_M, tmp_path / "out")
+    (result,) = runner.run([path])
+
+    assert result.error is None
+    assert result.invalid == {"non_numeric": 0, "nan": 1, "inf": 0, "out_of_range": 2}
+    _, level = read_trace(result.output)
+    assert level[0] == pytest.approx(60.0) and np.isnan(level[1:]).all()
+
+
+def test_main_writes_summary(tmp_path, scans):
+    summary = tmp_path / "summary.json"
+    code = main([
+        *map(str, scans), "--output", str(tmp_path / "out"),
+        "--from-unit", "DBUV_PER_M", "--to-unit", "DBUA_PER_M", "--summary", str(summary),
+    ])
+    assert code == 0
+    report = json.loads(summary.read_text())
+    assert [entry["rows"] for entry in report] == [FREQ.size] * 3
+    assert report[0]["worst_margin"] is None
+
+
+def test_converted_traces_are_published_into_a_ring(tmp_path, scans):
+    ring = SharedTraceRing.create(
+        f"rfcalc-test-{tmp_path.name[-8:]}", n_slots=4, n_points=FREQ.size, unit="dBμA/m"
+    )
+    try:
+        runner = BatchRunner(
+            FieldStrengthConverter(), FSUNIT.DBUV_PER_M, FSUNIT.DBUA_PER_M, tmp_path / "out",
+            ring=ring,
+        )
+        runner.run(scans)
+        assert ring.latest == 2
+        expected = read_trace(tmp_path / "out" / "scan2.csv")[1]
+        assert ring.read(2).levels == pytest.approx(expected)
+    finally:
+        ring.close()
+        ring.unlink()
+
+
+def test_output_never_overwrites_an_input(tmp_path, scans):
+    runner = BatchRunner(FieldStrengthConverter(), FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M, scans[0].parent)
+    (result,) = runner.run([scans[0]])
+
+    assert result.output is None and "overwrite" in result.error
+    _, level = read_trace(scans[0])
+    assert level == pytest.approx(np.full(FREQ.size, 20.0))
+
+
+def test_same_names_from_different_directories_keep_relative_paths(tmp_path):
+    paths = []
+    for i, site in enumerate(("site_a", "site_b")):
+        path = tmp_path / "in" / site / "scan.csv"
+        path.parent.mkdir(parents=True)
+        write_trace(path, FREQ, np.full(FREQ.size, 10.0 * i))
+        paths.append(path)
+    runner = BatchRunner(FieldStrengthConverter(), FSUNIT.DBUV_PER_M, FSUNIT.DBUV_PER_M, tmp_path / "out")
+    results = runner.run(paths)
+
+    assert [result.output for result in results] == [
+        tmp_path / "out" / "site_a" / "scan.csv", tmp_path / "out" / "site_b" / "scan.csv"
+    ]
+    assert read_trace(results[1].output)[1] == pytest.approx(np.full(FREQ.size, 10.0))
+
+
+@pytest.mark.parametrize("options, message", [
+    (["--from-unit", "dBuV", "--to-unit", "DBUA_PER_M"], "DBUV_PER_M"),
+    (["--converter", "eirp", "--from-unit", "DBUV_PER_M", "--to-unit", "EIRP_dBm"], "dbuv_per_m"),
+    (["--converter", "eirp", "--from-unit", "dbuv_per_m", "--to-unit", "EIRP_dBm"], "--distance"),
+])
+def test_main_rejects_bad_arguments(tmp_path, scans, capsys, options, message):
+    with pytest.raises(SystemExit) as exit_info:
+        main([str(scans[0]), "--output", str(tmp_path / "out"), *options])
+    assert exit_info.value.code == 2
+    assert message in capsys.readouterr().err
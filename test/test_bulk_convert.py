@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from View.bulk_convert_frame import parse_column
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1\n2.5\n-3e1\n", [1.0, 2.5, -30.0]),
+    ("30e6,40.1\n100e6,55.2\n", [40.1, 55.2]),
+    ("30e6\t40.1\r\n100e6\t55.2", [40.1, 55.2]),
+    ("1;2\n\n3;4\n", [2.0, 4.0]),
+])
+def test_parse_column(text, expected):
+    assert parse_column(text) == pytest.approx(expected)
+
+
+def test_parse_column_keeps_one_entry_per_row():
+    values = parse_column("Freq,Level\n1,10\n2,abc\n3,30")
+    assert np.isnan(values[[0, 2]]).all()
+    assert values[[1, 3]] == pytest.approx([10.0, 30.0])
+
+
+def test_parse_column_index():
+    assert parse_column("1,10\n2,20", column=0) == pytest.approx([1.0, 2.0])
+
+
+def test_parse_thousands_of_rows():
+    text = "\n".join(f"{i}e6,{i * 0.01:.2f}" for i in range(20000))
+    values = parse_column(text)
+    assert values.size == 20000
+    assert values[-1] == pytest.approx(199.99)
+
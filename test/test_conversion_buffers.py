@@ -0,0 +1,88 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from UnitConverter.eirp_converter import EIRP, EIRPConverter
+from UnitConverter.rf_converter import FieldStrengthConverter, FSUNIT
+
+N = 1_000_000
+
+
+@pytest.mark.parametrize("con", [FieldStrengthConverter(), EIRPConverter()])
+def test_db_offsets_match_conversion_functions(con):
+    for unit, offset in con._db_offsets.items():
+        assert con._to_base[unit](10.0) == pytest.approx(10.0 + offset)
+        assert con._from_base[unit](10.0) == pytest.approx(10.0 - offset)
+
+
+@pytest.mark.parametrize("unit_in, unit_out", [
+    (FSUNIT.DBUA_PER_M, FSUNIT.DBPT),
+    (FSUNIT.DBUV_PER_M, FSUNIT.DBUA_PER_M),
+    (FSUNIT.DBPT, FSUNIT.DBUV_PER_M),
+])
+def test_offset_conversion_in_place_creates_no_temporaries(unit_in, unit_out):
+    con = FieldStrengthConverter()
+    values = np.linspace(0.0, 100.0, N)
+    expected = con.convert_array(values, unit_in, unit_out)
+    assert con.plan(unit_in, unit_out).is_offset
+
+    tracemalloc.start()
+    result = con.convert_array(values, unit_in, unit_out, out=values)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert result is values
+    assert np.array_equal(values, expected)
+    assert peak < 64 * 1024
+
+
+def test_eirp_dbuv_offset_plan():
+    con = EIRPConverter()
+    plan = con.plan(EIRP.dbuv, EIRP.ERP_dBm)
+    assert plan.is_offset
+    assert plan(np.array([87.0])) == pytest.approx([87.0 - 107 - 2.15])
+
+
+def test_log_conversion_temporaries_bounded_by_chunk():
+    con = FieldStrengthConverter()
+    values = np.linspace(1.0, 100.0, N)
+    out = np.empty_like(values)
+
+    tracemalloc.start()
+    con.convert_array(values, FSUNIT.V_PER_M, FSUNIT.DBUA_PER_M, out=out)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak < values.nbytes / 4
+    assert out == pytest.approx(20 * np.log10(values) + 120 - 51.5)
+
+
+def test_in_place_matches_new_array():
+    con = EIRPConverter()
+    values = np.linspace(-30.0, 30.0, 1001)
+    expected = con.convert_array(values, EIRP.EIRP_dBm, EIRP.W_m_sq, distance=3.0)
+    con.convert_array(values, EIRP.EIRP_dBm, EIRP.W_m_sq, out=values, distance=3.0)
+    assert np.array_equal(values, expected)
+
+
+def test_float32_mode_precision():
+    con = FieldStrengthConverter()
+    values = np.linspace(0.0, 200.0, 10001)
+    exact = con.convert_array(values, FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M)
+    single = con.convert_array(values, FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M, dtype=np.float32)
+
+    assert single.dtype == np.float32
+    assert single == pytest.approx(exact, rel=3e-6)
+
+
+def test_out_shape_mismatch():
+    con = FieldStrengthConverter()
+    with pytest.raises(ValueError):
+        con.convert_array(np.zeros(3), FSUNIT.DBPT, FSUNIT.DBUV_PER_M, out=np.zeros(4))
+
+
+def test_out_must_be_float():
+    con = FieldStrengthConverter()
+    with pytest.raises(TypeError):
+        con.convert_array(np.zeros(3), FSUNIT.DBPT, FSUNIT.DBUV_PER_M, out=np.zeros(3, dtype=int))
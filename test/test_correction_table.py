@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from UnitConverter.correction_table import CorrectionTable
+from UnitConverter.rf_util import interpolate, interpolate_sorted
+
+UNIFORM_FREQ = np.linspace(30e6, 1e9, 98)
+NON_UNIFORM_FREQ = np.array([30e6, 50e6, 80e6, 200e6, 300e6, 1e9])
+
+
+@pytest.fixture(params=["uniform", "non-uniform"])
+def table_points(request):
+    freq = UNIFORM_FREQ if request.param == "uniform" else NON_UNIFORM_FREQ
+    amp = np.random.default_rng(1).uniform(5.0, 25.0, freq.size)
+    return freq, amp
+
+
+def test_grid_kind_is_detected():
+    assert CorrectionTable(UNIFORM_FREQ, np.zeros(98)).uniform
+    assert not CorrectionTable(NON_UNIFORM_FREQ, np.zeros(6)).uniform
+
+
+def test_matches_interpolate_sorted(table_points):
+    freq, amp = table_points
+    table = CorrectionTable(freq, amp)
+    table.block_size = 1000
+    target = np.linspace(20e6, 1.1e9, 10_001)
+    expected = interpolate_sorted(freq, amp, target)
+    result = table(target)
+    assert np.array_equal(np.isnan(result), np.isnan(expected))
+    inside = ~np.isnan(expected)
+    assert result[inside] == pytest.approx(expected[inside], abs=1e-9)
+
+
+def test_matches_scalar_interpolate_at_breakpoints_and_unsorted_targets(table_points):
+    freq, amp = table_points
+    table = CorrectionTable(freq, amp)
+    assert table(freq) == pytest.approx(amp, abs=1e-9)
+    targets = np.array([freq[3] + 1e6, freq[1] + 5e5, freq[0]])
+    expected = [
+        interpolate(float(freq[3]), float(amp[3]), float(freq[4]), float(amp[4]), float(targets[0])),
+        interpolate(float(freq[1]), float(amp[1]), float(freq[2]), float(amp[2]), float(targets[1])),
+        amp[0],
+    ]
+    assert table(targets) == pytest.approx(expected, abs=1e-9)
+
+
+def test_extrapolate_extends_end_segments():
+    table = CorrectionTable([1.0, 2.0, 3.0], [0.0, 10.0, 0.0], extrapolate=True)
+    assert table([0.0, 4.0]).tolist() == pytest.approx([-10.0, -10.0])
+    assert np.isnan(CorrectionTable([1.0, 2.0], [0.0, 1.0])([0.5, np.nan])).all()
+
+
+def test_apply_in_place():
+    table = CorrectionTable([1.0, 3.0], [10.0, 30.0])
+    level = np.array([1.0, 2.0])
+    result = table.apply([1.0, 2.0], level, out=level)
+    assert result is level
+    assert level.tolist() == pytest.approx([11.0, 22.0])
+
+
+def test_save_and_load_round_trip(tmp_path, table_points):
+    freq, amp = table_points
+    table = CorrectionTable(freq, amp, name="AF", extrapolate=True)
+    table.save(tmp_path / "af.npz")
+    loaded = CorrectionTable.load(tmp_path / "af.npz")
+
+    assert (loaded.name, loaded.extrapolate, loaded.uniform) == ("AF", True, table.uniform)
+    assert loaded.digest == table.digest
+    assert loaded.amp == pytest.approx(amp)
+    target = np.linspace(20e6, 1.1e9, 101)
+    assert np.array_equal(loaded(target), table(target))
+
+
+def test_from_file(tmp_path):
+    path = tmp_path / "cable.csv"
+    path.write_text("# freq,loss\n1e6,-1.0\n2e6,-2.0\n")
+    table = CorrectionTable.from_file(path)
+    assert table.name == "cable.csv"
+    assert table([1.5e6])[0] == pytest.approx(-1.5)
+
+
+def test_digest_follows_contents():
+    a = CorrectionTable([1.0, 2.0], [0.0, 1.0])
+    assert a.digest == CorrectionTable([1.0, 2.0], [0.0, 1.0]).digest
+    assert a.digest != CorrectionTable([1.0, 2.0], [0.0, 1.5]).digest
+
+
+@pytest.mark.parametrize(
+    "freq, amp",
+    [([1.0], [1.0]), ([1.0, 2.0], [1.0]), ([2.0, 1.0], [1.0, 2.0]), ([1.0, 1.0], [1.0, 2.0])],
+)
+def test_invalid_tables(freq, amp):
+    with pytest.raises(ValueError):
+        CorrectionTable(freq, amp)
+
+
+def test_out_buffer_and_shapes():
+    table = CorrectionTable(UNIFORM_FREQ, np.linspace(0.0, 9.7, 98))
+    freq = np.linspace(30e6, 1e9, 40).reshape(4, 10)
+    out = np.empty((10, 4)).T
+    assert table(freq, out=out) is out
+    assert out == pytest.approx(table(freq.ravel()).reshape(4, 10))
+    with pytest.raises(ValueError):
+        table(freq, out=np.empty(3))
+
+
+def test_empty_frequencies(table_points):
+    table = CorrectionTable(*table_points)
+    assert table([]).shape == (0,)
+    assert table(np.empty((0, 3))).shape == (0, 3)
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from UnitConverter import fast_math
+from UnitConverter.eirp_converter import EIRP, EIRPConverter
+from UnitConverter.fast_math import MAX_ERROR_DB, approximate, is_approximate
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter
+
+DB_UNITS = {FSUNIT.DBUV_PER_M, FSUNIT.DBUA_PER_M, FSUNIT.DBPT}
+POWER_UNITS = {FSUNIT.W_PER_M_SQ, FSUNIT.MW_PER_CM_SQ}
+
+# ±280 dB around 1 V/m is the declared range; stay inside it for every target unit
+LEVELS = np.linspace(-100.0, 250.0, 100_001)
+
+
+def _max_error_db(approx, exact, unit):
+    if unit in DB_UNITS:
+        return np.max(np.abs(approx - exact))
+    factor = 10 if unit in POWER_UNITS else 20
+    return np.max(np.abs(factor * np.log10(approx / exact)))
+
+
+def test_off_by_default():
+    assert not is_approximate()
+    with approximate():
+        assert is_approximate()
+        with approximate(False):
+            assert not is_approximate()
+    assert not is_approximate()
+
+
+@pytest.mark.parametrize("unit", list(FSUNIT))
+def test_field_strength_error_is_within_declared_bound(unit):
+    converter = FieldStrengthConverter()
+    exact = converter.convert_array(LEVELS, FSUNIT.DBUV_PER_M, unit)
+    with approximate():
+        approx = converter.convert_array(LEVELS, FSUNIT.DBUV_PER_M, unit)
+        back = converter.convert_array(exact, unit, FSUNIT.DBUV_PER_M)
+    assert _max_error_db(approx, exact, unit) <= MAX_ERROR_DB
+    assert np.max(np.abs(back - LEVELS)) <= MAX_ERROR_DB
+
+
+@pytest.mark.parametrize("unit", [EIRP.EIRP_mW, EIRP.ERP_mW, EIRP.dbuv_per_m, EIRP.W_m_sq])
+def test_eirp_error_is_within_declared_bound(unit):
+    converter = EIRPConverter()
+    levels = np.linspace(-150.0, 130.0, 10_001)
+    context = {"distance": 3.0, "slope": 20.0}
+    exact = converter.convert_array(levels, EIRP.EIRP_dBm, unit, **context)
+    with approximate():
+        approx = converter.convert_array(levels, EIRP.EIRP_dBm, unit, **context)
+    if unit == EIRP.dbuv_per_m:
+        assert np.max(np.abs(approx - exact)) <= MAX_ERROR_DB
+    else:
+        assert np.max(np.abs(10 * np.log10(approx / exact))) <= MAX_ERROR_DB
+
+
+def test_scalars_stay_exact():
+    converter = FieldStrengthConverter()
+    exact = converter.convert(73.1, FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M)
+    with approximate():
+        assert converter.convert(73.1, FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M) == exact
+
+
+def test_values_outside_float32_range_fall_back_to_exact():
+    huge = np.array([1e-60, 1.0, 1e60])
+    assert np.array_equal(fast_math.log10(huge), np.log10(huge))
+    exponents = np.array([-60.0, 0.0, 60.0])
+    assert np.array_equal(fast_math.exp10(exponents), np.power(10.0, exponents))
+
+
+def test_parallel_workers_inherit_the_mode():
+    plan = FieldStrengthConverter().plan(FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M)
+    values = np.linspace(0.0, 120.0, plan.parallel_min_size + 1)
+    with approximate():
+        serial = plan(values)
+        parallel = plan.parallel(values, workers=4)
+    assert np.array_equal(parallel, serial)
+    assert not np.array_equal(serial, plan(values))
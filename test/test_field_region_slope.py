@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from UnitConverter.base_converter import ConversionPlan
+from UnitConverter.eirp_converter import EIRP, EIRPConverter, field_region_slope
+
+
+@pytest.fixture
+def sweep():
+    freq = np.geomspace(9e3, 6e9, 10_001)
+    return freq, np.linspace(0.0, 40.0, freq.size)
+
+
+def test_boundary_is_the_radian_sphere():
+    # lambda / 2pi = 3 m at 15.9 MHz
+    assert field_region_slope([15.8e6, 16.0e6], 3.0).tolist() == [40.0, 20.0]
+    assert field_region_slope(1e9, 3.0) == 20.0
+    assert field_region_slope(1e6, 3.0, near_slope=60.0) == 60.0
+
+
+def test_large_antenna_extends_the_near_field():
+    # 2 D^2 / lambda = 6.7 m for a 1 m antenna at 1 GHz
+    assert field_region_slope(1e9, 3.0, antenna_size=1.0) == 40.0
+    assert field_region_slope(1e9, 10.0, antenna_size=1.0) == 20.0
+
+
+def test_rejects_non_positive_inputs():
+    with pytest.raises(ValueError):
+        field_region_slope([0.0, 1e6], 3.0)
+    with pytest.raises(ValueError):
+        field_region_slope(1e6, 0.0)
+
+
+@pytest.mark.parametrize("from_unit, to_unit", [
+    (EIRP.EIRP_dBm, EIRP.dbuv_per_m),
+    (EIRP.dbuv_per_m, EIRP.ERP_mW),
+])
+def test_auto_slope_matches_per_point_scalar_conversion(sweep, monkeypatch, from_unit, to_unit):
+    monkeypatch.setattr(ConversionPlan, "chunk_size", 1000)
+    freq, values = sweep
+    con = EIRPConverter()
+    result = con.convert_array(values, from_unit, to_unit, distance=3.0, slope="auto", freq=freq)
+    slope = field_region_slope(freq, 3.0)
+    expected = [
+        con.convert(float(v), from_unit, to_unit, distance=3.0, slope=float(s))
+        for v, s in zip(values, slope)
+    ]
+    assert result == pytest.approx(expected)
+    assert set(np.unique(slope)) == {20.0, 40.0}
+
+
+def test_per_point_arguments_are_sliced_for_parallel_blocks(sweep, monkeypatch):
+    monkeypatch.setattr(ConversionPlan, "chunk_size", 256)
+    monkeypatch.setattr(ConversionPlan, "parallel_min_size", 0)
+    freq, values = sweep
+    plan = EIRPConverter().plan(
+        EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=3.0, slope=field_region_slope(freq, 3.0)
+    )
+    serial = plan(values)
+    assert np.array_equal(plan.parallel(values, workers=3), serial)
+    grid = plan.kwargs["slope"].reshape(73, 137)
+    planned = EIRPConverter().plan(EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=3.0, slope=grid)
+    assert planned(values.reshape(73, 137)).reshape(-1) == pytest.approx(serial)
+
+
+def test_sequence_arguments_are_sliced_like_arrays():
+    # More points than one block of the plan
+    freq = np.geomspace(9e3, 6e9, 100_001)
+    values = np.linspace(0.0, 40.0, freq.size)
+    con = EIRPConverter()
+    expected = con.convert_array(values, EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=3.0, slope="auto", freq=freq)
+    result = con.convert_array(
+        values, EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=3.0, slope="auto", freq=freq.tolist()
+    )
+    assert np.array_equal(result, expected)
+
+
+def test_mismatched_argument_shape_and_unknown_mode_are_rejected(sweep):
+    freq, values = sweep
+    con = EIRPConverter()
+    with pytest.raises(ValueError):
+        con.convert_array(values, EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=3.0, slope=freq[:10])
+    with pytest.raises(ValueError):
+        con.convert_array(values, EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=3.0, slope="far")
@@ -0,0 +1,137 @@
+import json
+
+import pytest
+
+from View.latency import LatencyMonitor
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRoot:
+    """Collects scheduled callbacks instead of running an event loop."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.idle = []
+        self.timers = []
+        self.idletasks = 0
+
+    def after_idle(self, func, *args):
+        self.idle.append((func, args))
+
+    def after(self, ms, func):
+        self.timers.append(func)
+        return len(self.timers)
+
+    def after_cancel(self, job):
+        pass
+
+    def update_idletasks(self):
+        self.idletasks += 1
+        self.clock.now += 0.004
+
+    def run_idle(self):
+        idle, self.idle = self.idle, []
+        for func, args in idle:
+            func(*args)
+
+    def fire_timer(self):
+        self.timers.pop(0)()
+
+
+class FakeVar:
+    def __init__(self):
+        self.callbacks = []
+
+    def trace_add(self, mode, callback):
+        self.callbacks.insert(0, callback)
+
+    def set(self, value):
+        for callback in self.callbacks:
+            callback("name", "", "write")
+
+
+class FakeLabel:
+    def __init__(self):
+        self.text = ""
+
+    def configure(self, **kwargs):
+        self.text = kwargs.get("text", self.text)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_frame(clock, delay):
+    var, label = FakeVar(), FakeLabel()
+
+    def update_result(*args):
+        clock.now += delay
+        label.configure(text="42")
+
+    var.trace_add("write", update_result)
+    return var, label
+
+
+def test_keystroke_update_and_render_latency(clock):
+    root = FakeRoot(clock)
+    monitor = LatencyMonitor(root, clock=clock)
+    var, label = make_frame(clock, delay=0.003)
+    monitor.instrument(None, "Field Strength", variables=[var], labels=[label])
+
+    for _ in range(3):
+        var.set("1")
+        root.run_idle()
+
+    frame = monitor.report()["frames"]["Field Strength"]
+    assert frame["update"]["count"] == 3
+    assert frame["update"]["mean_ms"] == pytest.approx(3.0)
+    assert frame["render"]["max_ms"] == pytest.approx(7.0)
+    assert label.text == "42"
+    assert "Field Strength update: 3 edits" in monitor.summary()
+
+
+def test_write_without_label_update_is_not_counted(clock):
+    root = FakeRoot(clock)
+    monitor = LatencyMonitor(root, clock=clock)
+    var, label = FakeVar(), FakeLabel()
+    monitor.instrument(None, "Limit", variables=[var], labels=[label])
+    var.set("")
+    root.run_idle()
+    assert monitor.report()["frames"]["Limit"]["update"]["count"] == 0
+    assert root.idletasks == 0
+
+
+def test_startup_construction_and_event_loop_load(clock, tmp_path):
+    root = FakeRoot(clock)
+    monitor = LatencyMonitor(root, heartbeat_ms=10, clock=clock)
+    with monitor.construction("EIRP"):
+        clock.now += 0.25
+    monitor.start()
+    clock.now += 0.05
+    root.run_idle()
+
+    root.fire_timer()  # 40 ms late: startup kept the loop busy
+    clock.now += 0.010
+    root.fire_timer()  # on time
+    clock.now += 0.110
+    root.fire_timer()  # 100 ms late
+
+    report = monitor.report()
+    assert report["construction_ms"] == {"EIRP": pytest.approx(250.0)}
+    assert report["startup_ms"] == pytest.approx(300.0)
+    assert report["event_loop"]["busy_ms"] == pytest.approx(140.0)
+    assert report["event_loop"]["idle_ms"] == pytest.approx(30.0)
+    assert report["event_loop"]["lag"]["count"] == 3
+
+    path = tmp_path / "latency.json"
+    monitor.write_report(path)
+    assert json.loads(path.read_text())["event_loop"]["lag"]["max_ms"] == pytest.approx(100.0)
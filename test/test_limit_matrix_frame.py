@@ -0,0 +1,20 @@
+import pytest
+
+from UnitConverter.rf_util import limit_convert
+from View.limit_matrix_frame import matrix_columns, parse_limits
+
+
+def test_parse_limits_skips_invalid_tokens():
+    assert parse_limits(" 30, 37;40  x 46.5\n") == [30.0, 37.0, 40.0, 46.5]
+    assert parse_limits("") == []
+
+
+def test_matrix_columns_for_limits_at_10_m():
+    columns = matrix_columns([30.0, 40.0], reference=3)
+    slope, limit, *values = columns
+    assert list(slope) == [20.0, 20.0, 40.0, 40.0]
+    assert list(limit) == [30.0, 40.0, 30.0, 40.0]
+    assert len(values) == 5
+    # 3 m column: 40 dB at 10 m, extrapolated at 40 dB/decade
+    assert values[1][3] == pytest.approx(limit_convert(10.0, 3.0, 40.0, 40.0))
+    assert values[3][0] == pytest.approx(30.0)
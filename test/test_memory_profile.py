@@ -0,0 +1,75 @@
+import json
+import tracemalloc
+
+import numpy as np
+
+from UnitConverter.batch import STAGES, BatchRunner, main
+from UnitConverter.correction_table import CorrectionTable
+from UnitConverter.memory_profile import MemoryProfiler
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter
+from UnitConverter.trace_io import write_trace
+
+FREQ = np.linspace(30e6, 1e9, 20_001)
+
+
+def write_scans(directory, count=2):
+    directory.mkdir()
+    paths = []
+    for i in range(count):
+        path = directory / f"scan{i}.csv"
+        write_trace(path, FREQ, np.full(FREQ.size, 40.0))
+        paths.append(path)
+    return paths
+
+
+def test_reports_every_stage(tmp_path):
+    paths = write_scans(tmp_path / "in")
+    profiler = MemoryProfiler(top=3)
+    runner = BatchRunner(
+        FieldStrengthConverter(), FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M, tmp_path / "out",
+        corrections=[CorrectionTable(FREQ[[0, -1]], [12.0, 20.0])],
+        limit=CorrectionTable(FREQ[[0, -1]], [1.0, 1.0]),
+        observers=[profiler],
+    )
+    with profiler:
+        runner.run(paths)
+    assert not tracemalloc.is_tracing()
+
+    report = profiler.report()
+    assert tuple(report["stages"]) == STAGES
+    parse = report["stages"]["parse"]
+    assert parse["calls"] == 2 and parse["rows"] == 2 * FREQ.size
+    # the frequency and level columns of a file stay alive after parsing
+    assert parse["peak_bytes"] >= 2 * FREQ.nbytes
+    assert parse["net_bytes"] >= 2 * 2 * FREQ.nbytes
+    assert parse["new_blocks"] > 0
+    assert 0 < len(parse["top_lines"]) <= 3
+    assert parse["top_lines"][0]["size_bytes"] >= FREQ.nbytes
+    # the limit line is evaluated into a new array of the trace length
+    assert report["stages"]["limit-check"]["peak_bytes"] >= FREQ.nbytes
+    assert report["overall_peak_bytes"] >= parse["peak_bytes"]
+    for stage in report["stages"].values():
+        assert all("memory_profile.py" not in line["file"] for line in stage["top_lines"])
+
+
+def test_leaves_running_trace_alone():
+    tracemalloc.start()
+    try:
+        with MemoryProfiler():
+            pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_main_writes_json_report(tmp_path):
+    paths = write_scans(tmp_path / "in", count=1)
+    report_path = tmp_path / "memory.json"
+    code = main([
+        str(paths[0]), "--output", str(tmp_path / "out"),
+        "--from-unit", "DBUV_PER_M", "--to-unit", "DBPT", "--profile-memory", str(report_path),
+    ])
+    assert code == 0
+    report = json.loads(report_path.read_text())
+    assert set(report["stages"]) == set(STAGES)
+    assert report["stages"]["convert"]["rows"] == FREQ.size
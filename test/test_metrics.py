@@ -0,0 +1,142 @@
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pytest
+
+from UnitConverter.batch import STAGES, BatchRunner, Stage, main
+from UnitConverter.metrics import CONTENT_TYPE, MetricsRegistry, StageMetrics, StreamMetrics
+from UnitConverter.result_cache import ResultCache
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter
+from UnitConverter.stream import StreamConverter
+from UnitConverter.trace_io import write_trace
+
+FREQ = np.linspace(30e6, 1e9, 51)
+
+
+def parse(text):
+    """Sample lines as {"name{labels}": value}, checking every family has HELP and TYPE."""
+    samples, typed = {}, set()
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            typed.add(line.split()[2])
+        elif not line.startswith("#"):
+            key, value = line.rsplit(" ", 1)
+            assert key.split("{")[0].removesuffix("_bucket").removesuffix("_sum").removesuffix(
+                "_count"
+            ) in typed
+            samples[key] = float(value)
+    return samples
+
+
+@pytest.fixture
+def scans(tmp_path):
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"scan{i}.csv"
+        write_trace(path, FREQ, np.full(FREQ.size, 30.0))
+        paths.append(path)
+    broken = tmp_path / "broken.csv"
+    broken.write_text("garbage\n")
+    return paths + [broken]
+
+
+def test_stage_metrics_of_a_batch_run(tmp_path, scans):
+    registry = MetricsRegistry()
+    stages = registry.add_stages()
+    BatchRunner(
+        FieldStrengthConverter(), FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M, tmp_path / "out",
+        observers=[stages],
+    ).run(scans)
+
+    samples = parse(registry.render())
+    assert samples['rfcalc_stage_rows_total{stage="convert"}'] == 2 * FREQ.size
+    assert samples['rfcalc_stage_errors_total{stage="parse"}'] == 1
+    assert samples['rfcalc_stage_errors_total{stage="write"}'] == 0
+    assert samples['rfcalc_stage_duration_seconds_count{stage="parse"}'] == 3
+    assert samples['rfcalc_stage_duration_seconds_bucket{stage="parse",le="+Inf"}'] == 3
+    assert samples['rfcalc_stage_rows_per_second{stage="convert"}'] == pytest.approx(
+        stages.rows_per_second("convert")
+    )
+    assert stages.rows_per_second("convert") > 0
+    for stage in STAGES:
+        buckets = [
+            value for key, value in samples.items()
+            if key.startswith(f'rfcalc_stage_duration_seconds_bucket{{stage="{stage}"')
+        ]
+        assert buckets == sorted(buckets)
+
+
+def test_error_and_duration_are_recorded_per_stage():
+    metrics = StageMetrics(edges=(0.5, 1.0))
+    stage = Stage("convert", None)
+    stage.rows = 10
+    metrics.stage_started(stage)
+    metrics.stage_finished(stage, ValueError("bad"))
+    assert metrics.rows_per_second("write") == 0.0
+    samples = parse(MetricsRegistry([metrics]).render())
+    assert samples['rfcalc_stage_duration_seconds_bucket{stage="convert",le="0.5"}'] == 1
+    assert samples['rfcalc_stage_errors_total{stage="convert"}'] == 1
+
+
+def test_cache_and_stream_metrics(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    cache.get_or_compute("key", lambda: np.zeros(3))
+    cache.get_or_compute("key", lambda: np.zeros(3))
+    plan = FieldStrengthConverter().plan(FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M)
+    stream = StreamConverter(plan, 11, lambda *args: None)
+    stream.received, stream.forwarded, stream.dropped, stream.errors = 5, 3, 1, 1
+    stream.latency.record(0.003)
+
+    registry = MetricsRegistry()
+    registry.add_cache(cache)
+    registry.add_stream(stream)
+    samples = parse(registry.render())
+    assert samples['rfcalc_cache_hits_total{cache="results"}'] == 1
+    assert samples['rfcalc_cache_misses_total{cache="results"}'] == 1
+    assert samples['rfcalc_stream_frames_total{outcome="forwarded"}'] == 3
+    assert samples["rfcalc_stream_errors_total"] == 1
+    assert samples['rfcalc_stream_latency_seconds_bucket{le="0.002"}'] == 0
+    assert samples['rfcalc_stream_latency_seconds_bucket{le="0.005"}'] == 1
+    assert samples["rfcalc_stream_latency_seconds_sum"] == pytest.approx(0.003)
+
+
+def test_histogram_buckets_and_count_agree_while_recording():
+    plan = FieldStrengthConverter().plan(FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M)
+    stream = StreamConverter(plan, 11, lambda *args: None)
+    stream.latency.record(0.003)
+    stream.latency.record(5.0)
+    # A frame half-recorded by the worker: counted in `count` but not yet in its bin
+    stream.latency.count += 1
+
+    samples = parse(MetricsRegistry([StreamMetrics(stream)]).render())
+    assert samples['rfcalc_stream_latency_seconds_bucket{le="+Inf"}'] == 2
+    assert samples["rfcalc_stream_latency_seconds_count"] == 2
+
+
+def test_main_writes_textfile(tmp_path, scans):
+    path = tmp_path / "rfcalc.prom"
+    code = main([
+        *map(str, scans), "--output", str(tmp_path / "out"),
+        "--from-unit", "DBUV_PER_M", "--to-unit", "DBPT", "--metrics-file", str(path),
+    ])
+    assert code == 1
+    samples = parse(path.read_text())
+    assert samples['rfcalc_stage_rows_total{stage="write"}'] == 2 * FREQ.size
+    assert not list(tmp_path.glob(".rfcalc.prom.*"))
+
+
+def test_serves_metrics_endpoint():
+    registry = MetricsRegistry()
+    registry.add_stages()
+    server = registry.serve(("127.0.0.1", 0))
+    url = "http://127.0.0.1:%d" % server.server_address[1]
+    try:
+        with urllib.request.urlopen(url + "/metrics", timeout=5) as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert "# TYPE rfcalc_stage_rows_total counter" in response.read().decode()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(url + "/other", timeout=5)
+    finally:
+        server.shutdown()
+        server.server_close()
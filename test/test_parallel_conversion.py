@@ -0,0 +1,127 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from UnitConverter.base_converter import BaseConverter, UnitEnum
+from UnitConverter.eirp_converter import EIRP, EIRPConverter
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter
+
+# Just above the size from which ConversionPlan.parallel starts splitting
+N = (1 << 18) + 12345
+
+
+@pytest.fixture
+def values():
+    return np.random.default_rng(0).uniform(0.0, 120.0, N)
+
+
+@pytest.mark.parametrize(
+    "from_unit, to_unit",
+    [
+        (FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M),
+        (FSUNIT.DBUV_PER_M, FSUNIT.DBPT),
+        (FSUNIT.DBUV_PER_M, FSUNIT.W_PER_M_SQ),
+    ],
+)
+@pytest.mark.parametrize("workers", [2, 3, 8])
+def test_parallel_matches_serial(values, from_unit, to_unit, workers):
+    plan = FieldStrengthConverter().plan(from_unit, to_unit)
+    assert np.array_equal(plan.parallel(values, workers=workers), plan(values))
+
+
+def test_parallel_writes_into_out_with_executor(values):
+    plan = EIRPConverter().plan(EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=3.0, slope=20.0)
+    out = np.empty(N, dtype=np.float32)
+    with ThreadPoolExecutor(4) as executor:
+        result = plan.parallel(values, out=out, workers=4, executor=executor)
+    assert result is out
+    assert out == pytest.approx(plan(values), rel=3e-6)
+
+
+def test_convert_array_workers(values):
+    converter = FieldStrengthConverter()
+    expected = converter.convert_array(values, FSUNIT.DBUV_PER_M, FSUNIT.UA_PER_M)
+    result = converter.convert_array(values, FSUNIT.DBUV_PER_M, FSUNIT.UA_PER_M, workers=4)
+    assert np.array_equal(result, expected)
+
+
+def test_parallel_rejects_invalid_workers(values):
+    plan = FieldStrengthConverter().plan(FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M)
+    with pytest.raises(ValueError):
+        plan.parallel(values, workers=0)
+
+
+def test_plans_are_shared_between_instances():
+    first = FieldStrengthConverter().plan(FSUNIT.V_PER_M, FSUNIT.DBPT)
+    second = FieldStrengthConverter().plan(FSUNIT.V_PER_M, FSUNIT.DBPT)
+    assert first is second
+    assert first is not EIRPConverter().plan(EIRP.EIRP_dBm, EIRP.EIRP_mW)
+
+
+def test_plans_with_different_context_are_distinct():
+    converter = EIRPConverter()
+    at_3m = converter.plan(EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=3.0, slope=20.0)
+    at_10m = converter.plan(EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=10.0, slope=20.0)
+    assert at_3m is not at_10m
+    assert at_3m(np.array([0.0]))[0] > at_10m(np.array([0.0]))[0]
+
+
+def test_unhashable_context_bypasses_cache():
+    converter = EIRPConverter()
+    distance = np.array([3.0])
+    plan = converter.plan(EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=distance, slope=20.0)
+    assert plan is not converter.plan(EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=distance, slope=20.0)
+
+
+class GAIN(UnitEnum):
+    DBI = "dBi"
+    DBD = "dBd"
+
+
+class CalibratedGainConverter(BaseConverter):
+    """Conversion tables that depend on the instance."""
+
+    plan_cacheable = False
+    base_unit = GAIN.DBI
+
+    def __init__(self, correction):
+        self.correction = correction
+
+    @property
+    def _to_base(self):
+        return {GAIN.DBD: lambda x: x + 2.15 + self.correction}
+
+    @property
+    def _from_base(self):
+        return {GAIN.DBD: lambda x: x - 2.15 - self.correction}
+
+
+def test_instance_dependent_converter_bypasses_plan_cache():
+    values = np.zeros(3)
+    assert CalibratedGainConverter(0.0).convert_array(values, GAIN.DBD, GAIN.DBI) == pytest.approx(2.15)
+    assert CalibratedGainConverter(1.0).convert_array(values, GAIN.DBD, GAIN.DBI) == pytest.approx(3.15)
+
+
+def test_one_converter_shared_by_threads():
+    converter = FieldStrengthConverter()
+    units = list(FSUNIT)
+    values = np.linspace(1.0, 100.0, 1000)
+    errors = []
+
+    def work(seed):
+        rng = np.random.default_rng(seed)
+        for _ in range(50):
+            from_unit, to_unit = rng.choice(units, 2)
+            expected = [converter.convert(float(v), from_unit, to_unit) for v in values[:5]]
+            result = converter.convert_array(values, from_unit, to_unit)[:5]
+            if not np.allclose(result, expected, rtol=1e-12):
+                errors.append((from_unit, to_unit))
+
+    threads = [threading.Thread(target=work, args=(seed,)) for seed in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from UnitConverter.peaks import find_peaks, merge_peak_lists
+
+
+def _naive_prominence(level, i):
+    """Reference: walk out to the nearest higher sample on both sides."""
+    left = i
+    while left > 0 and level[left - 1] <= level[i]:
+        left -= 1
+    right = i
+    while right < len(level) - 1 and level[right + 1] <= level[i]:
+        right += 1
+    return level[i] - max(level[left:i + 1].min(), level[i:right + 1].min())
+
+
+def test_local_maxima_and_threshold():
+    level = np.array([0.0, 5.0, 1.0, 8.0, 2.0, 3.0, 0.0])
+    assert find_peaks(level).tolist() == [1, 3, 5]
+    assert find_peaks(level, threshold=4.0).tolist() == [1, 3]
+
+
+def test_plateau_reports_its_first_sample_and_ignores_shoulders():
+    level = np.array([0.0, 4.0, 4.0, 4.0, 1.0, 2.0, 2.0, 3.0, 0.0])
+    assert find_peaks(level).tolist() == [1, 7]
+
+
+def test_endpoints_are_not_peaks():
+    assert find_peaks(np.array([9.0, 1.0, 2.0, 3.0])).size == 0
+
+
+def test_excursion_rejects_ripple_on_a_large_emission():
+    # Ripple at index 2 rises 1 dB above its valley on the slope of the peak at index 5
+    level = np.array([0.0, 10.0, 11.0, 10.0, 20.0, 40.0, 20.0, 0.0])
+    assert find_peaks(level, excursion=6.0).tolist() == [5]
+    assert find_peaks(level, excursion=0.5).tolist() == [2, 5]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_excursion_matches_reference(seed):
+    level = np.random.default_rng(seed).normal(size=500).cumsum()
+    peaks = find_peaks(level)
+    prominence = np.array([_naive_prominence(level, i) for i in peaks])
+    for excursion in (0.5, 2.0, 5.0):
+        expected = peaks[prominence >= excursion]
+        assert find_peaks(level, excursion=excursion).tolist() == expected.tolist()
+
+
+def test_merge_keeps_the_strongest_detection_per_emission():
+    emissions = merge_peak_lists(
+        {
+            "horizontal": ([100e6, 200e6], [30.0, 45.0]),
+            "vertical": ([100.02e6, 300e6], [35.0, 20.0]),
+        },
+        tolerance=50e3,
+    )
+    assert emissions.freq.tolist() == [100.02e6, 200e6, 300e6]
+    assert emissions.level.tolist() == [35.0, 45.0, 20.0]
+    assert emissions.source.tolist() == ["vertical", "horizontal", "vertical"]
+    assert emissions.count.tolist() == [2, 1, 1]
+
+
+def test_merge_of_nothing_is_empty():
+    emissions = merge_peak_lists({"a": ([], [])}, tolerance=1.0)
+    assert emissions.freq.size == 0 and emissions.source.size == 0
+
+
+def test_merge_rejects_negative_tolerance():
+    with pytest.raises(ValueError):
+        merge_peak_lists({}, tolerance=-1.0)
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from UnitConverter.eirp_converter import EIRP, EIRPConverter
+from UnitConverter.quantity import Quantity
+from UnitConverter.rf_converter import FieldStrengthConverter, FSUNIT
+
+
+def test_to_is_lazy():
+    q = Quantity([40.0, 60.0], FSUNIT.DBUV_PER_M).to(FSUNIT.UV_PER_M)
+    assert not q.is_materialized
+    assert q.values == pytest.approx([100.0, 1000.0])
+    assert q.is_materialized
+
+
+def test_chained_conversions_collapse_into_one_plan():
+    q = Quantity([1.0, 2.0], FSUNIT.V_PER_M)
+    chained = q.to(FSUNIT.DBUV_PER_M).to(FSUNIT.DBUA_PER_M).to(FSUNIT.A_PER_M)
+
+    plan = chained.plan
+    assert (plan.from_unit, plan.to_unit) == (FSUNIT.V_PER_M, FSUNIT.A_PER_M)
+    expected = FieldStrengthConverter().convert_array([1.0, 2.0], FSUNIT.V_PER_M, FSUNIT.A_PER_M)
+    assert np.asarray(chained) == pytest.approx(expected)
+
+
+def test_round_trip_returns_original_buffer():
+    data = np.array([1.0, 2.0])
+    q = Quantity(data, FSUNIT.V_PER_M).to(FSUNIT.PT).to(FSUNIT.V_PER_M)
+    assert q.is_materialized
+    assert q.values is data
+
+
+def test_context_is_passed_to_eirp_conversions():
+    q = Quantity([30.0], EIRP.EIRP_dBm, distance=3.0).to(EIRP.dbuv_per_m)
+    expected = EIRPConverter().convert(30.0, EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=3.0, slope=20.0)
+    assert q.values == pytest.approx([expected])
+
+
+def test_context_change_splits_the_chain():
+    q = Quantity([30.0], EIRP.EIRP_dBm, distance=3.0).to(EIRP.dbuv_per_m)
+    moved = q.to(EIRP.EIRP_dBm, distance=10.0)
+
+    # field strength measured at 3 m interpreted as if measured at 10 m
+    assert moved.values == pytest.approx([30.0 + 20 * np.log10(10 / 3)])
+    assert moved.context["distance"] == 10.0
+
+
+def test_context_change_stays_lazy():
+    q = Quantity([30.0], EIRP.EIRP_dBm, distance=3.0).to(EIRP.dbuv_per_m)
+    moved = q.to(EIRP.EIRP_dBm, distance=10.0).to(EIRP.EIRP_mW)
+
+    assert not q.is_materialized and not moved.is_materialized
+    assert [(plan.from_unit, plan.to_unit) for plan in moved.plans] == [
+        (EIRP.EIRP_dBm, EIRP.dbuv_per_m),
+        (EIRP.dbuv_per_m, EIRP.EIRP_mW),
+    ]
+    expected = EIRPConverter().convert(30.0 + 20 * np.log10(10 / 3), EIRP.EIRP_dBm, EIRP.EIRP_mW)
+    assert moved.values == pytest.approx([expected])
+    assert not q.is_materialized
+
+
+def test_mixed_unit_enums_rejected():
+    with pytest.raises(TypeError):
+        Quantity([1.0], FSUNIT.V_PER_M).to(EIRP.EIRP_dBm)
@@ -0,0 +1,131 @@
+import sys
+
+import pytest
+
+from UnitConverter.registry import ConverterRegistry, UnitInfo
+
+PLUGIN = '''
+from UnitConverter.base_converter import BaseConverter, UnitEnum
+
+
+class GAIN(UnitEnum):
+    DBI = "dBi"
+    DBD = "dBd"
+
+
+class GainConverter(BaseConverter):
+    base_unit = GAIN.DBI
+    _to_base = {GAIN.DBD: lambda x: x + 2.15}
+    _from_base = {GAIN.DBD: lambda x: x - 2.15}
+'''
+
+
+@pytest.fixture
+def plugin(tmp_path, monkeypatch):
+    (tmp_path / "rfcalc_gain_plugin.py").write_text(PLUGIN, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "rfcalc_gain_plugin"
+    sys.modules.pop("rfcalc_gain_plugin", None)
+
+
+def test_plugin_imported_only_on_first_use(tmp_path, plugin):
+    registry = ConverterRegistry(group=None, builtins={}, cache_file=tmp_path / "units.json")
+    registry.register("gain", f"{plugin}:GainConverter")
+    assert registry.names() == ["gain"]
+    assert plugin not in sys.modules and not registry.is_loaded("gain")
+
+    conv = registry.get("gain")
+    assert registry.get("gain") is conv and registry.is_loaded("gain")
+    assert conv.convert(0.0, registry.unit("gain", "dBd"), registry.unit("gain", "DBI")) == 2.15
+
+
+def test_unit_listing_cached_across_registries(tmp_path, plugin):
+    cache = tmp_path / "units.json"
+    first = ConverterRegistry(group=None, builtins={"gain": f"{plugin}:GainConverter"}, cache_file=cache)
+    assert first.units("gain") == (UnitInfo("DBI", "dBi"), UnitInfo("DBD", "dBd"))
+    assert cache.exists()
+
+    # A cold start lists the units from the cache without importing the plugin
+    sys.modules.pop(plugin)
+    second = ConverterRegistry(group=None, builtins={"gain": f"{plugin}:GainConverter"}, cache_file=cache)
+    assert [unit.label for unit in second.units("gain")] == ["dBi", "dBd"]
+    assert plugin not in sys.modules
+
+
+def test_cache_invalidated_when_module_changes(tmp_path, plugin):
+    cache = tmp_path / "units.json"
+    ConverterRegistry(group=None, builtins={"gain": f"{plugin}:GainConverter"}, cache_file=cache).units("gain")
+
+    sys.modules.pop(plugin)
+    (tmp_path / f"{plugin}.py").write_text(PLUGIN.replace('DBD = "dBd"', 'DBD = "dBd (dipole)"'), encoding="utf-8")
+    registry = ConverterRegistry(group=None, builtins={"gain": f"{plugin}:GainConverter"}, cache_file=cache)
+    assert registry.units("gain")[1].label == "dBd (dipole)"
+    assert registry.is_loaded("gain")
+
+
+def test_builtin_converters():
+    registry = ConverterRegistry(group=None, cache_file=None)
+    assert {"fs", "eirp"} <= set(registry.names())
+    fs = registry.get("fs")
+    assert fs.convert(60.0, registry.unit("fs", "dBμV/m"), registry.unit("fs", "UV_PER_M")) == pytest.approx(1000.0)
+    assert UnitInfo("EIRP_dBm", "EIRP (dBm)") in registry.units("eirp")
+
+
+def test_errors(tmp_path):
+    registry = ConverterRegistry(group=None, builtins={}, cache_file=None)
+    with pytest.raises(KeyError):
+        registry.get("missing")
+    with pytest.raises(ValueError):
+        registry.register("bad", "no_attribute")
+    registry.register("not_a_converter", "json:JSONDecoder")
+    with pytest.raises(TypeError):
+        registry.get("not_a_converter")
+
+    class LooksLikeAConverter:
+        base_unit = None
+
+        def plan(self, from_unit, to_unit):
+            pass
+
+    registry.register("look_alike", LooksLikeAConverter)
+    with pytest.raises(TypeError):
+        registry.get("look_alike")
+    with pytest.raises(ValueError):
+        ConverterRegistry(group=None, cache_file=None).unit("fs", "furlong")
+
+
+def test_entry_points_discovered(monkeypatch):
+    class EntryPoint:
+        name = "gain"
+        value = "rfcalc_lab.gain:GainConverter"
+
+    monkeypatch.setattr("UnitConverter.registry._entry_points", lambda group: [EntryPoint()])
+    registry = ConverterRegistry(cache_file=None)
+    assert registry.names() == ["fs", "eirp", "gain"]
+
+
+def test_entry_point_units_cached_by_distribution_version(tmp_path, plugin, monkeypatch):
+    class Distribution:
+        metadata = {"Name": "rfcalc-gain"}
+        version = "1.0"
+
+    class EntryPoint:
+        name = "gain"
+        value = f"{plugin}:GainConverter"
+        dist = Distribution()
+
+    monkeypatch.setattr("UnitConverter.registry._entry_points", lambda group: [EntryPoint()])
+    cache = tmp_path / "units.json"
+    ConverterRegistry(builtins={}, cache_file=cache).units("gain")
+    sys.modules.pop(plugin)
+
+    # Same version: served from the cache, even though the module changed on disk
+    (tmp_path / f"{plugin}.py").write_text(PLUGIN.replace('DBD = "dBd"', 'DBD = "dBd (dipole)"'), encoding="utf-8")
+    registry = ConverterRegistry(builtins={}, cache_file=cache)
+    assert registry.units("gain")[1].label == "dBd"
+    assert plugin not in sys.modules
+
+    # A new version of the distribution invalidates the entry
+    Distribution.version = "1.1"
+    registry = ConverterRegistry(builtins={}, cache_file=cache)
+    assert registry.units("gain")[1].label == "dBd (dipole)"
@@ -0,0 +1,136 @@
+import os
+
+import numpy as np
+import pytest
+
+from UnitConverter.eirp_converter import EIRP, EIRPConverter
+from UnitConverter.rf_converter import FieldStrengthConverter, FSUNIT
+from UnitConverter.result_cache import ResultCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(tmp_path / "cache")
+
+
+def test_convert_array_matches_scalar_convert():
+    con = FieldStrengthConverter()
+    values = np.array([1e-3, 0.1, 10.0])
+    result = con.convert_array(values, FSUNIT.V_PER_M, FSUNIT.DBUA_PER_M)
+    expected = [con.convert(v, FSUNIT.V_PER_M, FSUNIT.DBUA_PER_M) for v in values]
+    assert result == pytest.approx(expected)
+
+
+def test_convert_hit_skips_conversion(cache, monkeypatch):
+    con = EIRPConverter()
+    values = np.array([10.0, 20.0, 30.0])
+    first = cache.convert(con, values, EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=3.0, slope=20.0)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached result must not be recomputed")
+
+    monkeypatch.setattr(con, "convert_array", fail)
+    second = cache.convert(con, values, EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=3.0, slope=20.0)
+
+    assert np.array_equal(first, second)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.parametrize("changed", [
+    {"distance": 10.0, "slope": 20.0},
+    {"distance": 3.0, "slope": 40.0},
+])
+def test_changed_parameter_misses(cache, changed):
+    con = EIRPConverter()
+    values = np.array([10.0, 20.0])
+    cache.convert(con, values, EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=3.0, slope=20.0)
+    cache.convert(con, values, EIRP.EIRP_dBm, EIRP.dbuv_per_m, **changed)
+    assert cache.misses == 2
+
+
+def test_changed_table_version_misses(cache):
+    con = FieldStrengthConverter()
+    cache.convert(con, [1.0], FSUNIT.V_PER_M, FSUNIT.DBUV_PER_M, versions={"af": "v1"})
+    cache.convert(con, [1.0], FSUNIT.V_PER_M, FSUNIT.DBUV_PER_M, versions={"af": "v2"})
+    cache.convert(con, [1.0], FSUNIT.V_PER_M, FSUNIT.DBUV_PER_M, versions={"af": "v1"})
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_converters_of_the_same_name_do_not_collide(cache):
+    Other = type("FieldStrengthConverter", (FieldStrengthConverter,), {"__module__": "plugin"})
+    cache.convert(FieldStrengthConverter(), [1.0], FSUNIT.V_PER_M, FSUNIT.DBUV_PER_M)
+    cache.convert(Other(), [1.0], FSUNIT.V_PER_M, FSUNIT.DBUV_PER_M)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_converter_with_instance_state_bypasses_the_cache(cache, tmp_path):
+    class Calibrated(FieldStrengthConverter):
+        plan_cacheable = False
+
+    path = tmp_path / "scan.csv"
+    path.write_text("30e6,1.0\n40e6,2.0\n")
+    for _ in range(2):
+        cache.convert(Calibrated(), [1.0], FSUNIT.V_PER_M, FSUNIT.DBUV_PER_M)
+        freq, level = cache.convert_file(Calibrated(), path, FSUNIT.V_PER_M, FSUNIT.DBUV_PER_M)
+    assert level == pytest.approx([120.0, 120.0 + 20 * np.log10(2.0)])
+    assert (cache.hits, cache.misses, cache.size()) == (0, 0, 0)
+
+
+def test_convert_file(cache, tmp_path):
+    path = tmp_path / "scan.csv"
+    path.write_text("# freq,level\n30e6,40\n100e6,60\n")
+
+    freq, level = cache.convert_file(
+        FieldStrengthConverter(), path, FSUNIT.DBUV_PER_M, FSUNIT.UV_PER_M
+    )
+    assert freq == pytest.approx([30e6, 100e6])
+    assert level == pytest.approx([100.0, 1000.0])
+
+    cache.convert_file(FieldStrengthConverter(), path, FSUNIT.DBUV_PER_M, FSUNIT.UV_PER_M)
+    assert cache.hits == 1
+
+    path.write_text("# freq,level\n30e6,40\n100e6,80\n")
+    _, level = cache.convert_file(
+        FieldStrengthConverter(), path, FSUNIT.DBUV_PER_M, FSUNIT.UV_PER_M
+    )
+    assert level[1] == pytest.approx(10000.0)
+    assert cache.misses == 2
+
+
+def test_eviction_keeps_size_bounded(tmp_path):
+    cache = ResultCache(tmp_path, max_bytes=3000)
+    for i in range(5):
+        cache.put(f"key{i}", np.zeros(100))  # ~928 bytes per entry
+        os.utime(cache._path(f"key{i}"), (i, i))
+
+    assert cache.size() <= 3000
+    assert cache.get("key0") is None
+    assert cache.get("key4") is not None
+
+
+def test_eviction_and_clear_leave_other_files_alone(tmp_path):
+    own = tmp_path / "my_measurement.npy"
+    np.save(own, np.zeros(1000))
+    cache = ResultCache(tmp_path, max_bytes=2000)
+    cache.put("key", np.zeros(100))
+    cache.clear()
+
+    assert own.exists()
+    assert cache.size() == 0
+
+
+def test_put_rescans_only_over_budget(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path, max_bytes=10_000)
+    cache.put("first", np.zeros(100))
+    scans = []
+    entries = ResultCache._entries
+    monkeypatch.setattr(cache, "_entries", lambda: scans.append(1) or entries(cache))
+
+    for i in range(5):
+        cache.put(f"key{i}", np.zeros(100))
+    cache.put("key0", np.zeros(100))  # replacing an entry does not grow the total
+    assert scans == []
+
+    for i in range(5, 12):
+        cache.put(f"key{i}", np.zeros(100))
+    assert scans and cache.size() <= 10_000
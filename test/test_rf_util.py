@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 import UnitConverter.rf_util as rf_util
 
@@ -5,4 +6,61 @@ import UnitConverter.rf_util as rf_util
                          [(11.4, 0.3, pytest.approx(1.50, rel=1e-2)),
                           (30, 10, pytest.approx(18.66, rel=1e-2)),])
 def test_antenna_eut_distance(beamwidth, eut_height, expected):
-    assert rf_util.antenna_eut_distance(beamwidth, eut_height) == expected
\ No newline at end of file
+    assert rf_util.antenna_eut_distance(beamwidth, eut_height) == expected
+
+
+def test_merge_index_matches_searchsorted():
+    rng = np.random.default_rng(0)
+    freq = np.sort(rng.uniform(0, 100, 500))
+    target = np.sort(rng.uniform(-10, 110, 300))
+    assert np.array_equal(rf_util.merge_index(freq, target),
+                          np.searchsorted(freq, target, side="right"))
+
+
+def test_interpolate_sorted_matches_scalar_interpolate():
+    freq = np.array([30e6, 100e6, 300e6])
+    amp = np.array([10.0, 20.0, 15.0])
+    target = np.array([30e6, 50e6, 100e6, 250e6, 300e6])
+    expected = [rf_util.interpolate(30e6, 10.0, 100e6, 20.0, 30e6),
+                rf_util.interpolate(30e6, 10.0, 100e6, 20.0, 50e6),
+                20.0,
+                rf_util.interpolate(100e6, 20.0, 300e6, 15.0, 250e6),
+                15.0]
+    assert rf_util.interpolate_sorted(freq, amp, target) == pytest.approx(expected)
+
+
+def test_interpolate_sorted_outside_range_is_nan():
+    result = rf_util.interpolate_sorted([1.0, 2.0], [0.0, 1.0], [0.5, 1.5, 2.5])
+    assert np.isnan(result[[0, 2]]).all()
+    assert result[1] == pytest.approx(0.5)
+
+
+def test_limit_convert_matrix_matches_scalar_limit_convert():
+    limits = [30.0, 40.0, 46.5]
+    matrix = rf_util.limit_convert_matrix(limits)
+    distances, slopes = rf_util.COMMON_DISTANCES, rf_util.COMMON_SLOPES
+    assert matrix.shape == (len(slopes), len(limits), len(distances), len(distances))
+    for s, slope in enumerate(slopes):
+        for k, limit in enumerate(limits):
+            for i, d1 in enumerate(distances):
+                for j, d2 in enumerate(distances):
+                    expected = rf_util.limit_convert(d1, d2, limit, slope)
+                    assert matrix[s, k, i, j] == pytest.approx(expected)
+
+
+def test_limit_convert_matrix_is_cached_and_read_only():
+    first = rf_util.limit_convert_matrix([40.0, 50.0], distances=[3, 10], slopes=20)
+    again = rf_util.limit_convert_matrix(np.array([40.0, 50.0]), distances=(3.0, 10.0), slopes=[20])
+    assert again is first
+    with pytest.raises(ValueError):
+        first[0, 0, 0, 0] = 0.0
+
+
+@pytest.mark.parametrize("kwargs, error", [
+    ({"limits": [40.0], "distances": [3.0, 0.0]}, ValueError),
+    ({"limits": ["40"]}, TypeError),
+    ({"limits": [[40.0]]}, TypeError),
+])
+def test_limit_convert_matrix_rejects_bad_input(kwargs, error):
+    with pytest.raises(error):
+        rf_util.limit_convert_matrix(**kwargs)
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter
+from UnitConverter.scan_cube import ScanCube
+
+
+@pytest.fixture
+def cube(tmp_path):
+    rng = np.random.default_rng(5)
+    freq = np.linspace(30e6, 1e9, 1_000)
+    cube = ScanCube.create(
+        tmp_path / "scan.npy", range(0, 360, 45), [1.0, 2.5, 4.0], ["H", "V"], freq
+    )
+    cube.data[:] = rng.normal(30.0, 5.0, cube.shape)
+    cube.flush()
+    return cube
+
+
+@pytest.mark.parametrize("chunk_size", [1 << 20, 2_500, 300])
+def test_peak_matches_full_reduction(cube, chunk_size):
+    peak = ScanCube.open(cube.path).peak(chunk_size=chunk_size)
+
+    flat = np.asarray(cube.data, dtype=np.float64).reshape(-1, cube.shape[3])
+    expected = flat.argmax(axis=0)
+    a, h, p = np.unravel_index(expected, cube.shape[:3])
+    np.testing.assert_array_equal(peak.position, expected)
+    np.testing.assert_array_equal(peak.level, flat.max(axis=0))
+    np.testing.assert_array_equal(peak.azimuth, cube.azimuth[a])
+    np.testing.assert_array_equal(peak.height, cube.height[h])
+    np.testing.assert_array_equal(peak.polarization, cube.polarization[p])
+    np.testing.assert_array_equal(peak.freq, cube.freq)
+
+
+def test_peak_converts_levels_and_skips_nan(tmp_path):
+    cube = ScanCube.create(tmp_path / "scan.npy", [0.0, 90.0], [1.0], ["H", "V"], [1e8, 2e8, 3e8])
+    cube.data[0, 0, 0] = [40.0, np.nan, np.nan]
+    cube.data[1, 0, 1] = [20.0, 60.0, np.nan]
+
+    peak = cube.peak(FSUNIT.UV_PER_M)
+    assert peak.level[:2] == pytest.approx([100.0, 1000.0])
+    assert np.isnan(peak.level[2]) and peak.position[2] == -1
+    assert peak.azimuth[:2].tolist() == [0.0, 90.0]
+    assert peak.polarization.tolist() == ["H", "V", ""]
+
+
+def test_convert_writes_new_cube(tmp_path, cube):
+    converted = cube.convert(tmp_path / "scan_vm.npy", FSUNIT.V_PER_M, dtype=np.float64, chunk_size=700)
+    reopened = ScanCube.open(tmp_path / "scan_vm.npy")
+
+    expected = FieldStrengthConverter().convert_array(cube.data, FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M)
+    np.testing.assert_allclose(reopened.data, expected, rtol=1e-12)
+    assert reopened.unit is FSUNIT.V_PER_M and converted.data.dtype == np.float64
+    assert reopened.polarization.tolist() == ["H", "V"]
+    np.testing.assert_array_equal(reopened.freq, cube.freq)
+
+
+def test_invalid_arguments(tmp_path):
+    with pytest.raises(TypeError):
+        ScanCube.create(tmp_path / "a.npy", [0.0], [1.0], ["H"], [1e6], dtype=np.int16)
+    with pytest.raises(ValueError):
+        ScanCube(np.zeros((2, 1, 1, 3)), [0.0], [1.0], ["H"], [1.0, 2.0, 3.0])
@@ -0,0 +1,119 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+import uuid
+
+import numpy as np
+import pytest
+
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter
+from UnitConverter.shm_ring import SharedTraceRing
+
+
+@pytest.fixture
+def ring():
+    ring = SharedTraceRing.create(
+        f"rfcalc-test-{uuid.uuid4().hex[:8]}", n_slots=4, n_points=8, unit="dBμV/m"
+    )
+    yield ring
+    ring.close()
+    ring.unlink()
+
+
+def test_consumer_sees_published_sweeps(ring):
+    ring.publish([1.0, 2.0, 3.0], sequence=7, timestamp=123.0)
+    consumer = SharedTraceRing.attach(ring.name)
+    try:
+        assert (consumer.n_slots, consumer.n_points, consumer.unit) == (4, 8, "dBμV/m")
+        sweep = consumer.read(consumer.latest)
+        assert (sweep.index, sweep.sequence, sweep.timestamp) == (0, 7, 123.0)
+        assert sweep.levels.tolist() == [1.0, 2.0, 3.0]
+    finally:
+        consumer.close()
+
+
+def test_publish_converts_into_shared_memory(ring):
+    plan = FieldStrengthConverter().plan(FSUNIT.DBUV_PER_M, FSUNIT.DBPT)
+    ring.publish(np.array([60.0, 70.0]), plan=plan)
+    assert ring.read(0).levels == pytest.approx([10.5, 20.5])
+
+
+def test_view_is_zero_copy_and_read_only(ring):
+    ring.publish(np.zeros(8))
+    sweep = ring.view(0)
+    assert np.shares_memory(sweep.levels, ring._data)
+    with pytest.raises(ValueError):
+        sweep.levels[0] = 1.0
+    del sweep
+
+
+def test_slow_reader_detects_overwritten_sweeps(ring):
+    for i in range(6):
+        ring.publish([float(i)])
+    assert ring.latest == 5
+    assert not ring.is_current(1)
+    with pytest.raises(IndexError):
+        ring.read(1)
+    with pytest.raises(IndexError):
+        ring.read(6)
+    assert ring.read(2).levels.tolist() == [2.0]
+
+
+def test_read_into_preallocated_buffer(ring):
+    ring.publish([4.0, 5.0])
+    out = np.empty(8)
+    sweep = ring.read(0, out=out)
+    assert np.shares_memory(sweep.levels, out)
+    assert sweep.levels.tolist() == [4.0, 5.0]
+
+
+def test_invalid_arguments(ring):
+    with pytest.raises(ValueError):
+        ring.publish(np.zeros(9))
+    with pytest.raises(ValueError):
+        SharedTraceRing.create(None, n_slots=0, n_points=8)
+    with pytest.raises(ValueError):
+        SharedTraceRing.create(None, n_slots=1, n_points=8, dtype=np.int32)
+
+
+def _consume(name, n, queue):
+    ring = SharedTraceRing.attach(name)
+    total = 0.0
+    for index in range(n):
+        ring.wait(index, timeout=5.0)
+        total += ring.read(index).levels.sum()
+    ring.close()
+    queue.put(total)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="no resource tracker on Windows")
+def test_consumer_with_own_tracker_leaves_the_block(ring):
+    # An unrelated process with its own resource tracker; stopping the tracker runs its cleanup
+    code = (
+        "import sys\n"
+        "from multiprocessing import resource_tracker\n"
+        "from UnitConverter.shm_ring import SharedTraceRing\n"
+        "SharedTraceRing.attach(sys.argv[1]).close()\n"
+        "resource_tracker._resource_tracker._stop()\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code, ring.name],
+        check=True, capture_output=True, env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    SharedTraceRing.attach(ring.name).close()
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="uses the fork start method")
+def test_consumers_in_other_processes(ring):
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    consumers = [context.Process(target=_consume, args=(ring.name, 3, queue)) for _ in range(2)]
+    for consumer in consumers:
+        consumer.start()
+    for i in range(3):
+        ring.publish(np.full(8, float(i)))
+    results = [queue.get(timeout=10) for _ in consumers]
+    for consumer in consumers:
+        consumer.join(timeout=10)
+    assert results == [24.0, 24.0]
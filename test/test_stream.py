@@ -0,0 +1,204 @@
+import socket
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter
+from UnitConverter.stream import (
+    HEADER,
+    LatencyHistogram,
+    StreamConverter,
+    encode_frame,
+    main,
+    simulate,
+)
+
+N_POINTS = 101
+
+
+@pytest.fixture
+def plan():
+    return FieldStrengthConverter().plan(FSUNIT.DBUV_PER_M, FSUNIT.UV_PER_M)
+
+
+class Collector:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.frames = []
+
+    def __call__(self, sequence, timestamp, levels):
+        time.sleep(self.delay)
+        self.frames.append((sequence, levels.copy()))
+
+
+def _tcp_pair():
+    listener = socket.create_server(("127.0.0.1", 0))
+    address = listener.getsockname()
+    return listener, address
+
+
+def _serve_tcp(stream, frames):
+    listener, address = _tcp_pair()
+
+    def send():
+        with socket.create_connection(address) as conn:
+            for frame in frames:
+                conn.sendall(frame)
+
+    sender = threading.Thread(target=send)
+    sender.start()
+    conn, _ = listener.accept()
+    with conn, stream:
+        stream.run_tcp(conn)
+    sender.join()
+    listener.close()
+
+
+def test_tcp_frames_are_converted_in_order(plan):
+    collector = Collector()
+    stream = StreamConverter(plan, N_POINTS, collector, policy="block")
+    levels = np.linspace(0.0, 60.0, N_POINTS)
+    _serve_tcp(stream, [encode_frame(i, levels + i) for i in range(20)])
+
+    assert [sequence for sequence, _ in collector.frames] == list(range(20))
+    assert collector.frames[3][1] == pytest.approx(10 ** ((levels + 3) / 20), rel=1e-5)
+    assert stream.forwarded == 20 and stream.dropped == 0
+    assert stream.latency.count == 20
+
+
+def test_short_frames_are_accepted(plan):
+    collector = Collector()
+    stream = StreamConverter(plan, N_POINTS, collector, policy="block")
+    _serve_tcp(stream, [encode_frame(0, [20.0, 40.0])])
+    assert collector.frames[0][1] == pytest.approx([10.0, 100.0], rel=1e-6)
+
+
+def test_drop_policy_keeps_the_queue_bounded(plan):
+    collector = Collector(delay=0.01)
+    stream = StreamConverter(plan, N_POINTS, collector, queue_size=2, policy="drop")
+    _serve_tcp(stream, [encode_frame(i, np.zeros(N_POINTS)) for i in range(100)])
+
+    assert stream.received == 100
+    assert stream.dropped > 0
+    assert stream.forwarded + stream.dropped == 100
+    # The newest sweep always gets through
+    assert collector.frames[-1][0] == 99
+
+
+def test_bad_magic_abandons_the_connection(plan):
+    collector = Collector()
+    stream = StreamConverter(plan, N_POINTS, collector, policy="block")
+    bad = b"XXXX" + encode_frame(1, np.zeros(3))[4:]
+    _serve_tcp(stream, [encode_frame(0, np.zeros(3)), bad, encode_frame(2, np.zeros(3))])
+    assert [sequence for sequence, _ in collector.frames] == [0]
+    assert stream.errors == 1
+
+
+def _serve_udp(stream, send):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    reader = threading.Thread(target=stream.run_udp, args=(sock, 0.05))
+    with stream:
+        reader.start()
+        expected = send(sock.getsockname())
+        deadline = time.monotonic() + 2.0
+        while stream.received < expected and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stream.stop()
+        reader.join()
+    sock.close()
+
+
+def test_stop_interrupts_an_idle_tcp_connection(plan):
+    listener, address = _tcp_pair()
+    sender = socket.create_connection(address)
+    conn, _ = listener.accept()
+    stream = StreamConverter(plan, N_POINTS, Collector())
+    stream.start()
+    # Half a header, then nothing
+    sender.sendall(encode_frame(0, np.zeros(3))[:4])
+    reader = threading.Thread(target=stream.run_tcp, args=(conn,), daemon=True)
+    reader.start()
+    time.sleep(0.1)
+    stream.stop()
+    reader.join(timeout=2.0)
+    assert not reader.is_alive()
+    for sock in (sender, conn, listener):
+        sock.close()
+
+
+def test_udp_with_simulator(plan):
+    collector = Collector()
+    stream = StreamConverter(plan, N_POINTS, collector, queue_size=8, policy="block")
+
+    def send(address):
+        simulate(address, n_points=N_POINTS, sweeps=10, rate=200.0, seed=1)
+        return 10
+
+    _serve_udp(stream, send)
+    assert stream.forwarded == 10 and stream.errors == 0
+    # 20 dBμV/m noise floor is about 10 μV/m
+    assert 3.0 < np.median(collector.frames[0][1]) < 30.0
+
+
+def test_malformed_datagrams_are_counted(plan):
+    collector = Collector()
+    stream = StreamConverter(plan, N_POINTS, collector, policy="block")
+
+    def send(address):
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.sendto(b"RFSW", address)
+            # Header announces 5 points but only one follows
+            sock.sendto(HEADER.pack(b"RFSW", 1, 5, 0.0) + bytes(4), address)
+            sock.sendto(encode_frame(2, [0.0]), address)
+        return 3
+
+    _serve_udp(stream, send)
+    assert stream.errors == 2
+    assert [sequence for sequence, _ in collector.frames] == [2]
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram(edges=(0.001, 0.01, 0.1))
+    for seconds in [0.0005] * 90 + [0.005] * 9 + [0.5]:
+        histogram.record(seconds)
+    assert histogram.counts == [90, 9, 0, 1]
+    assert histogram.percentile(50) == 0.001
+    assert histogram.percentile(99) == 0.01
+    assert histogram.percentile(100) == 0.5
+    assert histogram.max == 0.5
+
+
+def test_invalid_arguments(plan):
+    with pytest.raises(ValueError):
+        StreamConverter(plan, 0, Collector())
+    with pytest.raises(ValueError):
+        StreamConverter(plan, N_POINTS, Collector(), policy="latest")
+    with pytest.raises(ValueError):
+        LatencyHistogram(edges=(0.1, 0.01))
+
+
+def test_errors_counted_from_both_threads(plan):
+    stream = StreamConverter(plan, N_POINTS, Collector())
+    threads = [
+        threading.Thread(target=lambda: [stream._count_error() for _ in range(10_000)])
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert stream.errors == 40_000
+
+
+@pytest.mark.parametrize("options, message", [
+    (["--from-unit", "dBuV", "--to-unit", "V_PER_M"], "DBUV_PER_M"),
+    (["--converter", "eirp", "--from-unit", "dbuv_per_m", "--to-unit", "EIRP_dBm"], "--distance"),
+])
+def test_serve_rejects_bad_arguments(capsys, options, message):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["serve", "--forward", "127.0.0.1:9", *options])
+    assert exit_info.value.code == 2
+    assert message in capsys.readouterr().err
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from UnitConverter.correction_table import CorrectionTable
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter
+from UnitConverter.sweep import CISPR_BANDS, Band, FrequencySweep
+
+
+def test_linear_matches_numpy():
+    sweep = FrequencySweep.linear(30e6, 1e9, step=50e3, chunk_size=1000)
+    assert sweep.to_array() == pytest.approx(np.arange(30e6, 1e9 + 1, 50e3), rel=1e-15)
+    assert len(sweep) == 19401
+    n = FrequencySweep.linear(1e6, 2e6, n_points=11, endpoint=False).to_array()
+    assert n == pytest.approx(np.linspace(1e6, 2e6, 11, endpoint=False))
+
+
+def test_chunks_have_fixed_size_across_segments():
+    sweep = FrequencySweep.cispr(stop=1e9, chunk_size=4096)
+    chunks = list(sweep)
+    assert [chunk.size for chunk in chunks[:-1]] == [4096] * (len(chunks) - 1)
+    assert 0 < chunks[-1].size <= 4096
+    assert sum(chunk.size for chunk in chunks) == len(sweep)
+
+
+def test_reuse_yields_one_buffer():
+    sweep = FrequencySweep.linear(0.0, 99.0, step=1.0, chunk_size=10)
+    buffers = {id(chunk) for chunk in sweep.chunks(reuse=True)}
+    assert len(buffers) <= 2  # the full buffer and the view of the short last chunk
+    total = sum(chunk.sum() for chunk in sweep.chunks(reuse=True))
+    assert total == sum(range(100))
+
+
+def test_log_sweep_covers_the_range():
+    sweep = FrequencySweep.log(9e3, 40e9, points_per_decade=50)
+    freq = sweep.to_array()
+    assert freq[0] == 9e3 and freq[-1] == pytest.approx(40e9)
+    ratios = freq[1:] / freq[:-1]
+    assert ratios == pytest.approx(np.full(ratios.size, ratios[0]))
+    assert ratios[0] <= 10 ** (1 / 50)
+
+
+def test_cispr_bands_use_half_rbw_steps_without_duplicate_edges():
+    sweep = FrequencySweep.cispr(start=9e3, stop=40e9)
+    freq = sweep.to_array()
+    assert freq[0] == 9e3 and freq[-1] == 40e9
+    assert np.all(np.diff(freq) > 0)
+    assert np.count_nonzero(freq == 150e3) == 1 and np.count_nonzero(freq == 1e9) == 1
+    for band in CISPR_BANDS.values():
+        inside = freq[(freq >= band.start) & (freq < min(band.stop, 40e9))]
+        assert np.diff(inside) == pytest.approx(np.full(inside.size - 1, band.rbw / 2))
+
+
+def test_partial_band_range_and_rbw_per_point():
+    sweep = FrequencySweep.cispr(start=100e6, stop=420e6, chunk_size=1000)
+    pairs = list(sweep.rbw_chunks())
+    freq = np.concatenate([f for f, _ in pairs])
+    rbw = np.concatenate([r for _, r in pairs])
+    assert freq[0] == 100e6 and freq[-1] == 420e6
+    assert np.all(rbw == 120e3)
+    custom = FrequencySweep.bands([Band("low", 0, 10, 1.0), Band("high", 10, 20, 4.0)])
+    f, r = next(custom.rbw_chunks())
+    assert f[r == 4.0][0] == 10.0 and np.all(f[r == 1.0] < 10)
+
+
+@pytest.mark.parametrize("freq, rbw", [(9e3, 200.0), (150e3, 9e3), (1e6, 9e3), (1e9, 1e6)])
+def test_zero_width_sweep_is_one_point(freq, rbw):
+    sweep = FrequencySweep.cispr(start=freq, stop=freq)
+    f, r = next(sweep.rbw_chunks())
+    assert f.tolist() == [freq] and r.tolist() == [rbw]
+
+
+def test_chunks_feed_tables_and_converters():
+    sweep = FrequencySweep.rbw(30e6, 1e9, rbw=120e3, chunk_size=5000)
+    table = CorrectionTable([30e6, 1e9], [10.0, 20.0])
+    plan = FieldStrengthConverter().plan(FSUNIT.DBUV_PER_M, FSUNIT.DBUA_PER_M)
+    for freq in sweep.chunks(reuse=True):
+        level = plan(table(freq))
+        assert level == pytest.approx(10.0 + 10.0 * (freq - 30e6) / 970e6 - 51.5)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"start": 1.0, "stop": 2.0},
+        {"start": 1.0, "stop": 2.0, "step": 0.1, "n_points": 3},
+        {"start": 2.0, "stop": 1.0, "step": 0.1},
+        {"start": 1.0, "stop": 2.0, "step": -0.1},
+    ],
+)
+def test_linear_rejects_bad_arguments(kwargs):
+    with pytest.raises(ValueError):
+        FrequencySweep.linear(**kwargs)
+
+
+def test_log_rejects_non_positive_start():
+    with pytest.raises(ValueError):
+        FrequencySweep.log(0.0, 1e9, n_points=10)
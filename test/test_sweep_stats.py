@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from UnitConverter.rf_converter import FSUNIT
+from UnitConverter.sweep_stats import SweepStatistics
+
+SWEEPS = np.array([
+    [40.0, 60.0, 20.0],
+    [60.0, 40.0, 20.0],
+    [50.0, 50.0, 20.0],
+])
+
+
+@pytest.fixture
+def stats():
+    s = SweepStatistics(3, apd_bins=[30.0, 45.0, 55.0])
+    for sweep in SWEEPS:
+        s.update(sweep)
+    return s
+
+
+def test_holds_and_averages(stats):
+    assert stats.count == 3
+    assert stats.max_hold == pytest.approx([60.0, 60.0, 20.0])
+    assert stats.min_hold == pytest.approx([40.0, 40.0, 20.0])
+    assert stats.log_average == pytest.approx([50.0, 50.0, 20.0])
+
+    linear = (100.0 + 1000.0 + 10 ** 2.5) / 3
+    assert stats.linear_average == pytest.approx([20 * np.log10(linear)] * 2 + [20.0])
+
+
+def test_non_finite_levels_are_skipped_by_every_result():
+    stats = SweepStatistics(3, apd_bins=[30.0, 45.0])
+    stats.update([40.0, np.nan, np.nan])
+    stats.update([np.nan, 30.0, np.inf])
+    stats.update([50.0, 20.0, np.nan])
+    assert stats.valid.tolist() == [2, 2, 0]
+    assert stats.max_hold[:2] == pytest.approx([50.0, 30.0])
+    assert stats.min_hold[:2] == pytest.approx([40.0, 20.0])
+    assert stats.log_average[:2] == pytest.approx([45.0, 25.0])
+    linear = (10 ** 1.5 + 10.0) / 2
+    assert stats.linear_average[1] == pytest.approx(20 * np.log10(linear))
+    assert stats.apd()[:2] == pytest.approx(np.array([[1.0, 0.5], [0.5, 0.0]]))
+    # Never measured
+    assert np.isnan(stats.max_hold[2]) and np.isnan(stats.min_hold[2])
+    assert np.isnan(stats.log_average[2]) and np.isnan(stats.linear_average[2])
+    assert np.isnan(stats.apd()[2]).all()
+
+
+def test_apd_is_exceedance_probability(stats):
+    apd = stats.apd()
+    assert apd.shape == (3, 3)
+    assert apd[0] == pytest.approx([1.0, 2 / 3, 1 / 3])
+    assert apd[2] == pytest.approx([0.0, 0.0, 0.0])
+
+
+def test_sweeps_in_other_units_are_converted():
+    stats = SweepStatistics(2, unit=FSUNIT.UV_PER_M)
+    stats.update([100.0, 1000.0])
+    assert stats.max_hold == pytest.approx([40.0, 60.0])
+
+
+def test_memory_does_not_grow_with_sweeps():
+    stats = SweepStatistics(1000, apd_bins=np.arange(0, 100, 1.0))
+    buffers = [stats._max, stats._linear_sum, stats._hist]
+    for _ in range(50):
+        stats.update(np.random.default_rng(1).uniform(0, 100, 1000))
+    assert all(a is b for a, b in zip(buffers, [stats._max, stats._linear_sum, stats._hist]))
+
+
+def test_wrong_sweep_length():
+    with pytest.raises(ValueError):
+        SweepStatistics(3).update([1.0, 2.0])
+
+
+def test_apd_requires_bins():
+    stats = SweepStatistics(1)
+    stats.update([1.0])
+    with pytest.raises(ValueError):
+        stats.apd()
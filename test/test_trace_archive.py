@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from UnitConverter.eirp_converter import EIRP
+from UnitConverter.rf_converter import FSUNIT
+from UnitConverter.trace_archive import ArchiveReader, ArchiveWriter, dequantize, quantize
+
+
+@pytest.fixture
+def trace():
+    rng = np.random.default_rng(3)
+    freq = np.linspace(30e6, 1e9, 200_001)
+    level = 25.0 + 8.0 * np.sin(freq / 4e7) + rng.normal(0.0, 1.0, freq.size)
+    return freq, level
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_round_trip_within_resolution_and_compressed(tmp_path, trace, codec):
+    freq, level = trace
+    path = tmp_path / "scan.rfta"
+    with ArchiveWriter(path, codec=codec, resolution=0.01, chunk_points=50_000) as archive:
+        archive.add("scan", freq, level, FSUNIT.DBUV_PER_M, {"distance": 3.0, "slope": 20.0})
+
+    with ArchiveReader(path) as archive:
+        info = archive.traces["scan"]
+        restored_freq, restored_level = archive.read("scan")
+    assert info.unit is FSUNIT.DBUV_PER_M
+    assert info.context == {"distance": 3.0, "slope": 20.0}
+    assert info.n_points == freq.size and len(info.chunks) == 5
+    assert np.abs(restored_freq - freq).max() <= 0.5e-3
+    assert np.abs(restored_level - level).max() <= 0.005 + 1e-9
+    assert path.stat().st_size * 5 < freq.nbytes + level.nbytes
+
+
+def test_single_chunks_decode_independently(tmp_path, trace):
+    freq, level = trace
+    path = tmp_path / "scan.rfta"
+    with ArchiveWriter(path, chunk_points=30_000) as archive:
+        archive.add("a", freq, level)
+        archive.add("b", freq[:10], level[:10], EIRP.EIRP_dBm)
+
+    with ArchiveReader(path) as archive:
+        chunk_freq, chunk_level = archive.read_chunk("a", 3)
+        assert chunk_freq == pytest.approx(freq[90_000:120_000], abs=1e-3)
+        assert chunk_level == pytest.approx(level[90_000:120_000], abs=0.005 + 1e-9)
+        sizes = [f.size for f, _ in archive.chunks("a")]
+        assert sizes == [30_000] * 6 + [20_001]
+        assert list(archive.traces) == ["a", "b"]
+        assert archive.traces["b"].unit is EIRP.EIRP_dBm
+        with pytest.raises(IndexError):
+            archive.read_chunk("b", 1)
+
+
+def test_non_finite_levels_and_irregular_grids_survive(tmp_path):
+    freq = np.array([9e3, 9.2e3, 150e3, 30e6, 30.000001e6, 1e9])
+    level = np.array([np.nan, -np.inf, 10.0, np.inf, -3.004, 0.0])
+    path = tmp_path / "odd.rfta"
+    with ArchiveWriter(path) as archive:
+        archive.add("odd", freq, level, "custom unit")
+    with ArchiveReader(path) as archive:
+        restored_freq, restored_level = archive.read("odd")
+        assert archive.traces["odd"].unit == "custom unit"
+    assert restored_freq == pytest.approx(freq, abs=1e-3)
+    assert np.isnan(restored_level[0])
+    assert restored_level[1:4].tolist() == [-np.inf, 10.0, np.inf]
+    assert restored_level[4] == pytest.approx(-3.0)
+
+
+def test_quantize_rejects_out_of_range_levels():
+    codes = quantize(np.array([1.234, -1.236]), 0.01)
+    assert codes.tolist() == [123, -124]
+    assert dequantize(codes, 0.01) == pytest.approx([1.23, -1.24])
+    with pytest.raises(ValueError):
+        quantize(np.array([1e8]), 0.01)
+
+
+def test_invalid_archives_and_arguments(tmp_path, trace):
+    freq, level = trace
+    with pytest.raises(ValueError):
+        ArchiveWriter(tmp_path / "x.rfta", codec="bz2")
+    with ArchiveWriter(tmp_path / "dup.rfta") as archive:
+        archive.add("a", freq[:5], level[:5])
+        with pytest.raises(ValueError):
+            archive.add("a", freq[:5], level[:5])
+        with pytest.raises(ValueError):
+            archive.add("b", freq[:5], level[:4])
+
+    unclosed = tmp_path / "unclosed.rfta"
+    ArchiveWriter(unclosed).add("a", freq[:5], level[:5])
+    not_archive = tmp_path / "trace.csv"
+    not_archive.write_text("1,2\n" * 10)
+    for path in (unclosed, not_archive):
+        with pytest.raises(ValueError):
+            ArchiveReader(path)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from UnitConverter.trace_merge import TraceMerger, merge_traces
+
+GRID = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+
+
+def test_band_split_traces_fill_their_part_of_the_grid():
+    low = (np.array([0.5, 2.5]), np.array([10.0, 30.0]))
+    high = (np.array([3.0, 4.5]), np.array([50.0, 20.0]))
+    result = merge_traces([low, high], GRID, mode="max")
+    assert result[:4] == pytest.approx([15.0, 25.0, 50.0, 30.0])
+    assert np.isnan(result[4])
+
+
+def test_max_and_min_hold():
+    traces = [(GRID, np.array([1.0, 5.0, 3.0, 0.0, 2.0])),
+              (GRID, np.array([4.0, 2.0, 3.0, 1.0, 0.0]))]
+    assert merge_traces(traces, GRID, "max") == pytest.approx([4.0, 5.0, 3.0, 1.0, 2.0])
+    assert merge_traces(traces, GRID, "min") == pytest.approx([1.0, 2.0, 3.0, 0.0, 0.0])
+
+
+def test_average_counts_only_covering_traces():
+    merger = TraceMerger(GRID, mode="average")
+    merger.add(GRID, np.full(5, 10.0))
+    merger.add(np.array([1.0, 2.0]), np.array([20.0, 20.0]))
+    assert merger.result() == pytest.approx([15.0, 15.0, 10.0, 10.0, 10.0])
+    assert merger.count.tolist() == [2, 2, 1, 1, 1]
+
+
+def test_empty_trace_is_ignored():
+    merger = TraceMerger(GRID, mode="max")
+    merger.add([], [])
+    merger.add(GRID, np.full(5, 10.0))
+    assert merger.result() == pytest.approx([10.0] * 5)
+    assert merger.count.tolist() == [1] * 5
+
+
+def test_single_point_trace_covers_only_its_grid_point():
+    merger = TraceMerger(GRID, mode="average")
+    merger.add([3.0], [7.0])
+    merger.add([3.5], [9.0])
+    assert merger.count.tolist() == [0, 0, 1, 0, 0]
+    assert merger.result()[2] == pytest.approx(7.0)
+
+
+def test_resample_onto_finer_grid():
+    grid = np.linspace(0.0, 10.0, 101)
+    result = merge_traces([(np.array([0.0, 10.0]), np.array([0.0, 100.0]))], grid)
+    assert result == pytest.approx(grid * 10)
+
+
+def test_invalid_mode():
+    with pytest.raises(ValueError):
+        TraceMerger(GRID, mode="median")
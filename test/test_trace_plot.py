@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from View.trace_plot_frame import MinMaxPyramid
+
+N = 1_000_003
+
+
+@pytest.fixture(scope="module")
+def spiky():
+    x = np.arange(N, dtype=np.float64)
+    y = np.zeros(N)
+    y[123_457] = 50.0
+    y[987_655] = -20.0
+    return MinMaxPyramid(x, y)
+
+
+def test_decimation_is_bounded_by_pixel_width(spiky):
+    x, y_min, y_max = spiky.decimate(0, N, 500)
+    assert len(x) <= 501
+    assert len(x) == len(y_min) == len(y_max)
+
+
+def test_single_sample_peaks_survive(spiky):
+    _, y_min, y_max = spiky.decimate(0, N, 500)
+    assert y_max.max() == 50.0
+    assert y_min.min() == -20.0
+
+    _, y_min, y_max = spiky.decimate(100_000, 200_000, 300)
+    assert y_max.max() == 50.0
+    assert y_min.min() == 0.0
+
+
+def test_zoomed_in_returns_raw_samples(spiky):
+    x, y_min, y_max = spiky.decimate(123_450, 123_460, 400)
+    assert x[0] == 123_449 and x[-1] == 123_461
+    assert y_min is y_max
+    assert y_max[x == 123_457] == 50.0
+
+
+def test_columns_match_brute_force():
+    rng = np.random.default_rng(3)
+    y = rng.normal(size=10_000)
+    pyramid = MinMaxPyramid(np.arange(y.size, dtype=float), y)
+    x, y_min, y_max = pyramid.decimate(0, y.size, 100)
+
+    starts = x.astype(int)
+    ends = np.append(starts[1:], y.size)
+    assert y_min == pytest.approx([y[a:b].min() for a, b in zip(starts, ends)])
+    assert y_max == pytest.approx([y[a:b].max() for a, b in zip(starts, ends)])
+
+
+def test_nan_gaps_do_not_hide_data():
+    y = np.array([1.0, np.nan, 3.0, np.nan] * 1000)
+    pyramid = MinMaxPyramid(np.arange(y.size, dtype=float), y)
+    _, y_min, y_max = pyramid.decimate(0, y.size, 10)
+    assert np.isfinite(y_min).all() and y_max.max() == 3.0
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from UnitConverter.base_converter import INVALID_REASONS
+from UnitConverter.eirp_converter import EIRP, EIRPConverter
+from UnitConverter.rf_converter import FSUNIT, FieldStrengthConverter
+
+fs = FieldStrengthConverter()
+
+
+def test_all_valid_matches_convert_array():
+    values = np.linspace(1.0, 1e4, 1001)
+    result = fs.convert_validated(values, FSUNIT.UV_PER_M, FSUNIT.DBUV_PER_M)
+    np.testing.assert_array_equal(
+        result.values, fs.convert_array(values, FSUNIT.UV_PER_M, FSUNIT.DBUV_PER_M)
+    )
+    assert result.valid.all()
+    assert result.counts == dict.fromkeys(INVALID_REASONS, 0)
+
+
+def test_reasons_counted_without_raising():
+    values = np.array([1000.0, 0.0, -5.0, np.nan, np.inf, -np.inf, 1e6], dtype=object)
+    values[6] = "12 dB"
+    result = fs.convert_validated(values, FSUNIT.UV_PER_M, FSUNIT.DBUV_PER_M)
+
+    assert result.values[0] == pytest.approx(60.0)
+    assert np.isnan(result.values[1:]).all()
+    assert result.valid.tolist() == [True] + [False] * 6
+    assert result.counts == {"non_numeric": 1, "nan": 1, "inf": 2, "out_of_range": 2}
+
+
+def test_infinite_input_with_finite_result_is_valid():
+    result = fs.convert_validated([-np.inf, 20.0], FSUNIT.DBUV_PER_M, FSUNIT.UV_PER_M)
+    assert result.valid.all() and result.values.tolist() == [0.0, 10.0]
+
+
+def test_overflow_counted_as_out_of_range():
+    result = fs.convert_validated([1e6, 100.0], FSUNIT.DBUV_PER_M, FSUNIT.V_PER_M)
+    assert result.valid.tolist() == [False, True]
+    assert result.counts["out_of_range"] == 1
+
+
+def test_in_place_and_float32():
+    values = np.array([100.0, -1.0, np.nan, 1e3], dtype=np.float32)
+    result = fs.plan(FSUNIT.UV_PER_M, FSUNIT.DBUV_PER_M).validated(values, out=values)
+    assert result.values is values and values.dtype == np.float32
+    assert values[[0, 3]] == pytest.approx([40.0, 60.0])
+    assert result.counts == {"non_numeric": 0, "nan": 1, "inf": 0, "out_of_range": 1}
+
+
+def test_per_point_kwargs_and_strings():
+    conv = EIRPConverter()
+    result = conv.convert_validated(
+        [30.0, 30.0], EIRP.EIRP_dBm, EIRP.dbuv_per_m, distance=3.0, slope=np.array([20.0, np.nan])
+    )
+    assert result.valid.tolist() == [True, False]
+    assert result.counts["out_of_range"] == 1
+
+    text = fs.convert_validated(np.array(["1", "2"]), FSUNIT.UV_PER_M, FSUNIT.DBUV_PER_M)
+    assert not text.valid.any() and text.counts["non_numeric"] == 2
+
+
+def test_out_shape_still_raises():
+    with pytest.raises(ValueError):
+        fs.convert_validated([1.0, 2.0], FSUNIT.UV_PER_M, FSUNIT.DBUV_PER_M, out=np.empty(3))
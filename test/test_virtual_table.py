@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from View.virtual_table_frame import RowWindow, format_value
+
+
+@pytest.mark.parametrize("value, text", [(42.0, "42"), (0.125, "0.125"), (np.nan, "...")])
+def test_format_value(value, text):
+    assert format_value(value) == text
+
+
+def test_row_window_clamps_scrolling():
+    window = RowWindow(n_rows=1000, visible=10)
+    window.scroll_by(-5)
+    assert window.first == 0
+    window.scroll_to(1.0)
+    assert (window.first, window.last) == (990, 1000)
+    assert window.fractions() == (0.99, 1.0)
+
+
+def test_row_window_resize_keeps_window_inside_table():
+    window = RowWindow(n_rows=100, visible=10)
+    window.scroll_to(0.95)
+    window.resize(visible=20)
+    assert (window.first, window.last) == (80, 100)
+    window.resize(n_rows=5)
+    assert (window.first, window.last) == (0, 5)
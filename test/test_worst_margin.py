@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from UnitConverter.rf_converter import FSUNIT
+from UnitConverter.rf_util import limit_convert
+from UnitConverter.worst_margin import WorstMarginSelector
+
+
+def test_matches_full_sort_across_traces():
+    rng = np.random.default_rng(0)
+    freq = np.linspace(30e6, 1e9, 5_000)
+    selector = WorstMarginSelector(n=25)
+    margins, origins = [], []
+    for k in range(12):
+        level = rng.normal(20.0, 6.0, freq.size)
+        selector.update(freq, level, 40.0, source=f"scan{k}.csv")
+        margins.append(40.0 - level)
+        origins += [(f"scan{k}.csv", i) for i in range(freq.size)]
+
+    everything = np.concatenate(margins)
+    order = np.argsort(everything, kind="stable")[:25]
+    result = selector.results()
+    assert [e.margin for e in result] == pytest.approx(everything[order])
+    assert [(e.source, e.index) for e in result] == [origins[i] for i in order]
+    assert selector.traces == 12
+
+
+def test_limit_rescaled_with_limit_convert_and_context_kept():
+    freq = np.array([30e6, 100e6, 200e6, 300e6])
+    level = np.array([30.0, 45.0, 36.0, 20.0])
+    selector = WorstMarginSelector(n=2)
+    selector.update(
+        freq, level, lambda f: np.full(f.shape, 30.0), source="rx.csv",
+        unit=FSUNIT.DBUV_PER_M, context={"distance": 3.0},
+        limit_distance=10.0, distance=3.0, slope=20.0,
+    )
+    limit = 30.0 + limit_convert(10.0, 3.0, 0.0, 20.0)
+    worst, second = selector.results()
+    assert worst.freq == 100e6 and worst.index == 1
+    assert worst.limit == pytest.approx(limit)
+    assert worst.margin == pytest.approx(limit - 45.0)
+    assert second.freq == 200e6
+    assert worst.unit is FSUNIT.DBUV_PER_M and worst.context == {"distance": 3.0}
+
+
+def test_numpy_scalar_distances():
+    selector = WorstMarginSelector(n=1)
+    selector.update(
+        [1.0], [20.0], 30.0, limit_distance=np.int64(10), distance=np.float32(3.0), slope=np.int64(20)
+    )
+    assert selector.results()[0].limit == pytest.approx(30.0 + limit_convert(10.0, 3.0, 0.0, 20.0))
+
+
+def test_peaks_only_keeps_one_point_per_emission():
+    freq = np.arange(11.0)
+    level = np.array([0, 5, 9, 10, 9, 5, 0, 3, 6, 3, 0], dtype=float)
+    points = WorstMarginSelector(n=2)
+    points.update(freq, level, 12.0)
+    peaks = WorstMarginSelector(n=2, peaks=True)
+    peaks.update(freq, level, 12.0)
+    assert [e.index for e in points.results()] == [3, 2]
+    assert [e.index for e in peaks.results()] == [3, 8]
+
+
+def test_nan_levels_are_ignored_and_bounded():
+    selector = WorstMarginSelector(n=3)
+    selector.update([1.0, 2.0, 3.0], [np.nan, 10.0, np.nan], 20.0)
+    assert [e.freq for e in selector.results()] == [2.0]
+    assert selector.threshold == np.inf
+    selector.update(np.arange(100.0), np.arange(100.0), 20.0)
+    assert len(selector.results()) == 3
+    assert selector.threshold == pytest.approx(-77.0)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        WorstMarginSelector(n=0)
+    selector = WorstMarginSelector()
+    with pytest.raises(ValueError):
+        selector.update([1.0, 2.0], [1.0], 10.0)
+    with pytest.raises(ValueError):
+        selector.update([1.0], [1.0], 10.0, limit_distance=10.0)